@@ -0,0 +1,16 @@
+"""
+Benchmarks for ctapipe using airspeed velocity (asv).
+
+Run e.g. ``asv continuous main HEAD`` to compare the current state
+against the main branch.
+
+``asv run`` stores the results per commit and machine in ``.asv/results``,
+so regressions between versions can be found with ``asv compare <old> <new>``
+or browsed with ``asv publish`` and ``asv preview``.
+
+The calibration and image extraction benchmarks use the camera descriptions
+of LSTCam, FlashCam, NectarCam and CHEC, which are downloaded from the data
+server on first use. These are the cameras with a readout description
+(number of pixels, samples and gain channels) on the data server,
+the other cameras only provide a geometry.
+"""
@@ -0,0 +1,90 @@
+"""Benchmarks for the camera calibration"""
+import numpy as np
+
+from ctapipe.calib.camera.calibrator import CameraCalibrator, shift_waveforms
+from ctapipe.calib.camera.gainselection import ThresholdGainSelector
+from ctapipe.containers import ArrayEventContainer
+
+from .waveforms import CAMERA_NAMES, make_subarray, make_waveforms
+
+
+class CameraCalibration:
+    """R1 to DL1 calibration of one telescope event with the default extractor"""
+
+    params = [CAMERA_NAMES, [False, True], [False, True]]
+    param_names = ["camera", "apply_waveform_time_shift", "float32_waveforms"]
+
+    def setup(self, camera, apply_waveform_time_shift, float32_waveforms):
+        subarray = make_subarray(camera)
+        readout = subarray.tel[1].camera.readout
+        rng = np.random.default_rng(0)
+
+        self.event = ArrayEventContainer()
+        r1 = self.event.r1.tel[1]
+        r1.waveform = make_waveforms(readout, rng)[0, 0].astype(np.float32)
+        r1.selected_gain_channel = np.zeros(readout.n_pixels, dtype=np.int8)
+        dl1_calib = self.event.calibration.tel[1].dl1
+        dl1_calib.time_shift = rng.normal(0, 2, readout.n_pixels)
+        dl1_calib.pedestal_offset = rng.normal(0, 0.1, readout.n_pixels)
+
+        self.calibrator = CameraCalibrator(
+            subarray=subarray,
+            apply_waveform_time_shift=apply_waveform_time_shift,
+            float32_waveforms=float32_waveforms,
+        )
+        # compile and fill the caches outside of the timing
+        self.calibrator(self.event)
+
+    def time_calibrate(self, camera, apply_waveform_time_shift, float32_waveforms):
+        self.calibrator(self.event)
+
+
+class ShiftWaveforms:
+    """Waveform time shift of one telescope event"""
+
+    params = [CAMERA_NAMES, [False, True]]
+    param_names = ["camera", "interpolate"]
+
+    def setup(self, camera, interpolate):
+        readout = make_subarray(camera).tel[1].camera.readout
+        rng = np.random.default_rng(0)
+        self.waveforms = make_waveforms(readout, rng)[0, 0]
+        self.shift_samples = rng.normal(0, 2, readout.n_pixels)
+        self.out = np.empty_like(self.waveforms)
+        # compile outside of the timing
+        self.time_shift_waveforms(camera, interpolate)
+
+    def time_shift_waveforms(self, camera, interpolate):
+        shift_waveforms(
+            self.waveforms,
+            self.shift_samples,
+            out=self.out,
+            interpolate=interpolate,
+        )
+
+
+class GainSelection:
+    """Threshold gain selection of cameras with two gain channels"""
+
+    params = [CAMERA_NAMES]
+    param_names = ["camera"]
+
+    def setup(self, camera):
+        readout = make_subarray(camera).tel[1].camera.readout
+        if readout.n_channels < 2:
+            raise NotImplementedError(f"{camera} has a single gain channel")
+
+        rng = np.random.default_rng(0)
+        self.waveforms = make_waveforms(readout, rng, n_events=10, n_channels=2)
+        # switch to low gain for about half of the pixels
+        threshold = np.median(self.waveforms[:, 0].max(axis=-1))
+        self.gain_selector = ThresholdGainSelector(threshold=threshold)
+        # compile outside of the timing
+        self.time_select_batch(camera)
+
+    def time_select_channel(self, camera):
+        for waveforms in self.waveforms:
+            self.gain_selector(waveforms)
+
+    def time_select_batch(self, camera):
+        self.gain_selector.select_batch(self.waveforms)
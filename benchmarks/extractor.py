@@ -0,0 +1,65 @@
+"""Benchmarks for the image extraction"""
+import numpy as np
+
+from ctapipe.image.extractor import ImageExtractor
+
+from .waveforms import CAMERA_NAMES, make_subarray, make_waveforms
+
+EXTRACTOR_NAMES = sorted(ImageExtractor.non_abstract_subclasses())
+
+
+class ImageExtraction:
+    """Extraction of the image of one event for each camera and extractor"""
+
+    params = [CAMERA_NAMES, EXTRACTOR_NAMES]
+    param_names = ["camera", "extractor"]
+
+    def setup(self, camera, extractor):
+        subarray = make_subarray(camera)
+        readout = subarray.tel[1].camera.readout
+        rng = np.random.default_rng(0)
+        self.waveforms = make_waveforms(readout, rng)[0, 0]
+        self.selected_gain_channel = np.zeros(readout.n_pixels, dtype=np.int8)
+        self.broken_pixels = np.zeros(readout.n_pixels, dtype=bool)
+        self.extractor = ImageExtractor.from_name(extractor, subarray=subarray)
+        # compile and fill the caches outside of the timing
+        self.time_extract(camera, extractor)
+
+    def time_extract(self, camera, extractor):
+        self.extractor(
+            self.waveforms,
+            tel_id=1,
+            selected_gain_channel=self.selected_gain_channel,
+            broken_pixels=self.broken_pixels,
+        )
+
+
+class ImageExtractionBatch:
+    """Extraction of the images of 10 events in one call"""
+
+    params = [CAMERA_NAMES, EXTRACTOR_NAMES]
+    param_names = ["camera", "extractor"]
+
+    def setup(self, camera, extractor):
+        subarray = make_subarray(camera)
+        self.extractor = ImageExtractor.from_name(extractor, subarray=subarray)
+        if not self.extractor.supports_batches:
+            raise NotImplementedError(f"{extractor} does not support batches")
+
+        readout = subarray.tel[1].camera.readout
+        rng = np.random.default_rng(0)
+        n_events = 10
+        self.waveforms = make_waveforms(readout, rng, n_events=n_events)[:, 0]
+        shape = (n_events, readout.n_pixels)
+        self.selected_gain_channel = np.zeros(shape, dtype=np.int8)
+        self.broken_pixels = np.zeros(shape, dtype=bool)
+        # compile and fill the caches outside of the timing
+        self.time_extract(camera, extractor)
+
+    def time_extract(self, camera, extractor):
+        self.extractor(
+            self.waveforms,
+            tel_id=1,
+            selected_gain_channel=self.selected_gain_channel,
+            broken_pixels=self.broken_pixels,
+        )
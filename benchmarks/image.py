@@ -0,0 +1,35 @@
+"""Benchmarks for the image parameterization"""
+import astropy.units as u
+import numpy as np
+
+from ctapipe.image import hillas_parameters, toymodel
+from ctapipe.instrument import CameraGeometry
+
+
+class HillasParameters:
+    """Hillas parameters of cleaned images of different size"""
+
+    params = [30, 100, 200]
+    param_names = ["n_pixels"]
+
+    def setup(self, n_pixels):
+        geom = CameraGeometry.make_rectangular(npix_x=40, npix_y=40)
+        model = toymodel.Gaussian(
+            x=0.1 * u.m, y=-0.1 * u.m, width=0.05 * u.m, length=0.15 * u.m, psi="30d"
+        )
+        rng = np.random.default_rng(0)
+        image, _, _ = model.generate_image(
+            geom, intensity=2000, nsb_level_pe=3, rng=rng
+        )
+
+        # select the brightest pixels, as a cleaning would do
+        mask = np.zeros(geom.n_pixels, dtype=bool)
+        mask[np.argsort(image)[-n_pixels:]] = True
+
+        self.geom = geom[mask]
+        self.image = image[mask]
+        # compile outside of the timing
+        hillas_parameters(self.geom, self.image)
+
+    def time_hillas_parameters(self, n_pixels):
+        hillas_parameters(self.geom, self.image)
@@ -0,0 +1,81 @@
+"""
+Synthetic camera data for the calibration and image extraction benchmarks.
+
+The benchmarks cover the cameras for which
+`~ctapipe.instrument.CameraReadout.from_name` can load a readout description,
+see `CAMERA_NAMES`.
+"""
+import astropy.units as u
+import numpy as np
+
+from ctapipe.image.toymodel import WaveformModel
+from ctapipe.instrument import (
+    CameraDescription,
+    OpticsDescription,
+    SubarrayDescription,
+    TelescopeDescription,
+)
+from ctapipe.instrument.optics import ReflectorShape, SizeType
+
+#: cameras with a readout description on the data server, benchmarks use
+#: the number of pixels and samples of their readout. The other cameras
+#: (e.g. ASTRICam, DigiCam, SCTCam) only have a geometry there, so
+#: `~ctapipe.instrument.CameraReadout.from_name` cannot load them,
+#: see also ``test_camera_from_name`` in ``ctapipe/instrument/camera/tests``.
+CAMERA_NAMES = ["LSTCam", "FlashCam", "NectarCam", "CHEC"]
+
+
+def make_subarray(camera_name):
+    """Subarray with a single telescope (tel_id 1) with the given camera"""
+    camera = CameraDescription.from_name(camera_name)
+    # the optics are not used in the calibration
+    optics = OpticsDescription(
+        name="benchmark",
+        size_type=SizeType.MST,
+        n_mirrors=1,
+        equivalent_focal_length=16 * u.m,
+        effective_focal_length=16 * u.m,
+        mirror_area=100 * u.m**2,
+        n_mirror_tiles=1,
+        reflector_shape=ReflectorShape.PARABOLIC,
+    )
+    telescope = TelescopeDescription(camera_name, optics=optics, camera=camera)
+    return SubarrayDescription(
+        "benchmark",
+        tel_positions={1: [0, 0, 0] * u.m},
+        tel_descriptions={1: telescope},
+    )
+
+
+def make_waveforms(readout, rng, n_events=1, n_channels=1):
+    """
+    Waveforms with a pulse in each pixel generated with
+    `~ctapipe.image.toymodel.WaveformModel` plus gaussian noise,
+    in units of photo electrons.
+
+    The second gain channel, if requested, has a 20 times lower amplitude.
+
+    Returns
+    -------
+    waveforms : np.ndarray
+        Shape (n_events, n_channels, n_pixels, n_samples)
+    """
+    n_pixels = readout.n_pixels
+    n_samples = readout.n_samples
+    sample_width = (1 / readout.sampling_rate).to_value(u.ns)
+
+    waveforms = np.empty((n_events, n_channels, n_pixels, n_samples))
+    for event in range(n_events):
+        charge = rng.exponential(20, n_pixels)
+        time = rng.uniform(0.3, 0.6, n_pixels) * n_samples * sample_width
+        for channel in range(n_channels):
+            model = WaveformModel.from_camera_readout(
+                readout, gain_channel=min(channel, readout.n_channels - 1)
+            )
+            # get_waveform modifies the charge of pulses outside the readout
+            waveforms[event, channel] = (
+                model.get_waveform(charge.copy(), time, n_samples) / 20**channel
+            )
+
+    waveforms += rng.normal(0, 0.5, waveforms.shape)
+    return waveforms
@@ -4,14 +4,16 @@ calibration and image extraction, as well as supporting algorithms.
 """
 
 import warnings
+from collections import defaultdict
 
 import astropy.units as u
 import numpy as np
-from numba import float32, float64, guvectorize, int64
+from numba import njit
 
 from ctapipe.containers import DL1CameraContainer
 from ctapipe.core import TelescopeComponent
 from ctapipe.core.traits import (
+    Bool,
     BoolTelescopeParameter,
     ComponentName,
     TelescopeParameter,
@@ -89,6 +91,38 @@ class CameraCalibrator(TelescopeComponent):
         ),
     ).tag(config=True)
 
+    interpolate_waveform_time_shift = BoolTelescopeParameter(
+        default_value=False,
+        help=(
+            "Only used if `apply_waveform_time_shift` is True."
+            " Shift the waveforms by the full time shift relative to the camera mean,"
+            " using linear interpolation between samples, instead of by the"
+            " integer part only. The remaining shift applied to the peak time"
+            " is then the mean shift of the camera."
+        ),
+    ).tag(config=True)
+
+    batch_telescopes = Bool(
+        default_value=True,
+        help=(
+            "Extract the images of all telescopes of an event with the same camera"
+            " and extractor configuration in one call of the ImageExtractor."
+            " Only used for ImageExtractors supporting this."
+        ),
+    ).tag(config=True)
+
+    float32_waveforms = Bool(
+        default_value=False,
+        help=(
+            "Subtract the pedestal offset and apply the waveform time shift"
+            " in float32, writing into a buffer reused for each telescope,"
+            " instead of creating float64 copies of the waveforms."
+            " The image extraction then also runs on float32 waveforms."
+            " Results agree with the default float64 computation"
+            " up to float32 precision."
+        ),
+    ).tag(config=True)
+
     def __init__(
         self,
         subarray,
@@ -125,6 +159,8 @@ class CameraCalibrator(TelescopeComponent):
 
         self._r1_empty_warn = False
         self._dl0_empty_warn = False
+        # scratch buffers for the prepared waveforms, see ``_waveform_buffer``
+        self._waveform_buffers = {}
 
         self.image_extractors = {}
 
@@ -192,10 +228,31 @@ class CameraCalibrator(TelescopeComponent):
         event.dl0.tel[tel_id].waveform = waveforms_copy
         event.dl0.tel[tel_id].selected_gain_channel = selected_gain_channel
 
-    def _calibrate_dl1(self, event, tel_id):
+    def _waveform_buffer(self, tel_id, shape, dtype):
+        """
+        Get the scratch buffer of a telescope for waveforms of ``shape`` and ``dtype``.
+
+        The buffer is overwritten when calibrating the next event,
+        so the image extractors must not keep references to their input.
+        """
+        buffer = self._waveform_buffers.get(tel_id)
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = np.empty(shape, dtype=dtype)
+            self._waveform_buffers[tel_id] = buffer
+        return buffer
+
+    def _prepare_dl1(self, event, tel_id):
+        """
+        Get the inputs for the image extraction of one telescope.
+
+        Returns None if there are no dl0 waveforms, otherwise a tuple of the
+        waveforms (pedestal subtracted and shifted if requested),
+        the selected gain channel, the broken pixels and the remaining time shift
+        to be applied to the peak time (or None if no shift is to be applied).
+        """
         waveforms = event.dl0.tel[tel_id].waveform
         if self._check_dl0_empty(waveforms):
-            return
+            return None
 
         n_pixels, n_samples = waveforms.shape
 
@@ -207,15 +264,69 @@ class CameraCalibrator(TelescopeComponent):
         )
 
         dl1_calib = event.calibration.tel[tel_id].dl1
-        time_shift = event.calibration.tel[tel_id].dl1.time_shift
-        readout = self.subarray.tel[tel_id].camera.readout
+        pedestal_offset = dl1_calib.pedestal_offset
+        time_shift = dl1_calib.time_shift
+
+        shift_available = n_samples > 1 and time_shift is not None
+        apply_waveform_shift = (
+            shift_available and self.apply_waveform_time_shift.tel[tel_id]
+        )
+
+        # same dtypes as numpy would give for the operations applied
+        if self.float32_waveforms:
+            dtype = np.dtype(np.float32)
+        else:
+            dtype = waveforms.dtype
+            if pedestal_offset is not None:
+                dtype = np.result_type(dtype, pedestal_offset)
+            # shift_waveforms returns float64 copies, also for float32 input
+            if apply_waveform_shift:
+                dtype = np.dtype(np.float64)
+
+        # we don't want to modify the dl0 data, so all operations write into
+        # the scratch buffer of the telescope, if there is anything to do
+        output = waveforms
+        if pedestal_offset is not None or apply_waveform_shift or dtype != output.dtype:
+            output = self._waveform_buffer(tel_id, waveforms.shape, dtype)
 
         # subtract any remaining pedestal before extraction
-        if dl1_calib.pedestal_offset is not None:
-            # this copies intentionally, we don't want to modify the dl0 data
+        if pedestal_offset is not None:
+            if waveforms.dtype != dtype:
+                # cast first, so the subtraction happens in the output dtype
+                output[...] = waveforms
+                waveforms = output
             # waveforms have shape (n_pixel, n_samples), pedestals (n_pixels, )
-            waveforms = waveforms - dl1_calib.pedestal_offset[:, np.newaxis]
+            pedestal = np.asarray(pedestal_offset).astype(dtype, copy=False)
+            np.subtract(waveforms, pedestal[:, np.newaxis], out=output)
+            waveforms = output
+
+        remaining_shift = None
+        # shift waveforms if time_shift calibration is available
+        if apply_waveform_shift:
+            readout = self.subarray.tel[tel_id].camera.readout
+            sampling_rate = readout.sampling_rate.to_value(u.GHz)
+            time_shift_samples = time_shift * sampling_rate
+            # in place if the pedestal was subtracted into the buffer
+            waveforms, remaining_shift = shift_waveforms(
+                waveforms,
+                time_shift_samples,
+                out=output,
+                interpolate=self.interpolate_waveform_time_shift.tel[tel_id],
+            )
+            remaining_shift /= sampling_rate
+        elif shift_available:
+            remaining_shift = time_shift
 
+        if shift_available and not self.apply_peak_time_shift.tel[tel_id]:
+            remaining_shift = None
+
+        if waveforms is not output:
+            output[...] = waveforms
+
+        return output, selected_gain_channel, broken_pixels, remaining_shift
+
+    def _extract(self, waveforms, tel_id, selected_gain_channel, broken_pixels):
+        n_pixels, n_samples = waveforms.shape[-2:]
         if n_samples == 1:
             # To handle ASTRI and dst
             # TODO: Improved handling of ASTRI and dst
@@ -223,40 +334,32 @@ class CameraCalibrator(TelescopeComponent):
             #   - Read into dl1 container directly?
             #   - Don't do anything if dl1 container already filled
             #   - Update on SST review decision
-            dl1 = DL1CameraContainer(
+            return DL1CameraContainer(
                 image=waveforms[..., 0].astype(np.float32),
                 peak_time=np.zeros(n_pixels, dtype=np.float32),
                 is_valid=True,
             )
-        else:
 
-            # shift waveforms if time_shift calibration is available
-            if time_shift is not None:
-                if self.apply_waveform_time_shift.tel[tel_id]:
-                    sampling_rate = readout.sampling_rate.to_value(u.GHz)
-                    time_shift_samples = time_shift * sampling_rate
-                    waveforms, remaining_shift = shift_waveforms(
-                        waveforms, time_shift_samples
-                    )
-                    remaining_shift /= sampling_rate
-                else:
-                    remaining_shift = time_shift
-
-            extractor = self.image_extractors[self.image_extractor_type.tel[tel_id]]
-            dl1 = extractor(
-                waveforms,
-                tel_id=tel_id,
-                selected_gain_channel=selected_gain_channel,
-                broken_pixels=broken_pixels,
-            )
+        extractor = self.image_extractors[self.image_extractor_type.tel[tel_id]]
+        return extractor(
+            waveforms,
+            tel_id=tel_id,
+            selected_gain_channel=selected_gain_channel,
+            broken_pixels=broken_pixels,
+        )
 
-            # correct non-integer remainder of the shift if given
-            if self.apply_peak_time_shift.tel[tel_id] and time_shift is not None:
-                dl1.peak_time -= remaining_shift
+    def _correct_dl1(self, event, tel_id, dl1, remaining_shift):
+        # correct non-integer remainder of the shift if given
+        if remaining_shift is not None:
+            dl1.peak_time -= remaining_shift
 
         # Calibrate extracted charge
+        dl1_calib = event.calibration.tel[tel_id].dl1
         dl1.image *= dl1_calib.relative_factor / dl1_calib.absolute_factor
 
+    def _finish_dl1(self, event, tel_id, dl1, broken_pixels, remaining_shift):
+        self._correct_dl1(event, tel_id, dl1, remaining_shift)
+
         # handle invalid pixels
         if self.invalid_pixel_handler is not None:
             dl1.image, dl1.peak_time = self.invalid_pixel_handler(
@@ -269,6 +372,106 @@ class CameraCalibrator(TelescopeComponent):
         # store the results in the event structure
         event.dl1.tel[tel_id] = dl1
 
+    def _calibrate_dl1(self, event, tel_id):
+        inputs = self._prepare_dl1(event, tel_id)
+        if inputs is None:
+            return
+
+        waveforms, selected_gain_channel, broken_pixels, remaining_shift = inputs
+        dl1 = self._extract(waveforms, tel_id, selected_gain_channel, broken_pixels)
+        self._finish_dl1(event, tel_id, dl1, broken_pixels, remaining_shift)
+
+    def _batch_key(self, tel_id, waveforms, selected_gain_channel):
+        """
+        Key of the batch the telescope can be extracted in,
+        None if it has to be extracted on its own
+        """
+        if waveforms.shape[-1] == 1:
+            return None
+
+        name = self.image_extractor_type.tel[tel_id]
+        extractor = self.image_extractors[name]
+        if not extractor.supports_batches:
+            return None
+
+        return (
+            name,
+            extractor.batch_key(tel_id),
+            waveforms.shape,
+            waveforms.dtype,
+            selected_gain_channel is None,
+        )
+
+    def _calibrate_dl1_batched(self, event, tel_ids):
+        """
+        Calibrate the dl1 data of all ``tel_ids``, extracting the images of
+        telescopes with the same camera and extractor configuration together.
+        """
+        inputs = {}
+        batches = defaultdict(list)
+        for tel_id in tel_ids:
+            tel_inputs = self._prepare_dl1(event, tel_id)
+            if tel_inputs is None:
+                continue
+
+            inputs[tel_id] = tel_inputs
+            waveforms, selected_gain_channel, _, _ = tel_inputs
+            key = self._batch_key(tel_id, waveforms, selected_gain_channel)
+            # telescopes that cannot be batched get a batch of their own
+            batches[key if key is not None else tel_id].append(tel_id)
+
+        dl1 = {}
+        finished = set()
+        for batch in batches.values():
+            if len(batch) == 1:
+                tel_id = batch[0]
+                waveforms, selected_gain_channel, broken_pixels, _ = inputs[tel_id]
+                dl1[tel_id] = self._extract(
+                    waveforms, tel_id, selected_gain_channel, broken_pixels
+                )
+                continue
+
+            waveforms = np.stack([inputs[tel_id][0] for tel_id in batch])
+            selected_gain_channel = None
+            if inputs[batch[0]][1] is not None:
+                selected_gain_channel = np.stack([inputs[t][1] for t in batch])
+            broken_pixels = np.stack([inputs[tel_id][2] for tel_id in batch])
+
+            result = self._extract(
+                waveforms, batch[0], selected_gain_channel, broken_pixels
+            )
+            for i, tel_id in enumerate(batch):
+                dl1[tel_id] = DL1CameraContainer(
+                    image=result.image[i],
+                    peak_time=result.peak_time[i],
+                    is_valid=result.is_valid,
+                )
+
+            handler = self.invalid_pixel_handler
+            if handler is not None and handler.supports_batches:
+                # the corrections are applied to views of the batch arrays,
+                # so the invalid pixels can be handled for the whole batch
+                for tel_id in batch:
+                    remaining_shift = inputs[tel_id][3]
+                    self._correct_dl1(event, tel_id, dl1[tel_id], remaining_shift)
+
+                image, peak_time = handler(
+                    batch[0], result.image, result.peak_time, broken_pixels
+                )
+                for i, tel_id in enumerate(batch):
+                    dl1[tel_id].image = image[i]
+                    dl1[tel_id].peak_time = peak_time[i]
+                    finished.add(tel_id)
+
+        # keep the order of the telescopes in the event
+        for tel_id, (_, _, broken_pixels, remaining_shift) in inputs.items():
+            if tel_id in finished:
+                event.dl1.tel[tel_id] = dl1[tel_id]
+            else:
+                self._finish_dl1(
+                    event, tel_id, dl1[tel_id], broken_pixels, remaining_shift
+                )
+
     def __call__(self, event):
         """
         Perform the full camera calibration from R1 to DL1. Any calibration
@@ -282,12 +485,19 @@ class CameraCalibrator(TelescopeComponent):
         """
         # TODO: How to handle different calibrations depending on tel_id?
         tel = event.r1.tel or event.dl0.tel or event.dl1.tel
-        for tel_id in tel.keys():
+        if not self.batch_telescopes:
+            for tel_id in tel.keys():
+                self._calibrate_dl0(event, tel_id)
+                self._calibrate_dl1(event, tel_id)
+            return
+
+        tel_ids = list(tel.keys())
+        for tel_id in tel_ids:
             self._calibrate_dl0(event, tel_id)
-            self._calibrate_dl1(event, tel_id)
+        self._calibrate_dl1_batched(event, tel_ids)
 
 
-def shift_waveforms(waveforms, time_shift_samples):
+def shift_waveforms(waveforms, time_shift_samples, out=None, interpolate=False):
     """
     Shift the waveforms by the mean integer shift to mediate
     time differences between pixels.
@@ -302,6 +512,15 @@ def shift_waveforms(waveforms, time_shift_samples):
         The shift to apply in units of samples.
         Waveforms are shifted to the left by the smallest integer
         that minimizes inter-pixel differences.
+    out: ndarray of shape (n_pixels, n_samples) or None
+        If given, the shifted waveforms are written into this array.
+        This can be ``waveforms`` itself to shift the waveforms in place.
+        If None, a new float64 array is created.
+    interpolate: bool
+        If True, shift the waveforms by the full shift relative to the mean
+        shift, interpolating linearly between samples, instead of only
+        by the integer part.
+        The remaining shift is then the mean shift for all pixels.
 
     Returns
     -------
@@ -310,24 +529,56 @@ def shift_waveforms(waveforms, time_shift_samples):
     remaining_shift: ndarray of shape (n_pixels, )
         The remaining shift after applying the integer shift to the waveforms.
     """
+    if out is None:
+        out = np.empty(waveforms.shape, dtype=np.float64)
+
+    time_shift_samples = np.asarray(time_shift_samples, dtype=np.float64)
     mean_shift = time_shift_samples.mean()
-    integer_shift = np.round(time_shift_samples - mean_shift).astype("int16")
-    remaining_shift = time_shift_samples - integer_shift
-    shifted_waveforms = _shift_waveforms_by_integer(waveforms, integer_shift)
-    return shifted_waveforms, remaining_shift
+    remaining_shift = np.empty_like(time_shift_samples)
+    _shift_waveforms(
+        waveforms, time_shift_samples, mean_shift, interpolate, out, remaining_shift
+    )
+    return out, remaining_shift
 
 
-@guvectorize(
-    [(float64[:], int64, float64[:]), (float32[:], int64, float32[:])],
-    "(s),()->(s)",
-    nopython=True,
-    cache=True,
-)
-def _shift_waveforms_by_integer(waveforms, integer_shift, shifted_waveforms):
-    n_samples = waveforms.size
-
-    for new_sample_idx in range(n_samples):
-        # repeat first value if out ouf bounds to the left
-        # repeat last value if out ouf bounds to the right
-        sample_idx = min(max(new_sample_idx + integer_shift, 0), n_samples - 1)
-        shifted_waveforms[new_sample_idx] = waveforms[sample_idx]
+@njit(cache=True)
+def _shift_waveforms(
+    waveforms, time_shift_samples, mean_shift, interpolate, out, remaining_shift
+):
+    """
+    Shift each waveform to the left by its time shift relative to ``mean_shift``.
+
+    Samples out of bounds repeat the first or last value.
+    Each pixel is processed in the direction in which the samples still to be
+    read are not yet overwritten, so ``out`` may be the same array as
+    ``waveforms``.
+    """
+    n_pixels, n_samples = waveforms.shape
+    for pixel in range(n_pixels):
+        shift = time_shift_samples[pixel] - mean_shift
+        if not interpolate:
+            shift = np.round(shift)
+        remaining_shift[pixel] = time_shift_samples[pixel] - shift
+
+        integer_shift = int(np.floor(shift))
+        fraction = shift - integer_shift
+
+        if integer_shift >= 0:
+            start, stop, step = 0, n_samples, 1
+        else:
+            start, stop, step = n_samples - 1, -1, -1
+
+        for new_sample_idx in range(start, stop, step):
+            sample_idx = new_sample_idx + integer_shift
+            # repeat first value if out ouf bounds to the left
+            # repeat last value if out ouf bounds to the right
+            if sample_idx < 0:
+                value = waveforms[pixel, 0]
+            elif sample_idx >= n_samples - 1:
+                value = waveforms[pixel, n_samples - 1]
+            elif fraction > 0:
+                value = (1 - fraction) * waveforms[pixel, sample_idx]
+                value += fraction * waveforms[pixel, sample_idx + 1]
+            else:
+                value = waveforms[pixel, sample_idx]
+            out[pixel, new_sample_idx] = value
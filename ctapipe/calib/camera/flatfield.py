@@ -9,10 +9,11 @@ from astropy import units as u
 
 from ctapipe.containers import DL1CameraContainer
 from ctapipe.core import Component
-from ctapipe.core.traits import Int, List, Unicode
+from ctapipe.core.traits import Bool, Int, List, Unicode
 from ctapipe.image.extractor import ImageExtractor
 
 from .calibrator import _get_invalid_pixels
+from .online_statistics import OnlineStatistics
 
 __all__ = ["FlatFieldCalculator", "FlasherFlatFieldCalculator"]
 
@@ -140,6 +141,24 @@ class FlasherFlatFieldCalculator(FlatFieldCalculator):
     time_cut_outliers = List(
         [0, 60], help="Interval (in waveform samples) of accepted time values"
     ).tag(config=True)
+    online_statistics = Bool(
+        False,
+        help=(
+            "Accumulate the statistics of the sample event by event, instead of"
+            " storing the charges and times of all events of the sample."
+            " Memory then only depends on the number of pixels."
+            " Mean and std are exact, medians are estimated with the P² algorithm."
+        ),
+    ).tag(config=True)
+    online_update_interval = Int(
+        0,
+        min=0,
+        help=(
+            "Only used with online_statistics. If larger than 0, also fill the"
+            " flat-field container every this many events with the statistics"
+            " of the events collected so far in the current sample."
+        ),
+    ).tag(config=True)
 
     def __init__(self, **kwargs):
         """Calculates flat-field parameters from flasher data
@@ -168,6 +187,10 @@ class FlasherFlatFieldCalculator(FlatFieldCalculator):
         self.charges = None  # charge per event in sample
         self.arrival_times = None  # arrival time per event in sample
         self.sample_masked_pixels = None  # masked pixels per event in sample
+        # running statistics of charge, relative gain and time, online mode
+        self.charge_statistics = None
+        self.relative_gain_statistics = None
+        self.time_statistics = None
 
     def _extract_charge(self, event) -> DL1CameraContainer:
         """
@@ -247,16 +270,35 @@ class FlasherFlatFieldCalculator(FlatFieldCalculator):
         sample_age = (trigger_time - self.time_start).to_value(u.s)
 
         # check if to create a calibration event
-        if sample_age > self.sample_duration or self.n_events_seen == self.sample_size:
-            relative_gain_results = self.calculate_relative_gain_results(
-                self.charge_medians, self.charges, self.sample_masked_pixels
-            )
-            time_results = self.calculate_time_results(
-                self.arrival_times,
-                self.sample_masked_pixels,
-                self.time_start,
-                trigger_time,
-            )
+        sample_complete = (
+            sample_age > self.sample_duration or self.n_events_seen == self.sample_size
+        )
+        if sample_complete or self._online_update_due():
+            if self.online_statistics:
+                charge = self.charge_statistics
+                gain = self.relative_gain_statistics
+                time = self.time_statistics
+                relative_gain_results = self._relative_gain_results_from_statistics(
+                    charge.median,
+                    charge.mean,
+                    charge.std,
+                    gain.median,
+                    gain.mean,
+                    gain.std,
+                )
+                time_results = self._time_results_from_statistics(
+                    time.median, time.mean, time.std, self.time_start, trigger_time
+                )
+            else:
+                relative_gain_results = self.calculate_relative_gain_results(
+                    self.charge_medians, self.charges, self.sample_masked_pixels
+                )
+                time_results = self.calculate_time_results(
+                    self.arrival_times,
+                    self.sample_masked_pixels,
+                    self.time_start,
+                    trigger_time,
+                )
 
             result = {
                 "n_events": self.n_events_seen,
@@ -272,11 +314,26 @@ class FlasherFlatFieldCalculator(FlatFieldCalculator):
 
             return False
 
+    def _online_update_due(self):
+        """If intermediate results of the online statistics are to be filled"""
+        return (
+            self.online_statistics
+            and self.online_update_interval > 0
+            and self.n_events_seen % self.online_update_interval == 0
+        )
+
     def setup_sample_buffers(self, waveform, sample_size):
         """Initialize sample buffers"""
 
         n_channels = waveform.shape[0]
         n_pix = waveform.shape[1]
+
+        if self.online_statistics:
+            self.charge_statistics = OnlineStatistics((n_channels, n_pix))
+            self.relative_gain_statistics = OnlineStatistics((n_channels, n_pix))
+            self.time_statistics = OnlineStatistics((n_channels, n_pix))
+            return
+
         shape = (sample_size, n_channels, n_pix)
 
         self.charge_medians = np.zeros((sample_size, n_channels))
@@ -293,6 +350,18 @@ class FlasherFlatFieldCalculator(FlatFieldCalculator):
         good_charge = np.ma.array(charge, mask=pixel_mask)
         charge_median = np.ma.median(good_charge, axis=1)
 
+        if self.online_statistics:
+            # same precision as the division of the sample buffers
+            event_median = charge_median.astype(np.float64)[:, np.newaxis]
+            relative_gain = good_charge.astype(np.float64) / event_median
+            self.charge_statistics.update(charge, pixel_mask)
+            self.relative_gain_statistics.update(
+                np.ma.getdata(relative_gain), np.ma.getmaskarray(relative_gain)
+            )
+            self.time_statistics.update(arrival_time, pixel_mask)
+            self.n_events_seen += 1
+            return
+
         self.charges[self.n_events_seen] = charge
         self.arrival_times[self.n_events_seen] = arrival_time
         self.sample_masked_pixels[self.n_events_seen] = pixel_mask
@@ -314,6 +383,14 @@ class FlasherFlatFieldCalculator(FlatFieldCalculator):
         # std over the sample per pixel
         pixel_std = np.ma.std(masked_trace_time, axis=0)
 
+        return self._time_results_from_statistics(
+            pixel_median, pixel_mean, pixel_std, time_start, trigger_time
+        )
+
+    def _time_results_from_statistics(
+        self, pixel_median, pixel_mean, pixel_std, time_start, trigger_time
+    ):
+        """Calculate and return the time results from the per-pixel statistics"""
         # median of the median over the camera
         median_of_pixel_median = np.ma.median(pixel_median, axis=1)
 
@@ -352,12 +429,31 @@ class FlasherFlatFieldCalculator(FlatFieldCalculator):
         # std over the sample per pixel
         pixel_std = np.ma.std(masked_trace_integral, axis=0)
 
-        # median of the median over the camera
-        median_of_pixel_median = np.ma.median(pixel_median, axis=1)
-
         # relative gain
         relative_gain_event = masked_trace_integral / event_median[:, :, np.newaxis]
 
+        return self._relative_gain_results_from_statistics(
+            pixel_median,
+            pixel_mean,
+            pixel_std,
+            np.ma.median(relative_gain_event, axis=0),
+            np.ma.mean(relative_gain_event, axis=0),
+            np.ma.std(relative_gain_event, axis=0),
+        )
+
+    def _relative_gain_results_from_statistics(
+        self,
+        pixel_median,
+        pixel_mean,
+        pixel_std,
+        relative_gain_median,
+        relative_gain_mean,
+        relative_gain_std,
+    ):
+        """Calculate and return the sample statistics from the per-pixel statistics"""
+        # median of the median over the camera
+        median_of_pixel_median = np.ma.median(pixel_median, axis=1)
+
         # outliers from median
         charge_deviation = pixel_median - median_of_pixel_median[:, np.newaxis]
 
@@ -369,13 +465,9 @@ class FlasherFlatFieldCalculator(FlatFieldCalculator):
         )
 
         return {
-            "relative_gain_median": np.ma.getdata(
-                np.ma.median(relative_gain_event, axis=0)
-            ),
-            "relative_gain_mean": np.ma.getdata(
-                np.ma.mean(relative_gain_event, axis=0)
-            ),
-            "relative_gain_std": np.ma.getdata(np.ma.std(relative_gain_event, axis=0)),
+            "relative_gain_median": np.ma.getdata(relative_gain_median),
+            "relative_gain_mean": np.ma.getdata(relative_gain_mean),
+            "relative_gain_std": np.ma.getdata(relative_gain_std),
             "charge_median": np.ma.getdata(pixel_median),
             "charge_mean": np.ma.getdata(pixel_mean),
             "charge_std": np.ma.getdata(pixel_std),
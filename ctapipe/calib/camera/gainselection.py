@@ -3,7 +3,10 @@ Algorithms to select correct gain channel
 """
 from abc import abstractmethod
 from enum import IntEnum
+
 import numpy as np
+from numba import njit
+
 from ctapipe.core import Component, traits
 
 __all__ = [
@@ -11,6 +14,7 @@ __all__ = [
     "GainSelector",
     "ManualGainSelector",
     "ThresholdGainSelector",
+    "apply_gain_selection",
 ]
 
 
@@ -23,6 +27,71 @@ class GainChannel(IntEnum):
     LOW = 1
 
 
+def apply_gain_selection(waveforms, selected_gain_channel):
+    """
+    Get the waveforms of the selected gain channel of each pixel.
+
+    Only the selected waveforms are copied, the unused channel
+    is never materialized.
+
+    Parameters
+    ----------
+    waveforms : ndarray
+        Waveforms of all gain channels, shape (n_channels, n_pixels, n_samples)
+        or a stack of events of shape (n_events, n_channels, n_pixels, n_samples).
+    selected_gain_channel : ndarray
+        Selected gain channel of each pixel, shape (n_pixels)
+        or (n_events, n_pixels) respectively.
+
+    Returns
+    -------
+    selected_waveforms : ndarray
+        Shape (n_pixels, n_samples) or (n_events, n_pixels, n_samples)
+    """
+    waveforms = np.asanyarray(waveforms)
+    single_event = waveforms.ndim == 3
+    if single_event:
+        waveforms = waveforms[np.newaxis]
+
+    # also support a single channel for all pixels
+    n_events, _, n_pixels, n_samples = waveforms.shape
+    selected_gain_channel = np.broadcast_to(selected_gain_channel, (n_events, n_pixels))
+
+    selected_waveforms = np.empty((n_events, n_pixels, n_samples), waveforms.dtype)
+    _gather_gain_channel(waveforms, selected_gain_channel, selected_waveforms)
+
+    if single_event:
+        return selected_waveforms[0]
+    return selected_waveforms
+
+
+@njit(cache=True)
+def _gather_gain_channel(waveforms, selected_gain_channel, out):
+    n_events, _, n_pixels, _ = waveforms.shape
+    for event in range(n_events):
+        for pixel in range(n_pixels):
+            out[event, pixel] = waveforms[
+                event, selected_gain_channel[event, pixel], pixel
+            ]
+
+
+@njit(cache=True)
+def _any_sample_above(waveforms, threshold):
+    """
+    For waveforms of shape (n_events, n_pixels, n_samples), check
+    for each pixel if any sample is above threshold.
+    """
+    n_events, n_pixels, n_samples = waveforms.shape
+    result = np.zeros((n_events, n_pixels), dtype=np.int8)
+    for event in range(n_events):
+        for pixel in range(n_pixels):
+            for sample in range(n_samples):
+                if waveforms[event, pixel, sample] > threshold:
+                    result[event, pixel] = 1
+                    break
+    return result
+
+
 class GainSelector(Component):
     """
     Base class for algorithms that decide on the gain channel to use
@@ -56,6 +125,68 @@ class GainSelector(Component):
         else:
             raise ValueError(f"Cannot handle waveform array of shape: {waveforms.ndim}")
 
+    def select_batch(self, waveforms):
+        """
+        Reduce the waveforms of a stack of events to a single gain channel.
+
+        Parameters
+        ----------
+        waveforms : ndarray
+            Waveforms of several events of the same telescope stored in a
+            numpy array of shape (n_events, n_chan, n_pix, n_samples).
+
+        Returns
+        -------
+        selected_waveforms : ndarray
+            Waveforms of the selected gain channel,
+            shape (n_events, n_pix, n_samples).
+            For a single channel, this is a view of ``waveforms``.
+        selected_gain_channel : ndarray or None
+            Gain channel to use for each pixel, shape (n_events, n_pix),
+            None if the waveforms are already gain selected, i.e. have
+            shape (n_events, n_pix, n_samples).
+        """
+        if waveforms.ndim == 3:  # already gain selected
+            return waveforms, None
+
+        if waveforms.ndim != 4:
+            raise ValueError(f"Cannot handle waveform array of shape: {waveforms.ndim}")
+
+        n_events, n_channels, n_pixels, _ = waveforms.shape
+        if n_channels == 1:  # Must be first channel if only one channel
+            selected_gain_channel = np.zeros((n_events, n_pixels), dtype=np.int8)
+            return waveforms[:, 0], selected_gain_channel
+
+        selected_gain_channel = self.select_channel_batch(waveforms)
+        selected_waveforms = apply_gain_selection(waveforms, selected_gain_channel)
+        return selected_waveforms, selected_gain_channel
+
+    def select_channel_batch(self, waveforms):
+        """
+        Decide on the gain channel of each pixel for a stack of events.
+
+        Calls `select_channel` for each event, subclasses should override
+        this with a vectorized implementation.
+
+        Parameters
+        ----------
+        waveforms : ndarray
+            Waveforms stored in a numpy array of shape
+            (n_events, n_chan, n_pix, n_samples).
+
+        Returns
+        -------
+        selected_gain_channel : ndarray
+            Gain channel to use for each pixel
+            Shape: (n_events, n_pix)
+            Dtype: int8
+        """
+        n_events, _, n_pixels, _ = waveforms.shape
+        selected_gain_channel = np.empty((n_events, n_pixels), dtype=np.int8)
+        for event, event_waveforms in enumerate(waveforms):
+            selected_gain_channel[event] = self.select_channel(event_waveforms)
+        return selected_gain_channel
+
     @abstractmethod
     def select_channel(self, waveforms):
         """
@@ -92,6 +223,10 @@ class ManualGainSelector(GainSelector):
         n_pixels = waveforms.shape[1]
         return np.full(n_pixels, GainChannel[self.channel])
 
+    def select_channel_batch(self, waveforms):
+        n_events, _, n_pixels, _ = waveforms.shape
+        return np.full((n_events, n_pixels), GainChannel[self.channel], dtype=np.int8)
+
 
 class ThresholdGainSelector(GainSelector):
     """
@@ -106,4 +241,7 @@ class ThresholdGainSelector(GainSelector):
     ).tag(config=True)
 
     def select_channel(self, waveforms):
-        return (waveforms[0] > self.threshold).any(axis=1).astype(np.int8)
+        return _any_sample_above(waveforms[np.newaxis, 0], self.threshold)[0]
+
+    def select_channel_batch(self, waveforms):
+        return _any_sample_above(waveforms[:, 0], self.threshold)
@@ -0,0 +1,195 @@
+"""
+Constant-memory running statistics for the camera calibration calculators.
+"""
+import numpy as np
+from numba import njit
+
+__all__ = ["OnlineStatistics"]
+
+#: number of markers of the P² quantile estimator
+N_MARKERS = 5
+
+
+class OnlineStatistics:
+    """
+    Running mean, standard deviation and median of each element of
+    a stream of arrays with the same shape, e.g. the charge of each pixel.
+
+    Mean and standard deviation are computed with Welford's algorithm,
+    the median is estimated with the P² algorithm [1]_, which keeps
+    five markers per element instead of the full sample.
+    The memory therefore only depends on the shape of the arrays,
+    not on the number of collected arrays.
+    As ``numpy.ma.std``, the standard deviation is the population
+    standard deviation (``ddof=0``).
+
+    Parameters
+    ----------
+    shape : tuple
+        Shape of the arrays to collect
+
+    References
+    ----------
+    .. [1] R. Jain and I. Chlamtac, "The P² algorithm for dynamic calculation
+       of quantiles and histograms without storing observations",
+       Communications of the ACM 28, 10 (1985).
+       https://doi.org/10.1145/4372.4378
+    """
+
+    def __init__(self, shape):
+        self.shape = tuple(np.atleast_1d(shape))
+        size = int(np.prod(self.shape))
+        self.count = np.zeros(size, dtype=np.int64)
+        self._mean = np.zeros(size)
+        self._m2 = np.zeros(size)
+        self._heights = np.zeros((size, N_MARKERS))
+        self._positions = np.zeros((size, N_MARKERS))
+        self._desired_positions = np.zeros((size, N_MARKERS))
+
+    def update(self, values, mask=None):
+        """
+        Add one array to the statistics.
+
+        Parameters
+        ----------
+        values : array-like
+            Values, broadcastable to ``shape``
+        mask : array-like or None
+            Elements where mask is True are ignored,
+            broadcastable to ``shape``
+        """
+        values = np.broadcast_to(np.asarray(values, dtype=np.float64), self.shape)
+        if mask is None:
+            mask = False
+        mask = np.broadcast_to(np.asarray(mask, dtype=bool), self.shape)
+        _update_statistics(
+            values.ravel(),
+            mask.ravel(),
+            self.count,
+            self._mean,
+            self._m2,
+            self._heights,
+            self._positions,
+            self._desired_positions,
+        )
+
+    def _masked(self, values):
+        return np.ma.array(
+            values.reshape(self.shape), mask=(self.count == 0).reshape(self.shape)
+        )
+
+    @property
+    def mean(self):
+        """Mean of each element, masked where no value was collected"""
+        return self._masked(self._mean.copy())
+
+    @property
+    def std(self):
+        """Standard deviation of each element, masked where no value was collected"""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self._masked(np.sqrt(self._m2 / self.count))
+
+    @property
+    def median(self):
+        """Estimated median of each element, masked where no value was collected"""
+        return self._masked(_median_estimate(self.count, self._heights))
+
+
+@njit(cache=True)
+def _update_statistics(
+    values, mask, count, mean, m2, heights, positions, desired_positions
+):
+    for i in range(values.size):
+        if mask[i]:
+            continue
+
+        x = values[i]
+        count[i] += 1
+        n = count[i]
+
+        # Welford's algorithm
+        delta = x - mean[i]
+        mean[i] += delta / n
+        m2[i] += delta * (x - mean[i])
+
+        _p2_update(x, n, heights[i], positions[i], desired_positions[i])
+
+
+@njit(cache=True)
+def _p2_update(x, n, q, pos, desired):
+    """P² update of the median markers ``q`` with the ``n``-th value ``x``"""
+    if n <= N_MARKERS:
+        # collect the first values sorted, they are the initial markers
+        j = n - 1
+        while j > 0 and q[j - 1] > x:
+            q[j] = q[j - 1]
+            j -= 1
+        q[j] = x
+
+        if n == N_MARKERS:
+            for k in range(N_MARKERS):
+                pos[k] = k + 1
+            desired[0] = 1.0
+            desired[1] = 2.0
+            desired[2] = 3.0
+            desired[3] = 4.0
+            desired[4] = 5.0
+        return
+
+    # find the cell of x, updating the extreme markers
+    if x < q[0]:
+        q[0] = x
+        k = 0
+    elif x >= q[4]:
+        q[4] = x
+        k = 3
+    else:
+        k = 0
+        while x >= q[k + 1]:
+            k += 1
+
+    for j in range(k + 1, N_MARKERS):
+        pos[j] += 1
+
+    # increments of the desired positions for the median
+    desired[1] += 0.25
+    desired[2] += 0.5
+    desired[3] += 0.75
+    desired[4] += 1.0
+
+    # adjust the heights of the inner markers
+    for j in range(1, N_MARKERS - 1):
+        d = desired[j] - pos[j]
+        if (d >= 1 and pos[j + 1] - pos[j] > 1) or (
+            d <= -1 and pos[j - 1] - pos[j] < -1
+        ):
+            s = 1 if d > 0 else -1
+            # piecewise parabolic prediction
+            height = q[j] + s / (pos[j + 1] - pos[j - 1]) * (
+                (pos[j] - pos[j - 1] + s) * (q[j + 1] - q[j]) / (pos[j + 1] - pos[j])
+                + (pos[j + 1] - pos[j] - s) * (q[j] - q[j - 1]) / (pos[j] - pos[j - 1])
+            )
+            if not q[j - 1] < height < q[j + 1]:
+                # linear prediction
+                height = q[j] + s * (q[j + s] - q[j]) / (pos[j + s] - pos[j])
+            q[j] = height
+            pos[j] += s
+
+
+@njit(cache=True)
+def _median_estimate(count, heights):
+    median = np.full(count.size, np.nan)
+    for i in range(count.size):
+        n = count[i]
+        if n == 0:
+            continue
+
+        if n < N_MARKERS:
+            # exact median of the sorted first values
+            if n % 2 == 1:
+                median[i] = heights[i, n // 2]
+            else:
+                median[i] = 0.5 * (heights[i, n // 2 - 1] + heights[i, n // 2])
+        else:
+            median[i] = heights[i, 2]
+    return median
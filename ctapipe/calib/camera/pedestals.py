@@ -9,10 +9,11 @@ from astropy import units as u
 
 from ctapipe.containers import DL1CameraContainer
 from ctapipe.core import Component
-from ctapipe.core.traits import Int, List, Unicode
+from ctapipe.core.traits import Bool, Int, List, Unicode
 from ctapipe.image.extractor import ImageExtractor
 
 from .calibrator import _get_invalid_pixels
+from .online_statistics import OnlineStatistics
 
 __all__ = ["calc_pedestals_from_traces", "PedestalCalculator", "PedestalIntegrator"]
 
@@ -168,6 +169,24 @@ class PedestalIntegrator(PedestalCalculator):
         [-3, 3],
         help="Interval (number of std) of accepted charge standard deviation around camera median value",
     ).tag(config=True)
+    online_statistics = Bool(
+        False,
+        help=(
+            "Accumulate the statistics of the sample event by event, instead of"
+            " storing the charges of all events of the sample."
+            " Memory then only depends on the number of pixels."
+            " Mean and std are exact, the median is estimated with the P² algorithm."
+        ),
+    ).tag(config=True)
+    online_update_interval = Int(
+        0,
+        min=0,
+        help=(
+            "Only used with online_statistics. If larger than 0, also fill the"
+            " pedestal container every this many events with the statistics"
+            " of the events collected so far in the current sample."
+        ),
+    ).tag(config=True)
 
     def __init__(self, **kwargs):
         """Calculates pedestal parameters integrating the charge of pedestal events:
@@ -196,6 +215,7 @@ class PedestalIntegrator(PedestalCalculator):
         self.charge_medians = None  # med. charge in camera per event in sample
         self.charges = None  # charge per event in sample
         self.sample_masked_pixels = None  # pixels tp be masked per event in sample
+        self.charge_statistics = None  # running charge statistics, online mode
 
     def _extract_charge(self, event) -> DL1CameraContainer:
         """
@@ -268,10 +288,19 @@ class PedestalIntegrator(PedestalCalculator):
         sample_age = (trigger_time - self.time_start).to_value(u.s)
 
         # check if to create a calibration event
-        if sample_age > self.sample_duration or self.n_events_seen == self.sample_size:
-            pedestal_results = calculate_pedestal_results(
-                self, self.charges, self.sample_masked_pixels
-            )
+        sample_complete = (
+            sample_age > self.sample_duration or self.n_events_seen == self.sample_size
+        )
+        if sample_complete or self._online_update_due():
+            if self.online_statistics:
+                stats = self.charge_statistics
+                pedestal_results = _pedestal_results_from_statistics(
+                    self, stats.median, stats.mean, stats.std
+                )
+            else:
+                pedestal_results = calculate_pedestal_results(
+                    self, self.charges, self.sample_masked_pixels
+                )
             time_results = calculate_time_results(self.time_start, trigger_time)
 
             result = {
@@ -288,11 +317,24 @@ class PedestalIntegrator(PedestalCalculator):
 
             return False
 
+    def _online_update_due(self):
+        """If intermediate results of the online statistics are to be filled"""
+        return (
+            self.online_statistics
+            and self.online_update_interval > 0
+            and self.n_events_seen % self.online_update_interval == 0
+        )
+
     def setup_sample_buffers(self, waveform, sample_size):
         """Initialize sample buffers"""
 
         n_channels = waveform.shape[0]
         n_pix = waveform.shape[1]
+
+        if self.online_statistics:
+            self.charge_statistics = OnlineStatistics((n_channels, n_pix))
+            return
+
         shape = (sample_size, n_channels, n_pix)
 
         self.charge_medians = np.zeros((sample_size, n_channels))
@@ -302,6 +344,11 @@ class PedestalIntegrator(PedestalCalculator):
     def collect_sample(self, charge, pixel_mask):
         """Collect the sample data"""
 
+        if self.online_statistics:
+            self.charge_statistics.update(charge, pixel_mask)
+            self.n_events_seen += 1
+            return
+
         good_charge = np.ma.array(charge, mask=pixel_mask)
         charge_median = np.ma.median(good_charge, axis=1)
 
@@ -332,6 +379,11 @@ def calculate_pedestal_results(self, trace_integral, masked_pixels_of_sample):
     # std over the sample per pixel
     pixel_std = np.ma.std(masked_trace_integral, axis=0)
 
+    return _pedestal_results_from_statistics(self, pixel_median, pixel_mean, pixel_std)
+
+
+def _pedestal_results_from_statistics(self, pixel_median, pixel_mean, pixel_std):
+    """Calculate and return the sample statistics from the per-pixel statistics"""
     # median over the camera
     median_of_pixel_median = np.ma.median(pixel_median, axis=1)
 
@@ -247,6 +247,139 @@ def test_dl1_charge_calib(example_subarray):
     assert not np.allclose(event.dl1.tel[tel_id].peak_time, mid / sampling_rate, atol=1)
 
 
+@pytest.mark.parametrize(
+    "extractor_type",
+    [
+        "NeighborPeakWindowSum",
+        "LocalPeakWindowSum",
+        "FullWaveformSum",
+        "GlobalPeakWindowSum",
+    ],
+)
+@pytest.mark.parametrize("apply_waveform_time_shift", [False, True])
+def test_batch_telescopes(example_subarray, extractor_type, apply_waveform_time_shift):
+    """Extracting telescopes together must give the same result as one by one"""
+    rng = np.random.default_rng(0)
+
+    event = ArrayEventContainer()
+    tel_ids = rng.permutation(list(example_subarray.tel)[:20])
+    for tel_id in map(int, tel_ids):
+        readout = example_subarray.tel[tel_id].camera.readout
+        n_pixels, n_samples = readout.n_pixels, readout.n_samples
+
+        waveforms = rng.normal(0, 2, (n_pixels, n_samples)).astype(np.float32)
+        waveforms[:, n_samples // 2 :] += rng.uniform(0, 50, (n_pixels, 1))
+        event.r1.tel[tel_id].waveform = waveforms
+        event.r1.tel[tel_id].selected_gain_channel = rng.integers(
+            0, readout.n_channels, n_pixels
+        )
+
+        broken = rng.uniform(size=(readout.n_channels, n_pixels)) < 0.05
+        event.mon.tel[tel_id].pixel_status.hardware_failing_pixels = broken
+
+        dl1_calib = event.calibration.tel[tel_id].dl1
+        dl1_calib.pedestal_offset = rng.normal(0, 1, n_pixels)
+        dl1_calib.time_shift = rng.normal(0, 2, n_pixels)
+        dl1_calib.absolute_factor = rng.uniform(0.5, 2, n_pixels)
+
+    results = []
+    for batch_telescopes in (False, True):
+        calibrator = CameraCalibrator(
+            subarray=example_subarray,
+            image_extractor_type=extractor_type,
+            apply_waveform_time_shift=apply_waveform_time_shift,
+            batch_telescopes=batch_telescopes,
+        )
+        results.append(deepcopy(event))
+        calibrator(results[-1])
+
+    expected, batched = results
+    assert list(batched.dl1.tel) == list(expected.dl1.tel)
+    for tel_id, dl1 in expected.dl1.tel.items():
+        np.testing.assert_array_equal(batched.dl1.tel[tel_id].image, dl1.image)
+        np.testing.assert_array_equal(batched.dl1.tel[tel_id].peak_time, dl1.peak_time)
+
+
+@pytest.mark.parametrize("apply_waveform_time_shift", [False, True])
+def test_float32_waveforms(example_subarray, apply_waveform_time_shift):
+    """The float32 mode must agree with the default up to float32 precision"""
+    rng = np.random.default_rng(0)
+
+    event = ArrayEventContainer()
+    for tel_id in list(example_subarray.tel)[:5]:
+        readout = example_subarray.tel[tel_id].camera.readout
+        n_pixels, n_samples = readout.n_pixels, readout.n_samples
+
+        waveforms = rng.normal(0, 2, (n_pixels, n_samples)).astype(np.float32)
+        waveforms[:, n_samples // 2 :] += rng.uniform(0, 50, (n_pixels, 1))
+        event.r1.tel[tel_id].waveform = waveforms
+        event.r1.tel[tel_id].selected_gain_channel = rng.integers(
+            0, readout.n_channels, n_pixels
+        )
+
+        dl1_calib = event.calibration.tel[tel_id].dl1
+        dl1_calib.pedestal_offset = rng.normal(0, 1, n_pixels)
+        dl1_calib.time_shift = rng.normal(0, 2, n_pixels)
+
+    results = []
+    for float32_waveforms in (False, True):
+        calibrator = CameraCalibrator(
+            subarray=example_subarray,
+            image_extractor_type="LocalPeakWindowSum",
+            apply_waveform_time_shift=apply_waveform_time_shift,
+            float32_waveforms=float32_waveforms,
+        )
+        results.append(deepcopy(event))
+        calibrator(results[-1])
+
+    expected, result = results
+    for tel_id, dl1 in expected.dl1.tel.items():
+        np.testing.assert_array_equal(
+            result.r1.tel[tel_id].waveform, event.r1.tel[tel_id].waveform
+        )
+        np.testing.assert_array_equal(
+            result.dl0.tel[tel_id].waveform, event.r1.tel[tel_id].waveform
+        )
+        np.testing.assert_allclose(
+            result.dl1.tel[tel_id].image, dl1.image, rtol=1e-5, atol=1e-4
+        )
+        np.testing.assert_allclose(
+            result.dl1.tel[tel_id].peak_time, dl1.peak_time, rtol=1e-5
+        )
+
+    # buffers are reused for the next event
+    buffers = dict(calibrator._waveform_buffers)
+    assert all(b.dtype == np.float32 for b in buffers.values())
+    calibrator(deepcopy(event))
+    assert all(calibrator._waveform_buffers[t] is b for t, b in buffers.items())
+
+
+@pytest.mark.parametrize("float32_waveforms", [False, True])
+def test_waveform_dtype(example_subarray, float32_waveforms):
+    """float32 waveforms are only shifted in float32 in the float32 mode"""
+    tel_id = next(iter(example_subarray.tel))
+    readout = example_subarray.tel[tel_id].camera.readout
+    n_pixels, n_samples = readout.n_pixels, readout.n_samples
+    rng = np.random.default_rng(0)
+
+    event = ArrayEventContainer()
+    event.r1.tel[tel_id].waveform = rng.normal(0, 2, (n_pixels, n_samples)).astype(
+        np.float32
+    )
+    event.r1.tel[tel_id].selected_gain_channel = np.zeros(n_pixels, dtype=np.int8)
+    event.calibration.tel[tel_id].dl1.time_shift = rng.normal(0, 2, n_pixels)
+
+    calibrator = CameraCalibrator(
+        subarray=example_subarray,
+        apply_waveform_time_shift=True,
+        float32_waveforms=float32_waveforms,
+    )
+    calibrator(event)
+
+    expected = np.float32 if float32_waveforms else np.float64
+    assert calibrator._waveform_buffers[tel_id].dtype == expected
+
+
 def test_shift_waveforms():
     from ctapipe.calib.camera.calibrator import shift_waveforms
 
@@ -265,6 +398,43 @@ def test_shift_waveforms():
     assert shifted_waveforms[3, 7] == 1
     assert shifted_waveforms[4, 14] == 1
 
+    # new arrays are float64, also for float32 waveforms
+    shifted_waveforms, _ = shift_waveforms(waveforms.astype(np.float32), shifts)
+    assert shifted_waveforms.dtype == np.float64
+
+    # no dtype promotion when writing into a given array
+    out = np.empty((5, 40), dtype=np.float32)
+    shifted_waveforms, _ = shift_waveforms(waveforms.astype(np.float32), shifts, out)
+    assert shifted_waveforms is out
+    assert out[2, 12] == 1
+
+    # shifting in place gives the same result
+    expected, _ = shift_waveforms(waveforms, shifts)
+    in_place = waveforms.copy()
+    shifted_waveforms, _ = shift_waveforms(in_place, shifts, out=in_place)
+    assert shifted_waveforms is in_place
+    assert np.all(in_place == expected)
+
+
+def test_shift_waveforms_interpolate():
+    from ctapipe.calib.camera.calibrator import shift_waveforms
+
+    # a linear ramp is shifted exactly by linear interpolation
+    waveforms = np.tile(np.arange(20, dtype=np.float64), (3, 1))
+    shifts = np.array([0.25, -0.25, 0.0])
+
+    for out in (None, waveforms.copy()):
+        shifted_waveforms, remaining_shift = shift_waveforms(
+            waveforms if out is None else out, shifts, out=out, interpolate=True
+        )
+        assert np.all(remaining_shift == 0)
+        assert np.allclose(shifted_waveforms[0, :-1], np.arange(19) + 0.25)
+        assert np.allclose(shifted_waveforms[1, 1:], np.arange(1, 20) - 0.25)
+        assert np.all(shifted_waveforms[2] == waveforms[2])
+        # outside the readout window, the edge samples are repeated
+        assert shifted_waveforms[0, -1] == 19
+        assert shifted_waveforms[1, 0] == 0
+
 
 def test_invalid_pixels(example_event, example_subarray):
 
@@ -2,6 +2,7 @@ from copy import deepcopy
 
 import astropy.units as u
 import numpy as np
+import pytest
 from astropy.time import Time
 from traitlets.config import Config
 
@@ -10,7 +11,8 @@ from ctapipe.containers import ArrayEventContainer
 from ctapipe.instrument import SubarrayDescription
 
 
-def test_flasherflatfieldcalculator(prod5_sst):
+@pytest.mark.parametrize("online_statistics", [False, True])
+def test_flasherflatfieldcalculator(prod5_sst, online_statistics):
     """test of flasherFlatFieldCalculator"""
     tel_id = 0
     n_gain = 2
@@ -34,6 +36,7 @@ def test_flasherflatfieldcalculator(prod5_sst):
         charge_product="FixedWindowSum",
         sample_size=n_events,
         tel_id=tel_id,
+        online_statistics=online_statistics,
         config=config,
     )
     # create one event
@@ -1,9 +1,12 @@
 import numpy as np
+import pytest
+
 from ctapipe.calib.camera.gainselection import (
-    ManualGainSelector,
-    ThresholdGainSelector,
     GainChannel,
     GainSelector,
+    ManualGainSelector,
+    ThresholdGainSelector,
+    apply_gain_selection,
 )
 
 
@@ -64,3 +67,54 @@ def test_threshold_gain_selector():
     selected_gain_channel = gain_selector(waveforms)
     assert selected_gain_channel[0] == 1
     assert (selected_gain_channel[np.arange(1, 2048)] == 0).all()
+
+
+def test_apply_gain_selection():
+    rng = np.random.default_rng(0)
+    waveforms = rng.normal(size=(2, 100, 40)).astype(np.float32)
+    selected_gain_channel = rng.integers(0, 2, 100)
+
+    selected = apply_gain_selection(waveforms, selected_gain_channel)
+    assert selected.dtype == np.float32
+    np.testing.assert_array_equal(
+        selected, waveforms[selected_gain_channel, np.arange(100)]
+    )
+
+    # events stacked along the first axis
+    batch = np.stack([waveforms, waveforms[::-1]])
+    selected = apply_gain_selection(batch, np.stack([selected_gain_channel] * 2))
+    np.testing.assert_array_equal(
+        selected[1], waveforms[1 - selected_gain_channel, np.arange(100)]
+    )
+
+
+@pytest.mark.parametrize(
+    "gain_selector",
+    [
+        DummyGainSelector(),
+        ManualGainSelector(channel="LOW"),
+        ThresholdGainSelector(threshold=3),
+    ],
+)
+def test_select_batch(gain_selector):
+    rng = np.random.default_rng(0)
+    waveforms = rng.normal(size=(10, 2, 100, 40))
+
+    selected, selected_gain_channel = gain_selector.select_batch(waveforms)
+    assert selected.shape == (10, 100, 40)
+    assert selected_gain_channel.shape == (10, 100)
+
+    for i, event_waveforms in enumerate(waveforms):
+        expected = np.broadcast_to(gain_selector(event_waveforms), 100)
+        np.testing.assert_array_equal(selected_gain_channel[i], expected)
+        np.testing.assert_array_equal(
+            selected[i], event_waveforms[expected, np.arange(100)]
+        )
+
+    # single channel and already gain selected
+    selected, selected_gain_channel = gain_selector.select_batch(waveforms[:, :1])
+    assert (selected_gain_channel == 0).all()
+    np.testing.assert_array_equal(selected, waveforms[:, 0])
+
+    selected, selected_gain_channel = gain_selector.select_batch(waveforms[:, 0])
+    assert selected_gain_channel is None
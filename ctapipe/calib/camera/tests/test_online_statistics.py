@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from ctapipe.calib.camera.online_statistics import OnlineStatistics
+
+
+def test_online_statistics():
+    """Compare the online statistics to the statistics of the full sample"""
+    rng = np.random.default_rng(0)
+    n_events = 5000
+    values = rng.normal(300, 5, (n_events, 2, 100))
+    masks = rng.uniform(size=(n_events, 2, 100)) < 0.1
+    # one pixel masked in all events
+    masks[:, 0, 0] = True
+
+    statistics = OnlineStatistics((2, 100))
+    for event_values, mask in zip(values, masks):
+        statistics.update(event_values, mask)
+
+    sample = np.ma.array(values, mask=masks)
+    np.testing.assert_array_equal(statistics.count, (~masks).sum(axis=0).ravel())
+
+    for name in ("mean", "std", "median"):
+        result = getattr(statistics, name)
+        assert result.shape == (2, 100)
+        assert result.mask[0, 0]
+        assert result.mask.sum() == 1
+
+    expected = np.ma.mean(sample, axis=0)
+    np.testing.assert_allclose(statistics.mean.compressed(), expected.compressed())
+    expected = np.ma.std(sample, axis=0)
+    np.testing.assert_allclose(statistics.std.compressed(), expected.compressed())
+
+    # the median is an estimate, but should be much better than the std
+    expected = np.ma.median(sample, axis=0)
+    deviation = np.abs(statistics.median - expected)
+    assert deviation.max() < 0.5
+
+
+@pytest.mark.parametrize("n_values", [1, 2, 4, 5])
+def test_online_statistics_few_values(n_values):
+    """With less than five values, the median is exact"""
+    rng = np.random.default_rng(1)
+    values = rng.normal(size=(n_values, 10))
+
+    statistics = OnlineStatistics(10)
+    for event_values in values:
+        statistics.update(event_values)
+
+    np.testing.assert_allclose(statistics.median, np.median(values, axis=0))
+    np.testing.assert_allclose(statistics.std, np.std(values, axis=0), atol=1e-15)
+
+
+def test_online_statistics_constant():
+    statistics = OnlineStatistics((3,))
+    for _ in range(100):
+        statistics.update(42.0)
+
+    assert np.all(statistics.mean == 42)
+    assert np.all(statistics.median == 42)
+    assert np.all(statistics.std == 0)
@@ -5,6 +5,7 @@ from copy import deepcopy
 
 import astropy.units as u
 import numpy as np
+import pytest
 from astropy.time import Time
 
 from ctapipe.calib.camera.pedestals import (
@@ -15,7 +16,8 @@ from ctapipe.containers import ArrayEventContainer
 from ctapipe.instrument import SubarrayDescription
 
 
-def test_pedestal_integrator(prod5_sst):
+@pytest.mark.parametrize("online_statistics", [False, True])
+def test_pedestal_integrator(prod5_sst, online_statistics):
     """test of PedestalIntegrator"""
 
     tel_id = 0
@@ -37,6 +39,8 @@ def test_pedestal_integrator(prod5_sst):
         charge_product="FixedWindowSum",
         sample_size=n_events,
         tel_id=tel_id,
+        online_statistics=online_statistics,
+        online_update_interval=5,
     )
     # create one event
     data = ArrayEventContainer()
@@ -50,14 +54,19 @@ def test_pedestal_integrator(prod5_sst):
     data.r1.tel[tel_id].waveform = np.full((2, n_pixels, 40), ped_level)
     data.r1.tel[tel_id].selected_gain_channel = np.zeros(n_pixels, dtype=np.uint8)
 
+    n_updates = 0
     while ped_calculator.n_events_seen < n_events:
         if ped_calculator.calculate_pedestals(data):
+            n_updates += 1
             assert data.mon.tel[tel_id].pedestal
             assert np.mean(data.mon.tel[tel_id].pedestal.charge_median) == (
                 ped_calculator.extractor.window_width.tel[0] * ped_level
             )
             assert np.mean(data.mon.tel[tel_id].pedestal.charge_std) == 0
 
+    # intermediate results are only filled in online mode
+    assert n_updates == (n_events // 5 if online_statistics else 1)
+
 
 def test_calc_pedestals_from_traces():
     """test calc_pedestals_from_traces"""
@@ -1,3 +1,4 @@
+from .batch_parameters import image_parameters_batch
 from .cleaning import (
     ImageCleaner,
     TailcutsImageCleaner,
@@ -7,6 +8,7 @@ from .cleaning import (
     mars_cleaning_1st_pass,
     tailcuts_clean,
 )
+from .combined_parameters import CameraPixels, leakage_concentration_statistics
 from .concentration import concentration_parameters
 from .extractor import (
     BaselineSubtractedNeighborPeakWindowSum,
@@ -34,7 +36,9 @@ from .invalid_pixels import InvalidPixelHandler, NeighborAverage
 from .leakage import leakage_parameters
 from .modifications import ImageModifier
 from .morphology import (
+    Islands,
     brightest_island,
+    label_islands,
     largest_island,
     morphology_parameters,
     number_of_island_sizes,
@@ -66,10 +70,13 @@ __all__ = [
     "ImageModifier",
     "ImageProcessor",
     "hillas_parameters",
+    "image_parameters_batch",
     "HillasParameterizationError",
     "camera_to_shower_coordinates",
     "timing_parameters",
     "leakage_parameters",
+    "leakage_concentration_statistics",
+    "CameraPixels",
     "concentration_parameters",
     "descriptive_statistics",
     "number_of_islands",
@@ -77,6 +84,8 @@ __all__ = [
     "morphology_parameters",
     "largest_island",
     "brightest_island",
+    "label_islands",
+    "Islands",
     "tailcuts_clean",
     "dilate",
     "mars_cleaning_1st_pass",
@@ -0,0 +1,383 @@
+"""
+Vectorized calculation of image parameters for a batch of images
+of the same camera.
+
+All computations work on the flat array of pixels selected in any of the
+images, so the cost scales with the number of selected pixels and not
+with the number of camera pixels.
+"""
+from typing import NamedTuple
+
+import astropy.units as u
+import numpy as np
+from astropy.table import Table
+
+from ..fitting import lts_linear_regression
+from .hillas import HILLAS_ATOL
+from .morphology import label_islands
+from .timing import rmse
+
+__all__ = ["image_parameters_batch"]
+
+
+class _Selection(NamedTuple):
+    """Flat representation of the pixels selected in a stack of masks"""
+
+    #: index of the image for each selected pixel, sorted
+    image_index: np.ndarray
+    #: index of the camera pixel for each selected pixel
+    pixel_index: np.ndarray
+    #: number of selected pixels per image
+    counts: np.ndarray
+    #: position of the first selected pixel of each image in the flat arrays
+    starts: np.ndarray
+
+    @classmethod
+    def from_masks(cls, masks):
+        image_index, pixel_index = np.nonzero(masks)
+        counts = np.count_nonzero(masks, axis=1)
+        starts = np.cumsum(counts) - counts
+        return cls(image_index, pixel_index, counts, starts)
+
+    def sum(self, values):
+        """Sum ``values`` of the selected pixels per image"""
+        # bincount returns integers if no pixel is selected at all
+        return np.bincount(
+            self.image_index, weights=values, minlength=len(self.counts)
+        ).astype(np.float64, copy=False)
+
+    def reduce(self, ufunc, values):
+        """Reduce ``values`` per image using ``ufunc``, nan for empty images"""
+        result = np.full(len(self.counts), np.nan)
+        not_empty = self.counts > 0
+        if np.any(not_empty):
+            result[not_empty] = ufunc.reduceat(values, self.starts[not_empty])
+        return result
+
+    def expand(self, values):
+        """Broadcast per-image ``values`` to the selected pixels"""
+        return values[self.image_index]
+
+
+def _hillas_batch(selection, pix_x, pix_y, weights):
+    """
+    Hillas parameters for a stack of images, see `~ctapipe.image.hillas_parameters`.
+
+    Images with size 0 result in nan for all parameters.
+    """
+    size = selection.sum(weights)
+    has_size = size != 0
+    # avoid division by zero, results for these rows are set to nan at the end
+    norm = np.where(has_size, size, 1.0)
+
+    cog_x = selection.sum(weights * pix_x) / norm
+    cog_y = selection.sum(weights * pix_y) / norm
+
+    delta_x = pix_x - selection.expand(cog_x)
+    delta_y = pix_y - selection.expand(cog_y)
+
+    # weighted covariance with ddof=0, as in hillas_parameters
+    cov_xx = selection.sum(weights * delta_x**2) / norm
+    cov_yy = selection.sum(weights * delta_y**2) / norm
+    cov_xy = selection.sum(weights * delta_x * delta_y) / norm
+
+    # analytic eigenvalues of the symmetric 2x2 covariance matrix
+    half_trace = 0.5 * (cov_xx + cov_yy)
+    root = np.sqrt((0.5 * (cov_xx - cov_yy)) ** 2 + cov_xy**2)
+    eig_vals = np.stack([half_trace - root, half_trace + root], axis=1)
+    eig_vals[np.isclose(eig_vals, 0, atol=HILLAS_ATOL)] = 0
+    width, length = np.sqrt(eig_vals).T
+
+    # orientation of the major axis, in (-pi/2, pi/2]
+    psi = 0.5 * np.arctan2(2 * cov_xy, cov_xx - cov_yy)
+    # a circular image has no preferred direction, hillas_parameters uses pi/2
+    psi[(cov_xy == 0) & (cov_xx == cov_yy)] = np.pi / 2
+    psi[psi == -np.pi / 2] = np.pi / 2
+
+    has_length = length != 0
+    psi[~has_length] = np.nan
+    safe_length = np.where(has_length, length, 1.0)
+
+    cos_psi = selection.expand(np.cos(psi))
+    sin_psi = selection.expand(np.sin(psi))
+    longitudinal = delta_x * cos_psi + delta_y * sin_psi
+    skewness = selection.sum(weights * longitudinal**3) / norm / safe_length**3
+    kurtosis = selection.sum(weights * longitudinal**4) / norm / safe_length**4
+
+    # uncertainties, see hillas_parameters for the reference
+    cos_2psi = selection.expand(np.cos(2 * psi))
+    a = (1 + cos_2psi) / 2
+    b = (1 - cos_2psi) / 2
+    c = selection.expand(np.sin(2 * psi))
+
+    pixel_norm = selection.expand(norm)
+    A = (delta_x**2 - selection.expand(cov_xx)) / pixel_norm
+    B = (delta_y**2 - selection.expand(cov_yy)) / pixel_norm
+    C = (delta_x * delta_y - selection.expand(cov_xy)) / pixel_norm
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        length_uncertainty = np.sqrt(
+            selection.sum((a * A + b * B + c * C) ** 2 * weights)
+        ) / (2 * length)
+        width_uncertainty = np.sqrt(
+            selection.sum((b * A + a * B - c * C) ** 2 * weights)
+        ) / (2 * width)
+
+    length_uncertainty[~has_length] = np.nan
+    width_uncertainty[width == 0] = np.nan
+    skewness[~has_length] = np.nan
+    kurtosis[~has_length] = np.nan
+
+    hillas = {
+        "intensity": size,
+        "skewness": skewness,
+        "kurtosis": kurtosis,
+        "x": cog_x,
+        "y": cog_y,
+        "r": np.hypot(cog_x, cog_y),
+        "phi": np.arctan2(cog_y, cog_x),
+        "length": length,
+        "length_uncertainty": length_uncertainty,
+        "width": width,
+        "width_uncertainty": width_uncertainty,
+        "psi": psi,
+    }
+    for key, value in hillas.items():
+        if key != "intensity":
+            value[~has_size] = np.nan
+
+    return hillas
+
+
+def _leakage_batch(selection, geom, weights, size):
+    """Leakage parameters for a stack of images, see `leakage_parameters`"""
+    leakage = {}
+    for width in (1, 2):
+        in_border = geom.get_border_pixel_mask(width)[selection.pixel_index]
+        n_pixels = np.bincount(
+            selection.image_index[in_border], minlength=len(selection.counts)
+        )
+        intensity = selection.sum(np.where(in_border, weights, 0))
+        leakage[f"pixels_width_{width}"] = n_pixels / geom.n_pixels
+        with np.errstate(invalid="ignore", divide="ignore"):
+            leakage[f"intensity_width_{width}"] = intensity / size
+    return leakage
+
+
+def _concentration_batch(selection, pix_x, pix_y, pixel_width, weights, hillas):
+    """Concentration parameters for a stack of images, see `concentration_parameters`"""
+    intensity = hillas["intensity"]
+    delta_x = pix_x - selection.expand(hillas["x"])
+    delta_y = pix_y - selection.expand(hillas["y"])
+
+    # pixels within one pixel diameter from the cog
+    mask_cog = (delta_x**2 + delta_y**2) < pixel_width**2
+    cog = selection.sum(np.where(mask_cog, weights, 0))
+
+    # pixels inside the hillas ellipse
+    cos_psi = selection.expand(np.cos(hillas["psi"]))
+    sin_psi = selection.expand(np.sin(hillas["psi"]))
+    longi = delta_x * cos_psi + delta_y * sin_psi
+    trans = -delta_x * sin_psi + delta_y * cos_psi
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mask_core = (longi / selection.expand(hillas["length"])) ** 2 + (
+            trans / selection.expand(hillas["width"])
+        ) ** 2 <= 1.0
+    core = selection.sum(np.where(mask_core, weights, 0))
+    core[hillas["width"] == 0] = 0.0
+
+    brightest = selection.reduce(np.maximum, weights)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return {
+            "cog": cog / intensity,
+            "core": core / intensity,
+            "pixel": brightest / intensity,
+        }
+
+
+def _morphology_batch(geom, masks):
+    """Morphology parameters for a stack of masks, see `morphology_parameters`"""
+    islands = label_islands(geom, masks)
+    return {
+        "n_pixels": np.count_nonzero(masks, axis=1),
+        "n_islands": islands.n_islands,
+        "n_small_islands": islands.n_small,
+        "n_medium_islands": islands.n_medium,
+        "n_large_islands": islands.n_large,
+    }
+
+
+def _statistics_batch(selection, values):
+    """
+    Descriptive statistics of the selected pixels for a stack of images,
+    see `~ctapipe.image.descriptive_statistics`.
+    """
+    values = values.astype(np.float64)
+    n = selection.counts
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = selection.sum(values) / n
+        delta = values - selection.expand(mean)
+        std = np.sqrt(selection.sum(delta**2) / n)
+        standardized = delta / selection.expand(std)
+        skewness = selection.sum(standardized**3) / n
+        kurtosis = selection.sum(standardized**4) / n - 3.0
+
+    return {
+        "max": selection.reduce(np.maximum, values),
+        "min": selection.reduce(np.minimum, values),
+        "mean": mean.astype(np.float32),
+        "std": std.astype(np.float32),
+        "skewness": skewness,
+        "kurtosis": kurtosis,
+    }
+
+
+def _timing_batch(selection, pix_x, pix_y, peak_time, hillas):
+    """
+    Timing parameters for a stack of images, see `~ctapipe.image.timing_parameters`.
+
+    The robust linear regression is performed image by image.
+    """
+    n_images = len(selection.counts)
+    timing = {
+        "intercept": np.full(n_images, np.nan),
+        "deviation": np.full(n_images, np.nan),
+        "slope": np.full(n_images, np.nan),
+    }
+
+    cos_psi = selection.expand(np.cos(hillas["psi"]))
+    sin_psi = selection.expand(np.sin(hillas["psi"]))
+    longi = (pix_x - selection.expand(hillas["x"])) * cos_psi + (
+        pix_y - selection.expand(hillas["y"])
+    ) * sin_psi
+    peak_time = peak_time.astype(np.float64)
+
+    for i in np.flatnonzero(np.isfinite(hillas["x"])):
+        start = selection.starts[i]
+        pixels = slice(start, start + selection.counts[i])
+        beta, _ = lts_linear_regression(x=longi[pixels], y=peak_time[pixels], samples=5)
+        timing["slope"][i] = beta[0]
+        timing["intercept"][i] = beta[1]
+        timing["deviation"][i] = rmse(
+            longi[pixels] * beta[0] + beta[1], peak_time[pixels]
+        )
+
+    return timing
+
+
+def image_parameters_batch(geom, images, masks, peak_times=None):
+    """
+    Calculate the image parameters for a stack of images of the same camera.
+
+    This computes the same parameters as the per-image functions
+    (`~ctapipe.image.hillas_parameters`, `~ctapipe.image.leakage_parameters`,
+    `~ctapipe.image.concentration_parameters`,
+    `~ctapipe.image.morphology_parameters`,
+    `~ctapipe.image.descriptive_statistics` and
+    `~ctapipe.image.timing_parameters`), but vectorized over all images at once
+    and without creating a container per image.
+    Results agree with the per-image functions within floating point precision.
+
+    Images that cannot be parameterized (no selected pixels or zero intensity)
+    result in nan values for the respective parameters.
+
+    Parameters
+    ----------
+    geom : ctapipe.instrument.CameraGeometry
+        Camera geometry of all images, in the camera or telescope frame.
+    images : np.ndarray
+        Images, shape (n_images, n_pixels)
+    masks : np.ndarray[bool]
+        Cleaning masks selecting the pixels to use, shape (n_images, n_pixels)
+    peak_times : np.ndarray or None
+        Peak times, shape (n_images, n_pixels).
+        If None, timing parameters and peak time statistics are not computed.
+
+    Returns
+    -------
+    parameters : astropy.table.Table
+        Table with one row per image. Column names are the same as used
+        for the DL1 parameter tables written by `~ctapipe.io.DataWriter`, e.g.
+        ``hillas_intensity`` or ``leakage_pixels_width_1``.
+    """
+    images = np.asanyarray(images)
+    masks = np.asanyarray(masks, dtype=bool)
+
+    if images.ndim != 2 or images.shape != masks.shape:
+        raise ValueError(
+            "images and masks must have the same shape (n_images, n_pixels),"
+            f" got {images.shape} and {masks.shape}"
+        )
+
+    if images.shape[1] != geom.n_pixels:
+        raise ValueError("Image and pixel shape do not match")
+
+    unit = geom.pix_x.unit
+    selection = _Selection.from_masks(masks)
+    pixels = selection.pixel_index
+    pix_x = geom.pix_x.to_value(unit)[pixels]
+    pix_y = geom.pix_y.to_value(unit)[pixels]
+    pixel_width = geom.pixel_width.to_value(unit)[pixels]
+
+    weights = images[masks].astype(np.float64)
+    hillas = _hillas_batch(selection, pix_x, pix_y, weights)
+    leakage = _leakage_batch(selection, geom, weights, hillas["intensity"])
+    concentration = _concentration_batch(
+        selection, pix_x, pix_y, pixel_width, weights, hillas
+    )
+    morphology = _morphology_batch(geom, masks)
+    intensity_statistics = _statistics_batch(selection, images[masks])
+
+    if unit.is_equivalent(u.m):
+        hillas_prefix = "camera_frame_hillas"
+        timing_prefix = "camera_frame_timing"
+        cog_names = {"x": "x", "y": "y"}
+    else:
+        hillas_prefix = "hillas"
+        timing_prefix = "timing"
+        cog_names = {"x": "fov_lon", "y": "fov_lat"}
+
+    hillas_units = {
+        "x": unit,
+        "y": unit,
+        "r": unit,
+        "phi": u.rad,
+        "length": unit,
+        "length_uncertainty": unit,
+        "width": unit,
+        "width_uncertainty": unit,
+        "psi": u.rad,
+    }
+
+    table = Table()
+    for key, value in hillas.items():
+        name = f"{hillas_prefix}_{cog_names.get(key, key)}"
+        if key in hillas_units:
+            value = u.Quantity(value, hillas_units[key])
+            # same units as used for writing the hillas containers
+            if value.unit == u.rad:
+                value = value.to(u.deg)
+        table[name] = value
+
+    if peak_times is not None:
+        peak_time = np.asanyarray(peak_times)[masks]
+        timing = _timing_batch(selection, pix_x, pix_y, peak_time, hillas)
+        table[f"{timing_prefix}_intercept"] = timing["intercept"]
+        table[f"{timing_prefix}_deviation"] = timing["deviation"]
+        table[f"{timing_prefix}_slope"] = u.Quantity(timing["slope"], 1 / unit)
+
+    groups = [
+        ("leakage", leakage),
+        ("concentration", concentration),
+        ("morphology", morphology),
+        ("intensity", intensity_statistics),
+    ]
+    if peak_times is not None:
+        groups.append(("peak_time", _statistics_batch(selection, peak_time)))
+
+    for prefix, values in groups:
+        for key, value in values.items():
+            table[f"{prefix}_{key}"] = value
+
+    return table
@@ -27,6 +27,7 @@ __all__ = [
 from abc import abstractmethod
 
 import numpy as np
+from numba import njit
 
 from ..core import TelescopeComponent
 from ..core.traits import (
@@ -61,7 +62,8 @@ def tailcuts_clean(
     geom: `ctapipe.instrument.CameraGeometry`
         Camera geometry information
     image: array
-        pixel values
+        pixel values, shape (n_pixels) or (n_images, n_pixels)
+        to clean several images of the same camera at once
     picture_thresh: float or array
         threshold above which all pixels are retained
     boundary_thresh: float or array
@@ -79,36 +81,19 @@ def tailcuts_clean(
     -------
     A boolean mask of *clean* pixels.
     """
-    pixels_above_picture = image >= picture_thresh
-
-    if keep_isolated_pixels or min_number_picture_neighbors == 0:
-        pixels_in_picture = pixels_above_picture
-    else:
-        # Require at least min_number_picture_neighbors. Otherwise, the pixel
-        #  is not selected
-        number_of_neighbors_above_picture = geom.neighbor_matrix_sparse.dot(
-            pixels_above_picture.view(np.byte)
-        )
-        pixels_in_picture = pixels_above_picture & (
-            number_of_neighbors_above_picture >= min_number_picture_neighbors
-        )
-
-    # by broadcasting together pixels_in_picture (1d) with the neighbor
-    # matrix (2d), we find all pixels that are above the boundary threshold
-    # AND have any neighbor that is in the picture
-    pixels_above_boundary = image >= boundary_thresh
-    pixels_with_picture_neighbors = geom.neighbor_matrix_sparse.dot(pixels_in_picture)
-    if keep_isolated_pixels:
-        return (
-            pixels_above_boundary & pixels_with_picture_neighbors
-        ) | pixels_in_picture
-    else:
-        pixels_with_boundary_neighbors = geom.neighbor_matrix_sparse.dot(
-            pixels_above_boundary
-        )
-        return (pixels_above_boundary & pixels_with_picture_neighbors) | (
-            pixels_in_picture & pixels_with_boundary_neighbors
-        )
+    shape, (pixels_above_picture, pixels_above_boundary) = _as_image_batch(
+        image >= picture_thresh, image >= boundary_thresh
+    )
+    indices, indptr = _neighbor_indices(geom, shape[-1])
+    mask = _tailcuts_clean_sparse_indices(
+        indices,
+        indptr,
+        pixels_above_picture,
+        pixels_above_boundary,
+        min_number_picture_neighbors,
+        keep_isolated_pixels,
+    )
+    return mask.reshape(shape)
 
 
 def mars_cleaning_1st_pass(
@@ -133,7 +118,8 @@ def mars_cleaning_1st_pass(
     geom: `ctapipe.instrument.CameraGeometry`
         Camera geometry information
     image: array
-        pixel values
+        pixel values, shape (n_pixels) or (n_images, n_pixels)
+        to clean several images of the same camera at once
     picture_thresh: float
         threshold above which all pixels are retained
     boundary_thresh: float
@@ -153,40 +139,23 @@ def mars_cleaning_1st_pass(
     A boolean mask of *clean* pixels.
     """
 
-    pixels_from_tailcuts_clean = tailcuts_clean(
-        geom,
-        image,
-        picture_thresh,
-        boundary_thresh,
-        keep_isolated_pixels,
+    # the first step is the same as `tailcuts_clean`, selecting core pixels and
+    # their first neighbors. Then, as the thresholds should be hierarchical
+    # from core to boundaries, the same boundary threshold is applied
+    # to the neighbors of the selected pixels.
+    shape, (pixels_above_picture, pixels_above_boundary) = _as_image_batch(
+        image >= picture_thresh, image >= boundary_thresh
+    )
+    indices, indptr = _neighbor_indices(geom, shape[-1])
+    mask = _mars_cleaning_1st_pass_sparse_indices(
+        indices,
+        indptr,
+        pixels_above_picture,
+        pixels_above_boundary,
         min_number_picture_neighbors,
-    )  # this selects any core pixel and any of its first neighbors
-
-    # At this point we don't know yet which ones should be kept.
-    # In principle, the pixel thresholds should be hierarchical from core to
-    # boundaries (this should be true for every type of particle triggering
-    # the image), so we can just check which pixels have more than
-    # boundary_thresh photo-electrons in the same image, but starting from
-    # the mask we got from 'tailcuts_clean'.
-
-    pixels_above_2nd_boundary = image >= boundary_thresh
-
-    # and now it's the same as the last part of 'tailcuts_clean', but without
-    # the core pixels, i.e. we start from the neighbors of the core pixels.
-    pixels_with_previous_neighbors = geom.neighbor_matrix_sparse.dot(
-        pixels_from_tailcuts_clean
+        keep_isolated_pixels,
     )
-    if keep_isolated_pixels:
-        return (
-            pixels_above_2nd_boundary & pixels_with_previous_neighbors
-        ) | pixels_from_tailcuts_clean
-    else:
-        pixels_with_2ndboundary_neighbors = geom.neighbor_matrix_sparse.dot(
-            pixels_above_2nd_boundary
-        )
-        return (pixels_above_2nd_boundary & pixels_with_previous_neighbors) | (
-            pixels_from_tailcuts_clean & pixels_with_2ndboundary_neighbors
-        )
+    return mask.reshape(shape)
 
 
 def dilate(geom, mask):
@@ -201,9 +170,12 @@ def dilate(geom, mask):
     geom: `~ctapipe.instrument.CameraGeometry`
         Camera geometry information
     mask: ndarray
-        input mask (array of booleans) to be dilated
+        input mask (array of booleans) to be dilated,
+        shape (n_pixels) or (n_images, n_pixels)
     """
-    return mask | geom.neighbor_matrix_sparse.dot(mask)
+    shape, (mask,) = _as_image_batch(mask)
+    indices, indptr = _neighbor_indices(geom, shape[-1])
+    return _dilate_sparse_indices(indices, indptr, mask).reshape(shape)
 
 
 def apply_time_delta_cleaning(
@@ -218,7 +190,8 @@ def apply_time_delta_cleaning(
     geom: `ctapipe.instrument.CameraGeometry`
         Camera geometry information
     mask: array, boolean
-        boolean mask of *clean* pixels before time_delta_cleaning
+        boolean mask of *clean* pixels before time_delta_cleaning,
+        shape (n_pixels) or (n_images, n_pixels)
     arrival_times: array
         pixel timing information
     min_number_neighbors: int
@@ -232,13 +205,17 @@ def apply_time_delta_cleaning(
 
     A boolean mask of *clean* pixels.
     """
-    pixels_to_keep = mask.copy()
-    time_diffs = np.abs(arrival_times[mask, None] - arrival_times)
-    # neighboring pixels arriving in the time limit and previously selected
-    valid_neighbors = (time_diffs < time_limit) & geom.neighbor_matrix[mask] & mask
-    enough_neighbors = np.count_nonzero(valid_neighbors, axis=1) >= min_number_neighbors
-    pixels_to_keep[pixels_to_keep] &= enough_neighbors
-    return pixels_to_keep
+    shape, (mask, arrival_times) = _as_image_batch(mask, arrival_times)
+    indices, indptr = _neighbor_indices(geom, shape[-1])
+    pixels_to_keep = _time_delta_cleaning_sparse_indices(
+        indices,
+        indptr,
+        mask,
+        arrival_times,
+        min_number_neighbors,
+        _time_limit(arrival_times, time_limit),
+    )
+    return pixels_to_keep.reshape(shape)
 
 
 def apply_time_average_cleaning(
@@ -313,7 +290,8 @@ def fact_image_cleaning(
     geom: `ctapipe.instrument.CameraGeometry`
         Camera geometry information
     image: array
-        pixel values
+        pixel values, shape (n_pixels) or (n_images, n_pixels)
+        to clean several images of the same camera at once
     arrival_times: array
         pixel timing information
     picture_threshold: float or array
@@ -337,41 +315,24 @@ def fact_image_cleaning(
 
     """
 
-    # Step 1
-    pixels_to_keep = image >= picture_threshold
-
-    # Step 2
-    number_of_neighbors_above_picture = geom.neighbor_matrix_sparse.dot(
-        (pixels_to_keep).view(np.byte)
+    shape, (
+        pixels_above_picture,
+        pixels_above_boundary,
+        arrival_times,
+    ) = _as_image_batch(
+        image >= picture_threshold, image >= boundary_threshold, arrival_times
     )
-    pixels_to_keep = pixels_to_keep & (
-        number_of_neighbors_above_picture >= min_number_neighbors
+    indices, indptr = _neighbor_indices(geom, shape[-1])
+    pixels_to_keep = _fact_image_cleaning_sparse_indices(
+        indices,
+        indptr,
+        pixels_above_picture,
+        pixels_above_boundary,
+        arrival_times,
+        min_number_neighbors,
+        _time_limit(arrival_times, time_limit),
     )
-
-    # Step 3
-    pixels_above_boundary = image >= boundary_threshold
-    pixels_to_keep = dilate(geom, pixels_to_keep) & pixels_above_boundary
-
-    # nothing else to do if min_number_neighbors <= 0
-    if min_number_neighbors <= 0:
-        return pixels_to_keep
-
-    # Step 4
-    pixels_to_keep = apply_time_delta_cleaning(
-        geom, pixels_to_keep, arrival_times, min_number_neighbors, time_limit
-    )
-
-    # Step 5
-    number_of_neighbors = geom.neighbor_matrix_sparse.dot(
-        (pixels_to_keep).view(np.byte)
-    )
-    pixels_to_keep = pixels_to_keep & (number_of_neighbors >= min_number_neighbors)
-
-    # Step 6
-    pixels_to_keep = apply_time_delta_cleaning(
-        geom, pixels_to_keep, arrival_times, min_number_neighbors, time_limit
-    )
-    return pixels_to_keep
+    return pixels_to_keep.reshape(shape)
 
 
 def time_constrained_clean(
@@ -399,7 +360,8 @@ def time_constrained_clean(
     geom: `ctapipe.instrument.CameraGeometry`
         Camera geometry information
     image: array
-        pixel values
+        pixel values, shape (n_pixels) or (n_images, n_pixels)
+        to clean several images of the same camera at once
     arrival_times: array
         pixel timing information
     picture_threshold: float or array
@@ -420,44 +382,377 @@ def time_constrained_clean(
     A boolean mask of *clean* pixels.
     """
 
-    # find core pixels that pass a picture threshold
-    pixels_above_picture = image >= picture_thresh
-
-    # require at least min_number_picture_neighbors
-    number_of_neighbors_above_picture = geom.neighbor_matrix_sparse.dot(
-        pixels_above_picture.view(np.byte)
+    shape, (
+        image,
+        pixels_above_picture,
+        pixels_above_boundary,
+        arrival_times,
+    ) = _as_image_batch(
+        image, image >= picture_thresh, image >= boundary_thresh, arrival_times
     )
-    pixels_in_picture = pixels_above_picture & (
-        number_of_neighbors_above_picture >= min_number_picture_neighbors
+    indices, indptr = _neighbor_indices(geom, shape[-1])
+
+    # find core pixels that pass a picture threshold
+    # and have at least min_number_picture_neighbors
+    pixels_in_picture = _select_with_neighbors_sparse_indices(
+        indices,
+        indptr,
+        pixels_above_picture,
+        min_number_picture_neighbors,
     )
 
     # keep core pixels whose arrival times are within a certain time limit of the average
-    mask_core = apply_time_average_cleaning(
-        geom, pixels_in_picture, image, arrival_times, picture_thresh, time_limit_core
-    )
+    if np.ndim(picture_thresh) > 0:
+        picture_thresh = np.broadcast_to(picture_thresh, shape).reshape(image.shape)
+    mask_core = np.empty(image.shape, dtype=bool)
+    for i in range(len(image)):
+        mask_core[i] = apply_time_average_cleaning(
+            geom,
+            pixels_in_picture[i],
+            image[i],
+            arrival_times[i],
+            picture_thresh[i] if np.ndim(picture_thresh) > 0 else picture_thresh,
+            time_limit_core,
+        )
 
-    # find boundary pixels that pass a boundary threshold
-    pixels_above_boundary = image >= boundary_thresh
-    pixels_with_picture_neighbors = geom.neighbor_matrix_sparse.dot(mask_core)
-    mask_boundary = (pixels_above_boundary & pixels_with_picture_neighbors) & np.invert(
-        mask_core
+    # add boundary pixels that pass a boundary threshold, and have enough
+    # neighboring core pixels within a time limit
+    mask = _time_constrained_boundary_sparse_indices(
+        indices,
+        indptr,
+        mask_core,
+        pixels_above_boundary,
+        arrival_times,
+        min_number_picture_neighbors,
+        _time_limit(arrival_times, time_limit_boundary),
     )
+    return mask.reshape(shape)
 
-    # keep boundary pixels whose arrival times are within a certain time limit of the neighboring core pixels
-    mask_boundary = mask_boundary.copy()
 
-    time_diffs = np.abs(arrival_times[mask_boundary, None] - arrival_times)
-    valid_neighbors = (
-        (time_diffs < time_limit_boundary)
-        & geom.neighbor_matrix[mask_boundary]
-        & mask_core
+def _as_image_batch(*arrays):
+    """
+    Broadcast per-pixel arrays to a common shape and reshape them
+    to (n_images, n_pixels). Returns the common shape and the reshaped arrays.
+    """
+    arrays = [np.asanyarray(array) for array in arrays]
+    shape = arrays[0].shape
+    if any(array.shape != shape for array in arrays):
+        arrays = np.broadcast_arrays(*arrays)
+        shape = arrays[0].shape
+    return shape, [array.reshape(-1, shape[-1]) for array in arrays]
+
+
+def _neighbor_indices(geom, n_pixels):
+    """
+    CSR ``indices`` and ``indptr`` of the neighbor matrix of ``geom``.
+
+    They are viewed as unsigned integers, so the compiled functions can
+    skip the handling of negative indices. ``n_pixels`` is the number of
+    pixels of the images, which has to match the geometry as the
+    compiled functions do not check the bounds.
+    """
+    if n_pixels != geom.n_pixels:
+        raise ValueError(
+            f"Images have {n_pixels} pixels, but {geom.name} has {geom.n_pixels}"
+        )
+    neighbors = geom.neighbor_matrix_sparse
+    return (
+        neighbors.indices.view(f"u{neighbors.indices.itemsize}"),
+        neighbors.indptr.view(f"u{neighbors.indptr.itemsize}"),
     )
-    enough_neighbors = (
-        np.count_nonzero(valid_neighbors, axis=1) >= min_number_picture_neighbors
+
+
+def _time_limit(arrival_times, time_limit):
+    """Time limit in the dtype numpy uses to compare time differences to it"""
+    return np.result_type(arrival_times, time_limit).type(time_limit)
+
+
+@njit(cache=True)
+def _count_neighbors(indices, indptr, pixel, mask):
+    """Number of neighbors of ``pixel`` in ``mask``"""
+    count = 0
+    for k in range(indptr[pixel], indptr[pixel + 1]):
+        count += mask[indices[k]]
+    return count
+
+
+@njit(cache=True)
+def _has_neighbor(indices, indptr, pixel, mask):
+    """If any neighbor of ``pixel`` is in ``mask``"""
+    for k in range(indptr[pixel], indptr[pixel + 1]):
+        if mask[indices[k]]:
+            return True
+    return False
+
+
+@njit(cache=True)
+def _select_with_neighbors(indices, indptr, mask, min_number_neighbors, out):
+    """Pixels of ``mask`` with at least ``min_number_neighbors`` neighbors in ``mask``"""
+    for pixel in range(mask.size):
+        out[pixel] = (
+            mask[pixel]
+            and _count_neighbors(indices, indptr, pixel, mask) >= min_number_neighbors
+        )
+
+
+@njit(cache=True)
+def _dilate(indices, indptr, mask, out):
+    for pixel in range(mask.size):
+        # branchless, as for the dilation most pixels have to be checked
+        dilated = mask[pixel]
+        for k in range(indptr[pixel], indptr[pixel + 1]):
+            dilated |= mask[indices[k]]
+        out[pixel] = dilated
+
+
+@njit(cache=True)
+def _add_boundary(indices, indptr, core, above_boundary, keep_isolated_pixels, out):
+    """
+    Pixels above the boundary threshold with a neighbor in ``core`` and
+    the ``core`` pixels with a neighbor above the boundary threshold
+    (all of them if ``keep_isolated_pixels``).
+    """
+    for pixel in range(core.size):
+        if above_boundary[pixel] and _has_neighbor(indices, indptr, pixel, core):
+            out[pixel] = True
+        elif core[pixel]:
+            out[pixel] = keep_isolated_pixels or _has_neighbor(
+                indices, indptr, pixel, above_boundary
+            )
+        else:
+            out[pixel] = False
+
+
+@njit(cache=True)
+def _tailcuts_clean_image(
+    indices,
+    indptr,
+    above_picture,
+    above_boundary,
+    min_number_picture_neighbors,
+    keep_isolated_pixels,
+    in_picture,
+    out,
+):
+    """`tailcuts_clean` of a single image, ``in_picture`` is used as buffer"""
+    if keep_isolated_pixels or min_number_picture_neighbors == 0:
+        in_picture[:] = above_picture
+    else:
+        _select_with_neighbors(
+            indices, indptr, above_picture, min_number_picture_neighbors, in_picture
+        )
+    _add_boundary(
+        indices, indptr, in_picture, above_boundary, keep_isolated_pixels, out
     )
-    mask_boundary[mask_boundary] &= enough_neighbors
 
-    return mask_core | mask_boundary
+
+@njit(cache=True)
+def _time_delta_cleaning(
+    indices, indptr, mask, arrival_times, min_number_neighbors, time_limit, out
+):
+    for pixel in range(mask.size):
+        if not mask[pixel]:
+            out[pixel] = False
+            continue
+
+        # neighboring pixels arriving in the time limit and previously selected
+        count = 0
+        for k in range(indptr[pixel], indptr[pixel + 1]):
+            neighbor = indices[k]
+            if (
+                mask[neighbor]
+                and abs(arrival_times[pixel] - arrival_times[neighbor]) < time_limit
+            ):
+                count += 1
+        out[pixel] = count >= min_number_neighbors
+
+
+@njit(cache=True)
+def _tailcuts_clean_sparse_indices(
+    indices,
+    indptr,
+    above_picture,
+    above_boundary,
+    min_number_picture_neighbors,
+    keep_isolated_pixels,
+):
+    n_images, n_pixels = above_picture.shape
+    masks = np.empty((n_images, n_pixels), dtype=np.bool_)
+    in_picture = np.empty(n_pixels, dtype=np.bool_)
+    for i in range(n_images):
+        _tailcuts_clean_image(
+            indices,
+            indptr,
+            above_picture[i],
+            above_boundary[i],
+            min_number_picture_neighbors,
+            keep_isolated_pixels,
+            in_picture,
+            masks[i],
+        )
+    return masks
+
+
+@njit(cache=True)
+def _mars_cleaning_1st_pass_sparse_indices(
+    indices,
+    indptr,
+    above_picture,
+    above_boundary,
+    min_number_picture_neighbors,
+    keep_isolated_pixels,
+):
+    n_images, n_pixels = above_picture.shape
+    masks = np.empty((n_images, n_pixels), dtype=np.bool_)
+    in_picture = np.empty(n_pixels, dtype=np.bool_)
+    tailcuts = np.empty(n_pixels, dtype=np.bool_)
+    for i in range(n_images):
+        _tailcuts_clean_image(
+            indices,
+            indptr,
+            above_picture[i],
+            above_boundary[i],
+            min_number_picture_neighbors,
+            keep_isolated_pixels,
+            in_picture,
+            tailcuts,
+        )
+        _add_boundary(
+            indices, indptr, tailcuts, above_boundary[i], keep_isolated_pixels, masks[i]
+        )
+    return masks
+
+
+@njit(cache=True)
+def _select_with_neighbors_sparse_indices(indices, indptr, masks, min_number_neighbors):
+    result = np.empty(masks.shape, dtype=np.bool_)
+    for i in range(len(masks)):
+        _select_with_neighbors(
+            indices, indptr, masks[i], min_number_neighbors, result[i]
+        )
+    return result
+
+
+@njit(cache=True)
+def _dilate_sparse_indices(indices, indptr, masks):
+    result = np.empty(masks.shape, dtype=np.bool_)
+    for i in range(len(masks)):
+        _dilate(indices, indptr, masks[i], result[i])
+    return result
+
+
+@njit(cache=True)
+def _time_delta_cleaning_sparse_indices(
+    indices, indptr, masks, arrival_times, min_number_neighbors, time_limit
+):
+    result = np.empty(masks.shape, dtype=np.bool_)
+    for i in range(len(masks)):
+        _time_delta_cleaning(
+            indices,
+            indptr,
+            masks[i],
+            arrival_times[i],
+            min_number_neighbors,
+            time_limit,
+            result[i],
+        )
+    return result
+
+
+@njit(cache=True)
+def _fact_image_cleaning_sparse_indices(
+    indices,
+    indptr,
+    above_picture,
+    above_boundary,
+    arrival_times,
+    min_number_neighbors,
+    time_limit,
+):
+    n_images, n_pixels = above_picture.shape
+    masks = np.empty((n_images, n_pixels), dtype=np.bool_)
+    buffer = np.empty(n_pixels, dtype=np.bool_)
+    for i in range(n_images):
+        mask = masks[i]
+
+        # Step 2
+        _select_with_neighbors(
+            indices, indptr, above_picture[i], min_number_neighbors, buffer
+        )
+
+        # Step 3
+        _dilate(indices, indptr, buffer, mask)
+        for pixel in range(n_pixels):
+            mask[pixel] = mask[pixel] and above_boundary[i, pixel]
+
+        # nothing else to do if min_number_neighbors <= 0
+        if min_number_neighbors <= 0:
+            continue
+
+        # Step 4
+        _time_delta_cleaning(
+            indices,
+            indptr,
+            mask,
+            arrival_times[i],
+            min_number_neighbors,
+            time_limit,
+            buffer,
+        )
+
+        # Step 5
+        _select_with_neighbors(indices, indptr, buffer, min_number_neighbors, mask)
+
+        # Step 6
+        _time_delta_cleaning(
+            indices,
+            indptr,
+            mask,
+            arrival_times[i],
+            min_number_neighbors,
+            time_limit,
+            buffer,
+        )
+        mask[:] = buffer
+    return masks
+
+
+@njit(cache=True)
+def _time_constrained_boundary_sparse_indices(
+    indices,
+    indptr,
+    mask_core,
+    above_boundary,
+    arrival_times,
+    min_number_picture_neighbors,
+    time_limit_boundary,
+):
+    """
+    Core pixels and boundary pixels with at least
+    min_number_picture_neighbors core neighbors within the time limit.
+    """
+    n_images, n_pixels = mask_core.shape
+    masks = np.empty((n_images, n_pixels), dtype=np.bool_)
+    for i in range(n_images):
+        core = mask_core[i]
+        times = arrival_times[i]
+        for pixel in range(n_pixels):
+            if core[pixel] or not above_boundary[i, pixel]:
+                masks[i, pixel] = core[pixel]
+                continue
+
+            has_core_neighbor = False
+            count = 0
+            for k in range(indptr[pixel], indptr[pixel + 1]):
+                neighbor = indices[k]
+                if core[neighbor]:
+                    has_core_neighbor = True
+                    if abs(times[pixel] - times[neighbor]) < time_limit_boundary:
+                        count += 1
+            masks[i, pixel] = (
+                has_core_neighbor and count >= min_number_picture_neighbors
+            )
+    return masks
 
 
 class ImageCleaner(TelescopeComponent):
@@ -466,6 +761,10 @@ class ImageCleaner(TelescopeComponent):
     ``ImageCleaner.from_name()`` to construct an instance of a particular algorithm
     """
 
+    #: If True, ``__call__`` also accepts images and arrival times of shape
+    #: (n_images, n_pixels) and cleans them at once, see `clean_batch`.
+    supports_batches = False
+
     @abstractmethod
     def __call__(
         self, tel_id: int, image: np.ndarray, arrival_times: np.ndarray = None
@@ -490,6 +789,53 @@ class ImageCleaner(TelescopeComponent):
         """
         pass
 
+    def clean_batch(
+        self, tel_id: int, images: np.ndarray, arrival_times: np.ndarray = None
+    ) -> np.ndarray:
+        """
+        Clean several images of the same telescope at once,
+        e.g. the images of a DL1 table.
+
+        The cleaning parameters of ``tel_id`` are used for all images, so
+        images of other telescopes with the same camera and configuration
+        can be cleaned together.
+
+        Parameters
+        ----------
+        tel_id: int
+            which telescope id in the subarray is being used (determines
+            which cut is used)
+        images : np.ndarray
+            image pixel data corresponding to the camera geometry,
+            shape (n_images, n_pixels)
+        arrival_times: np.ndarray
+            arrival times of the images, shape (n_images, n_pixels),
+            only used by cleaners using timing information
+
+        Returns
+        -------
+        np.ndarray
+            boolean masks of pixels passing cleaning, shape (n_images, n_pixels)
+        """
+        images = np.asanyarray(images)
+        if len(images) == 0:
+            return np.zeros(images.shape, dtype=bool)
+
+        if self.supports_batches:
+            masks = self(tel_id, images, arrival_times=arrival_times)
+            return np.asarray(masks, dtype=bool).reshape(images.shape)
+
+        return np.stack(
+            [
+                self(
+                    tel_id,
+                    image,
+                    arrival_times=None if arrival_times is None else arrival_times[i],
+                )
+                for i, image in enumerate(images)
+            ]
+        )
+
 
 class TailcutsImageCleaner(ImageCleaner):
     """
@@ -497,6 +843,8 @@ class TailcutsImageCleaner(ImageCleaner):
     `ctapipe.image.tailcuts_clean`
     """
 
+    supports_batches = True
+
     picture_threshold_pe = FloatTelescopeParameter(
         default_value=10.0, help="top-level threshold in photoelectrons"
     ).tag(config=True)
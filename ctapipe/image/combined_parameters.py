@@ -0,0 +1,233 @@
+"""
+Combined calculation of the leakage, concentration and intensity statistics
+of an image.
+"""
+from typing import NamedTuple
+
+import astropy.units as u
+import numpy as np
+from numba import njit
+
+from ..containers import (
+    CameraHillasParametersContainer,
+    ConcentrationContainer,
+    IntensityStatisticsContainer,
+    LeakageContainer,
+)
+
+__all__ = ["CameraPixels", "leakage_concentration_statistics"]
+
+
+class CameraPixels(NamedTuple):
+    """
+    Pixel information of a camera geometry needed by
+    `leakage_concentration_statistics`.
+
+    Create it once per camera using `CameraPixels.from_geometry`.
+    """
+
+    #: pixel x positions in ``unit``
+    pix_x: np.ndarray
+    #: pixel y positions in ``unit``
+    pix_y: np.ndarray
+    #: pixel widths in ``unit``
+    pixel_width: np.ndarray
+    #: 1 for pixels in the outermost ring of the camera, 2 for the second ring
+    #: and 0 for all other pixels,
+    #: see `~ctapipe.instrument.CameraGeometry.get_border_pixel_mask`
+    border_width: np.ndarray
+    #: unit of the pixel positions and widths
+    unit: u.Unit
+
+    @classmethod
+    def from_geometry(cls, geom):
+        """Precompute the pixel information of ``geom``"""
+        unit = geom.pix_x.unit
+        border_width = np.zeros(geom.n_pixels, dtype=np.int8)
+        border_width[geom.get_border_pixel_mask(2)] = 2
+        border_width[geom.get_border_pixel_mask(1)] = 1
+        return cls(
+            pix_x=geom.pix_x.to_value(unit).astype(np.float64),
+            pix_y=geom.pix_y.to_value(unit).astype(np.float64),
+            pixel_width=geom.pixel_width.to_value(unit).astype(np.float64),
+            border_width=border_width,
+            unit=unit,
+        )
+
+
+@njit(cache=True)
+def _leakage_concentration_statistics(
+    image, mask, pix_x, pix_y, pixel_width, border_width, x, y, psi, length, width
+):
+    """
+    Sums over the pixels selected by ``mask`` needed for the leakage,
+    concentration and statistics of the image.
+
+    Returns the number of pixels, the size, the maximum and minimum, the number
+    of pixels and intensity in the border of width 1 and 2, the intensity within
+    one pixel width around the cog and inside the hillas ellipse and the sums of
+    the second, third and fourth power of the deviation from the mean.
+    """
+    cos_psi = np.cos(psi)
+    sin_psi = np.sin(psi)
+    ellipse = width != 0
+
+    n = 0
+    size = 0.0
+    max_value = -np.inf
+    min_value = np.inf
+    n_border = np.zeros(2, dtype=np.int64)
+    intensity_border = np.zeros(2)
+    intensity_cog = 0.0
+    intensity_core = 0.0
+
+    for pixel in range(len(mask)):
+        if not mask[pixel]:
+            continue
+
+        value = np.float64(image[pixel])
+        n += 1
+        size += value
+        max_value = max(max_value, value)
+        min_value = min(min_value, value)
+
+        # a pixel in the outermost ring is also in the border of width 2
+        if border_width[pixel] == 1:
+            n_border[0] += 1
+            intensity_border[0] += value
+        if border_width[pixel] != 0:
+            n_border[1] += 1
+            intensity_border[1] += value
+
+        delta_x = pix_x[pixel] - x
+        delta_y = pix_y[pixel] - y
+        if delta_x**2 + delta_y**2 < pixel_width[pixel] ** 2:
+            intensity_cog += value
+
+        if ellipse:
+            longi = delta_x * cos_psi + delta_y * sin_psi
+            trans = -delta_x * sin_psi + delta_y * cos_psi
+            if longi**2 / length**2 + trans**2 / width**2 <= 1.0:
+                intensity_core += value
+
+    # second pass for the central moments, numerically more stable than
+    # using the sums of powers of the values
+    moments = np.zeros(3)
+    if n > 0:
+        mean = size / n
+        for pixel in range(len(mask)):
+            if mask[pixel]:
+                delta = image[pixel] - mean
+                moments[0] += delta**2
+                moments[1] += delta**3
+                moments[2] += delta**4
+
+    return (
+        n,
+        size,
+        max_value,
+        min_value,
+        n_border,
+        intensity_border,
+        intensity_cog,
+        intensity_core,
+        moments,
+    )
+
+
+def leakage_concentration_statistics(camera_pixels, image, mask, hillas_parameters):
+    """
+    Compute the leakage, concentration and intensity statistics of an image
+    in a single compiled function.
+
+    This gives the same results as `~ctapipe.image.leakage_parameters`,
+    `~ctapipe.image.concentration_parameters` and
+    `~ctapipe.image.descriptive_statistics` of the selected pixels,
+    but does not need the geometry of the selected pixels and
+    reuses the border masks and pixel positions precomputed for the camera.
+
+    Parameters
+    ----------
+    camera_pixels: CameraPixels
+        Pixel information of the camera geometry the hillas parameters
+        were computed with
+    image: array
+        pixel values of all camera pixels
+    mask: array, dtype=bool
+        The pixel that survived cleaning, e.g. tailcuts_clean
+    hillas_parameters: HillasParametersContainer or CameraHillasParametersContainer
+        hillas parameters of the selected pixels
+
+    Returns
+    -------
+    leakage: LeakageContainer
+    concentration: ConcentrationContainer
+    intensity_statistics: IntensityStatisticsContainer
+    """
+    h = hillas_parameters
+    unit = camera_pixels.unit
+    if isinstance(h, CameraHillasParametersContainer):
+        x, y = h.x.to_value(unit), h.y.to_value(unit)
+    else:
+        x, y = h.fov_lon.to_value(unit), h.fov_lat.to_value(unit)
+
+    (
+        n,
+        size,
+        max_value,
+        min_value,
+        n_border,
+        intensity_border,
+        intensity_cog,
+        intensity_core,
+        moments,
+    ) = _leakage_concentration_statistics(
+        image,
+        mask,
+        camera_pixels.pix_x,
+        camera_pixels.pix_y,
+        camera_pixels.pixel_width,
+        camera_pixels.border_width,
+        x,
+        y,
+        h.psi.to_value(u.rad),
+        h.length.to_value(unit),
+        h.width.to_value(unit),
+    )
+
+    # same types as computed by numpy for the single parameter functions
+    float_type = np.result_type(image.dtype, np.float32).type
+    n_pixels = len(camera_pixels.border_width)
+
+    leakage = LeakageContainer(
+        pixels_width_1=int(n_border[0]) / n_pixels,
+        pixels_width_2=int(n_border[1]) / n_pixels,
+        intensity_width_1=float_type(intensity_border[0]) / float_type(size),
+        intensity_width_2=float_type(intensity_border[1]) / float_type(size),
+    )
+
+    intensity = h.intensity
+    concentration = ConcentrationContainer(
+        cog=np.float64(intensity_cog) / intensity,
+        core=np.float64(intensity_core) / intensity if h.width.value != 0 else 0.0,
+        pixel=np.float64(max_value) / intensity,
+    )
+
+    mean = size / n
+    m2, m3, m4 = moments / n
+    std = np.sqrt(m2)
+    # skewness and kurtosis are nan for images with a single value
+    with np.errstate(invalid="ignore", divide="ignore"):
+        skewness = float(m3 / std**3)
+        kurtosis = float(m4 / std**4 - 3.0)
+
+    intensity_statistics = IntensityStatisticsContainer(
+        max=image.dtype.type(max_value),
+        min=image.dtype.type(min_value),
+        mean=float_type(mean),
+        std=float_type(std),
+        skewness=skewness,
+        kurtosis=kurtosis,
+    )
+
+    return leakage, concentration, intensity_statistics
@@ -25,8 +25,8 @@ from functools import lru_cache
 from typing import Tuple
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from numba import float32, float64, guvectorize, int64, njit, prange
-from scipy.ndimage import convolve1d
 from traitlets import Bool, Int
 
 from ctapipe.containers import DL1CameraContainer
@@ -36,13 +36,13 @@ from ctapipe.core.traits import (
     ComponentName,
     FloatTelescopeParameter,
     IntTelescopeParameter,
+    TelescopeParameter,
 )
 
-from .cleaning import tailcuts_clean
-from .hillas import camera_to_shower_coordinates, hillas_parameters
+from ..fitting import lts_linear_regression
+from .hillas import _hillas_moments
 from .invalid_pixels import InvalidPixelHandler
-from .morphology import brightest_island, number_of_islands
-from .timing import timing_parameters
+from .morphology import _n_islands_sparse_indices
 
 
 @guvectorize(
@@ -254,6 +254,26 @@ def neighbor_average_maximum(
     return peak_pos
 
 
+@njit(cache=True)
+def _neighbor_average_maximum_telescopes(
+    waveforms, neighbors_indices, neighbors_indptr, local_weight, broken_pixels
+):
+    """`neighbor_average_maximum` for waveforms of shape (n_tels, n_pix, n_samples)"""
+    n_telescopes, n_pixels, _ = waveforms.shape
+    peak_pos = np.empty((n_telescopes, n_pixels), dtype=np.int64)
+
+    for tel in range(n_telescopes):
+        peak_pos[tel] = neighbor_average_maximum(
+            waveforms[tel],
+            neighbors_indices,
+            neighbors_indptr,
+            local_weight,
+            broken_pixels[tel],
+        )
+
+    return peak_pos
+
+
 def subtract_baseline(waveforms, baseline_start, baseline_end):
     """
     Subtracts the waveform baseline, estimated as the mean waveform value
@@ -345,7 +365,155 @@ def integration_correction(
     return correction
 
 
+def _reference_pulse_key(readout):
+    """
+    Hashable snapshot of the reference pulse and sampling of ``readout``.
+
+    Used as key of the process-wide integration correction caches,
+    so that the caches do not depend on the identity of the (mutable)
+    `CameraReadout` instances.
+    """
+    pulse_shape = np.ascontiguousarray(readout.reference_pulse_shape)
+    return (
+        pulse_shape.dtype.str,
+        pulse_shape.shape,
+        pulse_shape.tobytes(),
+        readout.reference_pulse_sample_width.to_value("ns"),
+        (1 / readout.sampling_rate).to_value("ns"),
+    )
+
+
+def _reference_pulse_from_key(pulse_key):
+    """Inverse of ``_reference_pulse_key``"""
+    dtype, shape, data, reference_pulse_sample_width_ns, sample_width_ns = pulse_key
+    pulse_shape = np.frombuffer(data, dtype=dtype).reshape(shape)
+    return pulse_shape, reference_pulse_sample_width_ns, sample_width_ns
+
+
+@lru_cache(maxsize=None)
+def _integration_correction_table(pulse_key, window_width):
+    """
+    Integration correction for a window of ``window_width`` samples
+    for every possible position of the window on the sampled reference pulse.
+
+    The table is cached for the whole process, so it is computed only once for
+    all extractor instances and all telescopes sharing the same reference pulse
+    and sampling rate.
+
+    Parameters
+    ----------
+    pulse_key : tuple
+        Reference pulse and sampling as returned by ``_reference_pulse_key``
+    window_width : int
+        Width of the integration window (in units of n_samples)
+
+    Returns
+    -------
+    peak_sample : ndarray
+        Sample of the maximum of the sampled reference pulse of each channel
+    table : ndarray
+        Correction for a window starting at each sample of the
+        sampled reference pulse, shape (n_channels, n_samples + 1).
+        The last column is 1 for windows starting after the pulse.
+    """
+    (
+        reference_pulse_shape,
+        reference_pulse_sample_width_ns,
+        sample_width_ns,
+    ) = _reference_pulse_from_key(pulse_key)
+
+    # same sampling of the reference pulse as in integration_correction
+    sampled_pulses = []
+    for pulse_shape in reference_pulse_shape:
+        pulse_max_sample = pulse_shape.size * reference_pulse_sample_width_ns
+        pulse_shape_x = np.arange(0, pulse_max_sample, reference_pulse_sample_width_ns)
+        sampled_edges = np.arange(0, pulse_max_sample, sample_width_ns)
+
+        sampled_pulse, _ = np.histogram(
+            pulse_shape_x, sampled_edges, weights=pulse_shape, density=True
+        )
+        sampled_pulses.append(sampled_pulse)
+
+    n_channels = len(sampled_pulses)
+    n_samples = max((p.size for p in sampled_pulses), default=0)
+
+    peak_sample = np.zeros(n_channels, dtype=np.int64)
+    table = np.ones((n_channels, n_samples + 1), dtype=np.float64)
+    for ichannel, sampled_pulse in enumerate(sampled_pulses):
+        n = sampled_pulse.size
+        if n == 0:
+            continue
+
+        peak_sample[ichannel] = sampled_pulse.argmax()
+        if window_width <= 0:
+            continue
+
+        integration = sampled_pulse * sample_width_ns
+        sums = np.empty(n)
+        # windows fully contained in the pulse, all at once
+        n_full = max(n - window_width + 1, 0)
+        if n_full > 0:
+            window_view = sliding_window_view(integration, window_width)
+            sums[:n_full] = window_view.sum(axis=-1)
+        # windows truncated at the end of the pulse
+        for start in range(n_full, n):
+            sums[start] = np.sum(integration[start:])
+
+        with np.errstate(divide="ignore"):
+            table[ichannel, :n] = 1.0 / sums
+
+    peak_sample.flags.writeable = False
+    table.flags.writeable = False
+    return peak_sample, table
+
+
+@lru_cache(maxsize=4096)
+def _cached_integration_correction(pulse_key, window_width, window_shift):
+    """
+    Process-wide cached equivalent of `integration_correction`.
+
+    Looks up the correction in the table of all window positions
+    computed by ``_integration_correction_table``.
+    The returned array is read-only, as it is shared between all callers.
+    """
+    peak_sample, table = _integration_correction_table(pulse_key, window_width)
+    start = np.clip(peak_sample - window_shift, 0, table.shape[1] - 1)
+    correction = table[np.arange(len(table)), start]
+    correction.flags.writeable = False
+    return correction
+
+
+@lru_cache(maxsize=4096)
+def _cached_sliding_window_correction(pulse_key, width_shape):
+    """
+    Process-wide cached integration correction of `SlidingWindowMaxSum`
+    for a window of ``width_shape`` samples of the reference pulse.
+
+    The returned array is read-only, as it is shared between all callers.
+    """
+    reference_pulse_shape, _, _ = _reference_pulse_from_key(pulse_key)
+
+    n_channels = len(reference_pulse_shape)
+    correction = np.ones(n_channels, dtype=np.float64)
+    for ichannel, pulse_shape in enumerate(reference_pulse_shape):
+
+        # apply the same method as sliding window to find the highest sum
+        cwf = np.cumsum(pulse_shape)
+        # add zero at the begining so it is easier to substract the two arrays later
+        cwf = np.concatenate((np.zeros(1), cwf))
+        sums = cwf[width_shape:] - cwf[:-width_shape]
+        maxsum = np.max(sums)
+        correction[ichannel] = np.sum(pulse_shape) / maxsum
+
+    correction.flags.writeable = False
+    return correction
+
+
 class ImageExtractor(TelescopeComponent):
+    #: If True, ``__call__`` also accepts the waveforms of several telescopes,
+    #: stacked to shape (n_telescopes, n_pix, n_samples), see `batch_key`.
+    supports_batches = False
+
     def __init__(self, subarray, config=None, parent=None, **kwargs):
         """
         Base component to handle the extraction of charge and pulse time
@@ -379,6 +547,18 @@ class ImageExtractor(TelescopeComponent):
             for tel_id, telescope in subarray.tel.items()
         }
 
+        # used in batch_key, hashing cameras is too expensive to do per event
+        cameras = {}
+        self._camera_index = {
+            tel_id: cameras.setdefault(telescope.camera, len(cameras))
+            for tel_id, telescope in subarray.tel.items()
+        }
+        self._telescope_parameters = [
+            name
+            for name, trait in self.traits(config=True).items()
+            if isinstance(trait, TelescopeParameter)
+        ]
+
     @abstractmethod
     def __call__(
         self, waveforms, tel_id, selected_gain_channel, broken_pixels
@@ -406,12 +586,41 @@ class ImageExtractor(TelescopeComponent):
             extracted images and validity flags
         """
 
+    def batch_key(self, tel_id):
+        """
+        Key identifying the telescopes that can be extracted together.
+
+        For extractors with ``supports_batches``, the waveforms of telescopes
+        with the same key (and of the same shape) can be stacked and passed
+        to ``__call__`` at once, with any of these telescopes as ``tel_id``,
+        giving the same result as extracting them one by one.
+        ``selected_gain_channel`` and ``broken_pixels`` then have shape
+        (n_telescopes, n_pix).
+
+        Parameters
+        ----------
+        tel_id : int
+            The telescope id
+
+        Returns
+        -------
+        key : tuple
+            Index of the camera type of the telescope and the values of
+            all telescope parameters for this telescope
+        """
+        parameters = tuple(
+            getattr(self, name).tel[tel_id] for name in self._telescope_parameters
+        )
+        return (self._camera_index[tel_id], parameters)
+
 
 class FullWaveformSum(ImageExtractor):
     """
     Extractor that sums the entire waveform.
     """
 
+    supports_batches = True
+
     def __call__(
         self, waveforms, tel_id, selected_gain_channel, broken_pixels
     ) -> DL1CameraContainer:
@@ -426,6 +635,8 @@ class FixedWindowSum(ImageExtractor):
     Extractor that sums within a fixed window defined by the user.
     """
 
+    supports_batches = True
+
     peak_index = IntTelescopeParameter(
         default_value=0, help="Manually select index where the peak is located"
     ).tag(config=True)
@@ -449,7 +660,8 @@ class FixedWindowSum(ImageExtractor):
         returned would equal 1 for a noise-less unit pulse.
 
         This method is decorated with @lru_cache to ensure it is only
-        calculated once per telescope.
+        looked up once per telescope, the correction itself is cached for
+        the whole process and shared by all telescopes with the same reference pulse.
 
         Parameters
         ----------
@@ -462,11 +674,8 @@ class FixedWindowSum(ImageExtractor):
         Has size n_channels, as a different correction value might be required
         for different gain channels.
         """
-        readout = self.subarray.tel[tel_id].camera.readout
-        return integration_correction(
-            readout.reference_pulse_shape,
-            readout.reference_pulse_sample_width.to_value("ns"),
-            (1 / readout.sampling_rate).to_value("ns"),
+        return _cached_integration_correction(
+            _reference_pulse_key(self.subarray.tel[tel_id].camera.readout),
             self.window_width.tel[tel_id],
             self.window_shift.tel[tel_id],
         )
@@ -528,7 +737,8 @@ class GlobalPeakWindowSum(ImageExtractor):
         returned would equal 1 for a noise-less unit pulse.
 
         This method is decorated with @lru_cache to ensure it is only
-        calculated once per telescope.
+        looked up once per telescope, the correction itself is cached for
+        the whole process and shared by all telescopes with the same reference pulse.
 
         Parameters
         ----------
@@ -541,11 +751,8 @@ class GlobalPeakWindowSum(ImageExtractor):
         Has size n_channels, as a different correction value might be required
         for different gain channels.
         """
-        readout = self.subarray.tel[tel_id].camera.readout
-        return integration_correction(
-            readout.reference_pulse_shape,
-            readout.reference_pulse_sample_width.to_value("ns"),
-            (1 / readout.sampling_rate).to_value("ns"),
+        return _cached_integration_correction(
+            _reference_pulse_key(self.subarray.tel[tel_id].camera.readout),
             self.window_width.tel[tel_id],
             self.window_shift.tel[tel_id],
         )
@@ -583,6 +790,8 @@ class LocalPeakWindowSum(ImageExtractor):
     peak in each pixel's waveform.
     """
 
+    supports_batches = True
+
     window_width = IntTelescopeParameter(
         default_value=7, help="Define the width of the integration window"
     ).tag(config=True)
@@ -604,7 +813,8 @@ class LocalPeakWindowSum(ImageExtractor):
         returned would equal 1 for a noise-less unit pulse.
 
         This method is decorated with @lru_cache to ensure it is only
-        calculated once per telescope.
+        looked up once per telescope, the correction itself is cached for
+        the whole process and shared by all telescopes with the same reference pulse.
 
         Parameters
         ----------
@@ -617,11 +827,8 @@ class LocalPeakWindowSum(ImageExtractor):
         Has size n_channels, as a different correction value might be required
         for different gain channels.
         """
-        readout = self.subarray.tel[tel_id].camera.readout
-        return integration_correction(
-            readout.reference_pulse_shape,
-            readout.reference_pulse_sample_width.to_value("ns"),
-            (1 / readout.sampling_rate).to_value("ns"),
+        return _cached_integration_correction(
+            _reference_pulse_key(self.subarray.tel[tel_id].camera.readout),
             self.window_width.tel[tel_id],
             self.window_shift.tel[tel_id],
         )
@@ -647,6 +854,8 @@ class SlidingWindowMaxSum(ImageExtractor):
     Sliding window extractor that maximizes the signal in window_width consecutive slices.
     """
 
+    supports_batches = True
+
     window_width = IntTelescopeParameter(
         default_value=7, help="Define the width of the integration window"
     ).tag(config=True)
@@ -662,7 +871,8 @@ class SlidingWindowMaxSum(ImageExtractor):
         returned would equal 1 for a noise-less unit pulse.
 
         This method is decorated with @lru_cache to ensure it is only
-        calculated once per telescope.
+        looked up once per telescope, the correction itself is cached for
+        the whole process and shared by all telescopes with the same reference pulse.
 
         The same procedure as for the actual SlidingWindowMaxSum extractor is used, but
         on the reference pulse_shape (that is also more finely binned)
@@ -678,7 +888,6 @@ class SlidingWindowMaxSum(ImageExtractor):
         Has size n_channels, as a different correction value might be required
         for different gain channels.
         """
-
         readout = self.subarray.tel[tel_id].camera.readout
 
         # compute the number of slices to integrate in the pulse template
@@ -693,20 +902,9 @@ class SlidingWindowMaxSum(ImageExtractor):
                 .value
             )
         )
-
-        n_channels = len(readout.reference_pulse_shape)
-        correction = np.ones(n_channels, dtype=np.float64)
-        for ichannel, pulse_shape in enumerate(readout.reference_pulse_shape):
-
-            # apply the same method as sliding window to find the highest sum
-            cwf = np.cumsum(pulse_shape)
-            # add zero at the begining so it is easier to substract the two arrays later
-            cwf = np.concatenate((np.zeros(1), cwf))
-            sums = cwf[width_shape:] - cwf[:-width_shape]
-            maxsum = np.max(sums)
-            correction[ichannel] = np.sum(pulse_shape) / maxsum
-
-        return correction
+        return _cached_sliding_window_correction(
+            _reference_pulse_key(readout), width_shape
+        )
 
     def __call__(
         self, waveforms, tel_id, selected_gain_channel, broken_pixels
@@ -725,6 +923,8 @@ class NeighborPeakWindowSum(ImageExtractor):
     peak defined by the wavefroms in neighboring pixels.
     """
 
+    supports_batches = True
+
     window_width = IntTelescopeParameter(
         default_value=7, help="Define the width of the integration window"
     ).tag(config=True)
@@ -752,7 +952,8 @@ class NeighborPeakWindowSum(ImageExtractor):
         returned would equal 1 for a noise-less unit pulse.
 
         This method is decorated with @lru_cache to ensure it is only
-        calculated once per telescope.
+        looked up once per telescope, the correction itself is cached for
+        the whole process and shared by all telescopes with the same reference pulse.
 
         Parameters
         ----------
@@ -765,11 +966,8 @@ class NeighborPeakWindowSum(ImageExtractor):
         Has size n_channels, as a different correction value might be required
         for different gain channels.
         """
-        readout = self.subarray.tel[tel_id].camera.readout
-        return integration_correction(
-            readout.reference_pulse_shape,
-            readout.reference_pulse_sample_width.to_value("ns"),
-            (1 / readout.sampling_rate).to_value("ns"),
+        return _cached_integration_correction(
+            _reference_pulse_key(self.subarray.tel[tel_id].camera.readout),
             self.window_width.tel[tel_id],
             self.window_shift.tel[tel_id],
         )
@@ -778,7 +976,12 @@ class NeighborPeakWindowSum(ImageExtractor):
         self, waveforms, tel_id, selected_gain_channel, broken_pixels
     ) -> DL1CameraContainer:
         neighbors = self.subarray.tel[tel_id].camera.geometry.neighbor_matrix_sparse
-        peak_index = neighbor_average_maximum(
+        if waveforms.ndim == 3:
+            find_peak = _neighbor_average_maximum_telescopes
+        else:
+            find_peak = neighbor_average_maximum
+
+        peak_index = find_peak(
             waveforms,
             neighbors_indices=neighbors.indices,
             neighbors_indptr=neighbors.indptr,
@@ -819,6 +1022,195 @@ class BaselineSubtractedNeighborPeakWindowSum(NeighborPeakWindowSum):
         )
 
 
+@njit(cache=True)
+def _extract_window(waveform, peak_index, width, shift, sampling_rate_ghz):
+    """`extract_around_peak` for a single pixel, callable from compiled code"""
+    n_samples = waveform.size
+    start = max(0, peak_index - shift)
+    end = min(peak_index - shift + width, n_samples)
+
+    i_sum = float64(0.0)
+    time_num = float64(0.0)
+    time_den = float64(0.0)
+
+    for isample in range(start, end):
+        i_sum += waveform[isample]
+        if waveform[isample] > 0:
+            time_num += waveform[isample] * isample
+            time_den += waveform[isample]
+
+    # rounding to float32 in the same steps as extract_around_peak
+    peak_time = float32(time_num / time_den if time_den > 0 else peak_index)
+    return float32(i_sum), float32(peak_time / sampling_rate_ghz)
+
+
+@njit(cache=True)
+def _two_pass_first_pass(waveforms, sampling_rate_ghz):
+    """
+    First pass of `TwoPassWindowSum`: integrate a 5 sample window
+    around the maximum of a 3 sample sliding window sum.
+    """
+    n_pixels, n_samples = waveforms.shape
+    charge = np.empty(n_pixels, dtype=np.float32)
+    peak_time = np.empty(n_pixels, dtype=np.float32)
+    sums = np.empty(n_samples - 4, dtype=waveforms.dtype)
+
+    for pixel in range(n_pixels):
+        waveform = waveforms[pixel]
+
+        # sum in the same order as scipy.ndimage.convolve1d,
+        # staying 2 samples away from the edges of the readout window
+        for sample in range(2, n_samples - 2):
+            sums[sample - 2] = float64(waveform[sample]) + (
+                float64(waveform[sample - 1]) + float64(waveform[sample + 1])
+            )
+        peak_index = np.argmax(sums) + 2
+
+        charge[pixel], peak_time[pixel] = _extract_window(
+            waveform, peak_index, 5, 2, sampling_rate_ghz
+        )
+
+    return charge, peak_time
+
+
+@njit(cache=True)
+def _two_pass_main_island(
+    charge, neighbors_indices, neighbors_indptr, pix_x, pix_y, core_threshold
+):
+    """
+    Tailcuts cleaning with at least one picture neighbor and without isolated
+    pixels, followed by the selection of the brightest island.
+
+    Returns the mask of the brightest island and the hillas cog and psi
+    of the island, which are nan if it has less than 3 pixels.
+    """
+    n_pixels = len(charge)
+    indices = neighbors_indices
+    indptr = neighbors_indptr
+
+    above_picture = charge >= core_threshold
+    above_boundary = charge >= core_threshold / 2
+
+    in_picture = np.zeros(n_pixels, dtype=np.bool_)
+    for pixel in range(n_pixels):
+        if above_picture[pixel]:
+            for neighbor in indices[indptr[pixel] : indptr[pixel + 1]]:
+                if above_picture[neighbor]:
+                    in_picture[pixel] = True
+                    break
+
+    mask = np.zeros(n_pixels, dtype=np.bool_)
+    for pixel in range(n_pixels):
+        picture_neighbor = False
+        boundary_neighbor = False
+        for neighbor in indices[indptr[pixel] : indptr[pixel + 1]]:
+            picture_neighbor |= in_picture[neighbor]
+            boundary_neighbor |= above_boundary[neighbor]
+
+        mask[pixel] = (above_boundary[pixel] and picture_neighbor) or (
+            in_picture[pixel] and boundary_neighbor
+        )
+
+    n_islands, labels = _n_islands_sparse_indices(indices, indptr, mask)
+    if n_islands > 0:
+        brightness = np.zeros(n_islands + 1)
+        for pixel in range(n_pixels):
+            if labels[pixel] > 0:
+                brightness[labels[pixel]] += charge[pixel]
+        mask = labels == np.argmax(brightness)
+
+    if np.count_nonzero(mask) < 3:
+        return mask, np.nan, np.nan, np.nan
+
+    hillas = _hillas_moments(pix_x[mask], pix_y[mask], charge[mask])
+    return mask, hillas[1], hillas[2], hillas[9]
+
+
+@njit(cache=True)
+def _two_pass_second_pass(
+    waveforms,
+    selected_gain_channel,
+    charge_1stpass,
+    pulse_time_1stpass,
+    mask_main_island,
+    core_threshold,
+    pix_x,
+    pix_y,
+    cog_x,
+    cog_y,
+    cos_psi,
+    sin_psi,
+    sampling_rate_ghz,
+    corrections,
+):
+    """
+    Second pass of `TwoPassWindowSum`: fit the pulse times of the main island
+    along the shower axis and integrate all pixels except the core pixels of the
+    main island again around the predicted time.
+
+    ``corrections`` are the integration corrections for the default 5 sample
+    window, and the windows at the start and end of the readout, shape (3, n_channels).
+    Returns None if the time fit failed.
+    """
+    n_pixels, n_samples = waveforms.shape
+
+    n_main = np.count_nonzero(mask_main_island)
+    longitude = np.empty(n_main)
+    peak_time = np.empty(n_main)
+    i = 0
+    for pixel in range(n_pixels):
+        if mask_main_island[pixel]:
+            delta_x = pix_x[pixel] - cog_x
+            delta_y = pix_y[pixel] - cog_y
+            longitude[i] = delta_x * cos_psi + delta_y * sin_psi
+            peak_time[i] = pulse_time_1stpass[pixel]
+            i += 1
+
+    beta, _ = lts_linear_regression(longitude, peak_time, 5)
+    if np.isnan(beta[0]):
+        return None
+
+    charge = charge_1stpass.copy()
+    pulse_time = pulse_time_1stpass.copy()
+
+    for pixel in range(n_pixels):
+        # core pixels of the main island keep the first pass values
+        if mask_main_island[pixel] and not charge_1stpass[pixel] < core_threshold:
+            continue
+
+        delta_x = pix_x[pixel] - cog_x
+        delta_y = pix_y[pixel] - cog_y
+        predicted_time = beta[0] * (delta_x * cos_psi + delta_y * sin_psi) + beta[1]
+        predicted_peak = np.int64(np.rint(predicted_time * sampling_rate_ghz))
+
+        # a 5 sample window around the peak, or the first / last 5 samples
+        # if this window would not be inside the readout window
+        window = 0
+        width = 5
+        shift = 2
+        if predicted_peak - 2 < 0:
+            window = 1
+            width = 5
+            shift = 0
+        if predicted_peak + 3 > n_samples - 1:
+            window = 2
+            width = 6
+            shift = 4
+
+        if predicted_peak < 2:
+            predicted_peak = 0
+        if predicted_peak > n_samples - 3:
+            predicted_peak = n_samples - 1
+
+        reintegrated_charge, pulse_time[pixel] = _extract_window(
+            waveforms[pixel], predicted_peak, width, shift, sampling_rate_ghz
+        )
+        correction = corrections[window, selected_gain_channel[pixel]]
+        charge[pixel] = float32(reintegrated_charge * correction)
+
+    return charge, pulse_time
+
+
 class TwoPassWindowSum(ImageExtractor):
     """Extractor based on [1]_ which integrates the waveform a second time using
     a time-gradient linear fit. This is in particular the version implemented
@@ -920,16 +1312,42 @@ class TwoPassWindowSum(ImageExtractor):
             Value of the pixel-wise gain-selected integration correction.
 
         """
-        readout = self.subarray.tel[tel_id].camera.readout
-        # Calculate correction of first pixel for both channels
-        return integration_correction(
-            readout.reference_pulse_shape,
-            readout.reference_pulse_sample_width.to_value("ns"),
-            (1 / readout.sampling_rate).to_value("ns"),
-            width,
-            shift,
+        return _cached_integration_correction(
+            _reference_pulse_key(self.subarray.tel[tel_id].camera.readout), width, shift
         )
 
+    @lru_cache(maxsize=128)
+    def _calculate_second_pass_corrections(self, tel_id):
+        """
+        Integration corrections of the three windows used in the second pass.
+
+        Parameters
+        ----------
+        tel_id : int
+            Index of the telescope in use.
+
+        Returns
+        -------
+        corrections : ndarray
+            Read-only corrections of shape (3, n_channels) for the windows
+            (width, shift) = (5, 2), (5, 0) and (6, 4), or ones if the
+            integration correction is disabled for this telescope.
+        """
+        if self.apply_integration_correction.tel[tel_id]:
+            corrections = np.stack(
+                [
+                    self._calculate_correction(tel_id, 5, 2),
+                    self._calculate_correction(tel_id, 5, 0),
+                    self._calculate_correction(tel_id, 6, 4),
+                ]
+            )
+        else:
+            n_channels = self.subarray.tel[tel_id].camera.readout.n_channels
+            corrections = np.ones((3, n_channels))
+
+        corrections.flags.writeable = False
+        return corrections
+
     def _apply_first_pass(
         self, waveforms, tel_id
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
@@ -954,48 +1372,16 @@ class TwoPassWindowSum(ImageExtractor):
         correction : ndarray
             pixel-wise integration correction
         """
-        # STEP 1
-
-        # Starting from DL0, the channel is already selected (if more than one)
-        # event.dl0.tel[tel_id].waveform object has shape (N_pixels, N_samples)
-
-        # For each pixel, we slide a 3-samples window through the
-        # waveform summing each time the ADC counts contained within it.
-
-        peak_search_window_width = 3
-        sums = convolve1d(
-            waveforms, np.ones(peak_search_window_width), axis=1, mode="nearest"
-        )
-        # 'sums' has now still shape of (N_pixels, N_samples)
-        # each element is the center-sample of each 3-samples sliding window
-
-        # For each pixel, we check where the peak search window encountered
-        # the maximum number of ADC counts.
-        # We want to stop before the edge of the readout window in order to
-        # later extend the search window to a 1+3+1 integration window.
-        # Since in 'sums' the peak index corresponds to the center of the
-        # search window, we shift it on the right by 2 samples so to get the
-        # correspondent sample index in each waveform.
-        peak_index = np.argmax(sums[:, 2:-2], axis=1) + 2
-        # Now peak_index has the shape of (N_pixels).
-
-        # The final 5-samples window will be 1+3+1, centered on the 3-samples
-        # window in which the highest amount of ADC counts has been found
-        window_width = peak_search_window_width + 2
-        window_shift = 2
-
-        # this function is applied to all pixels together
-        charge_1stpass, pulse_time_1stpass = extract_around_peak(
-            waveforms,
-            peak_index,
-            window_width,
-            window_shift,
-            self.sampling_rate_ghz[tel_id],
+        # For each pixel, we slide a 3-samples window through the waveform,
+        # stopping before the edges of the readout window so that it can be
+        # extended to a 1+3+1 integration window around the maximum.
+        charge_1stpass, pulse_time_1stpass = _two_pass_first_pass(
+            waveforms, self.sampling_rate_ghz[tel_id]
         )
 
         # Get integration correction factors
         if self.apply_integration_correction.tel[tel_id]:
-            correction = self._calculate_correction(tel_id, window_width, window_shift)
+            correction = self._calculate_correction(tel_id, 5, 2)
         else:
             correction = np.ones(waveforms.shape[0])
 
@@ -1051,7 +1437,7 @@ class TwoPassWindowSum(ImageExtractor):
         # Apply correction to 1st pass charges
         charge_1stpass = charge_1stpass_uncorrected * correction[selected_gain_channel]
 
-        camera_geometry = self.subarray.tel[tel_id].camera.geometry
+        camera = self.subarray.tel[tel_id].camera
         if self.invalid_pixel_handler is not None:
             charge_1stpass, pulse_time_1stpass = self.invalid_pixel_handler(
                 tel_id,
@@ -1060,201 +1446,56 @@ class TwoPassWindowSum(ImageExtractor):
                 broken_pixels,
             )
 
-        # Set thresholds for core-pixels depending on telescope
+        # Set thresholds for core-pixels depending on telescope,
+        # boundary thresholds are half of core thresholds.
         core_th = self.core_threshold.tel[tel_id]
-        # Boundary thresholds will be half of core thresholds.
-
-        # Preliminary image cleaning with simple two-level tail-cut
-        mask_clean = tailcuts_clean(
-            camera_geometry,
-            charge_1stpass,
-            picture_thresh=core_th,
-            boundary_thresh=core_th / 2,
-            keep_isolated_pixels=False,
-            min_number_picture_neighbors=1,
-        )
 
         # STEP 3
-
-        # find all islands using this cleaning
-        n_islands, labels = number_of_islands(camera_geometry, mask_clean)
-
-        if n_islands > 0:
-            # ...find the brightest one
-            mask_brightest_island = brightest_island(n_islands, labels, charge_1stpass)
-        else:
-            mask_brightest_island = mask_clean
-
-        # for all pixels except the core ones in the main island of the
-        # preliminary image, the waveform will be integrated once more (2nd pass)
-
-        mask_2nd_pass = ~mask_brightest_island | (
-            mask_brightest_island & (charge_1stpass < core_th)
+        # Preliminary image cleaning and selection of the brightest island,
+        # parametrized if it has at least 3 pixels
+        neighbors = camera.geometry.neighbor_matrix_sparse
+        pix_x = camera.geometry.pix_x.value
+        pix_y = camera.geometry.pix_y.value
+        mask_main_island, cog_x, cog_y, psi = _two_pass_main_island(
+            charge_1stpass, neighbors.indices, neighbors.indptr, pix_x, pix_y, core_th
         )
 
         # STEP 4
-
         # if the resulting image has less then 3 pixels
-        if np.count_nonzero(mask_brightest_island) < 3:
+        if np.isnan(psi):
             # we return the 1st pass information
             return charge_1stpass, pulse_time_1stpass, False
 
-        # otherwise we proceed by parametrizing the image
-        camera_geometry_brightest = camera_geometry[mask_brightest_island]
-        charge_brightest = charge_1stpass[mask_brightest_island]
-        hillas = hillas_parameters(camera_geometry_brightest, charge_brightest)
-
-        # STEP 5
-
-        # linear fit of pulse time vs. distance along major image axis
-        # using only the main island surviving the preliminary
-        # image cleaning
-        timing = timing_parameters(
-            geom=camera_geometry_brightest,
-            image=charge_brightest,
-            peak_time=pulse_time_1stpass[mask_brightest_island],
-            hillas_parameters=hillas,
-        )
-
-        # If the fit returns nan
-        if np.isnan(timing.slope):
-            return charge_1stpass, pulse_time_1stpass, False
-
-        # get projected distances along main image axis
-        longitude, _ = camera_to_shower_coordinates(
-            camera_geometry.pix_x, camera_geometry.pix_y, hillas.x, hillas.y, hillas.psi
-        )
-
-        # get the predicted times as a linear relation
-        predicted_pulse_times = (
-            timing.slope * longitude[mask_2nd_pass] + timing.intercept
-        )
-
-        # Convert time in ns to sample index using the sampling rate from
-        # the readout.
-        # Approximate the value obtained to nearest integer, then cast to
-        # int64 otherwise 'extract_around_peak' complains.
-
-        predicted_peaks = np.rint(
-            predicted_pulse_times.value * self.sampling_rate_ghz[tel_id]
-        ).astype(np.int64)
-
-        # Due to the fit these peak indexes can lead to an integration window
-        # outside the readout window, so in the next step we check for this.
-
-        # STEP 6
-
-        # select all pixels except the core ones in the main island
-        waveforms_to_repass = waveforms[mask_2nd_pass]
-
-        # Build 'width' and 'shift' arrays that adapt on the position of the
-        # window along each waveform
-
-        # As before we will integrate the charge in a 5-sample window centered
-        # on the peak
-        window_width_default = 5
-        window_shift_default = 2
-
-        # first we find where the integration window edges WOULD BE
-        integration_windows_start = predicted_peaks - window_shift_default
-        integration_windows_end = integration_windows_start + window_width_default
-
-        # then we define 2 possible edge cases
-        # the predicted integration window falls before the readout window
-        integration_before_readout = integration_windows_start < 0
-        # or after
-        integration_after_readout = integration_windows_end > (
-            waveforms_to_repass.shape[1] - 1
-        )
-
-        # If the resulting 5-samples window falls before the readout
-        # window we take the first 5 samples
-        window_width_before = 5
-        window_shift_before = 0
-
-        # If the resulting 5-samples window falls after the readout
-        # window we take the last 5 samples
-        window_width_after = 6
-        window_shift_after = 4
-
-        # put all values of widths and shifts for 2nd pass pixels together
-        window_widths = np.full(waveforms_to_repass.shape[0], window_width_default)
-        window_widths[integration_before_readout] = window_width_before
-        window_widths[integration_after_readout] = window_width_after
-        window_shifts = np.full(waveforms_to_repass.shape[0], window_shift_default)
-        window_shifts[integration_before_readout] = window_shift_before
-        window_shifts[integration_after_readout] = window_shift_after
-
-        # Now we have to (re)define the pathological predicted times for which
-        # - either the peak itself falls outside of the readout window
-        # - or is within the first or last 2 samples (so that at least 1 sample
-        # of the integration window is outside of the readout window)
-        # We place them at the first or last sample, so the special window
-        # widhts and shifts that we defined earlier put the integration window
-        # for these 2 cases either in the first 5 samples or the last
-
-        # set sample to 0 (beginning of the waveform)
-        # if predicted time falls before
-        # but also if it's so near the edge that the integration window falls
-        # outside
-        predicted_peaks[predicted_peaks < 2] = 0
-
-        # set sample to max-1 (first sample has index 0)
-        # if predicted time falls after
-        predicted_peaks[predicted_peaks > (waveforms_to_repass.shape[1] - 3)] = (
-            waveforms_to_repass.shape[1] - 1
-        )
+        # STEPS 5 to 7
+        # The robust linear fit of the pulse time vs. the distance along the
+        # major image axis and the reintegration of all pixels except the
+        # core ones of the main island are done in a compiled kernel.
+        # The trigonometric functions are evaluated by numpy
+        # to get exactly the same results as ctapipe.image.timing_parameters.
+        corrections = self._calculate_second_pass_corrections(tel_id)
 
-        # re-calibrate 2nd pass pixels using the fixed 5-samples window
-        reintegrated_charge, reestimated_pulse_times = extract_around_peak(
-            waveforms_to_repass,
-            predicted_peaks,
-            window_widths,
-            window_shifts,
+        result = _two_pass_second_pass(
+            waveforms,
+            np.asanyarray(selected_gain_channel),
+            charge_1stpass,
+            pulse_time_1stpass,
+            mask_main_island,
+            core_th,
+            pix_x,
+            pix_y,
+            cog_x,
+            cog_y,
+            np.cos(psi),
+            np.sin(psi),
             self.sampling_rate_ghz[tel_id],
+            corrections,
         )
 
-        if self.apply_integration_correction.tel[tel_id]:
-            # Modify integration correction factors only for non-core pixels
-            # now we compute 3 corrections for the default, before, and after cases:
-            correction = self._calculate_correction(
-                tel_id, window_width_default, window_shift_default
-            )[selected_gain_channel][mask_2nd_pass]
-
-            correction_before = self._calculate_correction(
-                tel_id, window_width_before, window_shift_before
-            )[selected_gain_channel][mask_2nd_pass]
-
-            correction_after = self._calculate_correction(
-                tel_id, window_width_after, window_shift_after
-            )[selected_gain_channel][mask_2nd_pass]
-
-            correction[integration_before_readout] = correction_before[
-                integration_before_readout
-            ]
-            correction[integration_after_readout] = correction_after[
-                integration_after_readout
-            ]
-
-            reintegrated_charge *= correction
-
-        # STEP 7
-
-        # Combine in the final output with,
-        # - core pixels from the main cluster
-        # - rest of the pixels which have been passed a second time
-
-        # Start from a copy of the 1st pass charge
-        charge_2ndpass = charge_1stpass.copy()
-        # Overwrite the charges of pixels marked for second pass
-        # leaving untouched the core pixels of the main island
-        # from the preliminary (cleaned) image
-        charge_2ndpass[mask_2nd_pass] = reintegrated_charge
-
-        # Same approach for the pulse times
-        pulse_time_2ndpass = pulse_time_1stpass.copy()
-        pulse_time_2ndpass[mask_2nd_pass] = reestimated_pulse_times
+        # If the fit returns nan
+        if result is None:
+            return charge_1stpass, pulse_time_1stpass, False
 
+        charge_2ndpass, pulse_time_2ndpass = result
         return charge_2ndpass, pulse_time_2ndpass, True
 
     def __call__(
@@ -6,7 +6,7 @@ Hillas-style moment-based shower image parametrization.
 
 import astropy.units as u
 import numpy as np
-from astropy.coordinates import Angle
+from numba import njit
 
 from ..containers import CameraHillasParametersContainer, HillasParametersContainer
 
@@ -57,6 +57,134 @@ class HillasParameterizationError(RuntimeError):
     pass
 
 
+@njit(cache=True)
+def _hillas_moments(pix_x, pix_y, image):
+    """
+    Compiled computation of the hillas parameters on plain arrays.
+
+    Returns a tuple of floats
+    (size, cog_x, cog_y, cog_r, cog_phi, length, length_uncertainty,
+    width, width_uncertainty, psi, skewness, kurtosis)
+    in the units of ``pix_x`` and ``pix_y`` and radian for the angles.
+    All values except size are nan if the size of the image is 0.
+    """
+    n_pixels = len(image)
+
+    size = 0.0
+    sum_x = 0.0
+    sum_y = 0.0
+    for i in range(n_pixels):
+        size += image[i]
+        sum_x += image[i] * pix_x[i]
+        sum_y += image[i] * pix_y[i]
+
+    if size == 0.0:
+        nan = np.nan
+        return (size, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan, nan)
+
+    # cog as the mean of the coordinates weighted with the image
+    cog_x = sum_x / size
+    cog_y = sum_y / size
+    cog_r = np.sqrt(cog_x**2 + cog_y**2)
+    cog_phi = np.arctan2(cog_y, cog_x)
+
+    # weighted covariance, with ddof=0
+    cov_xx = 0.0
+    cov_yy = 0.0
+    cov_xy = 0.0
+    for i in range(n_pixels):
+        delta_x = pix_x[i] - cog_x
+        delta_y = pix_y[i] - cog_y
+        cov_xx += image[i] * delta_x**2
+        cov_yy += image[i] * delta_y**2
+        cov_xy += image[i] * delta_x * delta_y
+    cov_xx /= size
+    cov_yy /= size
+    cov_xy /= size
+
+    # eigenvalues of the symmetric 2x2 covariance matrix
+    half_trace = 0.5 * (cov_xx + cov_yy)
+    root = np.sqrt((0.5 * (cov_xx - cov_yy)) ** 2 + cov_xy**2)
+    eig_val_min = half_trace - root
+    eig_val_max = half_trace + root
+
+    # round eig_vals to get rid of nans when eig val is something like -8.47032947e-22
+    if abs(eig_val_min) <= HILLAS_ATOL:
+        eig_val_min = 0.0
+    if abs(eig_val_max) <= HILLAS_ATOL:
+        eig_val_max = 0.0
+
+    width = np.sqrt(eig_val_min)
+    length = np.sqrt(eig_val_max)
+
+    if length == 0:
+        psi = np.nan
+    elif abs(cov_xy) <= HILLAS_ATOL and cov_xx - cov_yy <= HILLAS_ATOL:
+        # major axis along y, also for circular images, as in the PCA
+        psi = np.pi / 2
+    else:
+        # angle of the major axis to the x-axis, in the range (-pi/2, pi/2)
+        psi = 0.5 * np.arctan2(2 * cov_xy, cov_xx - cov_yy)
+
+    cos_psi = np.cos(psi)
+    sin_psi = np.sin(psi)
+
+    # intermediate variables for the uncertainties,
+    # described in [hillas_uncertainties]_
+    cos_2psi = np.cos(2 * psi)
+    a = (1 + cos_2psi) / 2
+    b = (1 - cos_2psi) / 2
+    c = np.sin(2 * psi)
+
+    # higher order moments along the shower axis and uncertainty sums
+    m3_long = 0.0
+    m4_long = 0.0
+    sum_length = 0.0
+    sum_width = 0.0
+    for i in range(n_pixels):
+        delta_x = pix_x[i] - cog_x
+        delta_y = pix_y[i] - cog_y
+
+        longitudinal = delta_x * cos_psi + delta_y * sin_psi
+        m3_long += image[i] * longitudinal**3
+        m4_long += image[i] * longitudinal**4
+
+        A = (delta_x**2 - cov_xx) / size
+        B = (delta_y**2 - cov_yy) / size
+        C = (delta_x * delta_y - cov_xy) / size
+        sum_length += (a * A + b * B + c * C) ** 2 * image[i]
+        sum_width += (b * A + a * B - c * C) ** 2 * image[i]
+
+    if length == 0:
+        skewness_long = np.nan
+        kurtosis_long = np.nan
+        length_uncertainty = np.nan
+    else:
+        skewness_long = m3_long / size / length**3
+        kurtosis_long = m4_long / size / length**4
+        length_uncertainty = np.sqrt(sum_length) / (2 * length)
+
+    if width == 0:
+        width_uncertainty = np.nan
+    else:
+        width_uncertainty = np.sqrt(sum_width) / (2 * width)
+
+    return (
+        size,
+        cog_x,
+        cog_y,
+        cog_r,
+        cog_phi,
+        length,
+        length_uncertainty,
+        width,
+        width_uncertainty,
+        psi,
+        skewness_long,
+        kurtosis_long,
+    )
+
+
 def hillas_parameters(geom, image):
     """
     Compute Hillas parameters for a given shower image.
@@ -66,6 +194,10 @@ def hillas_parameters(geom, image):
     from
     https://github.com/fact-project/fact-tools
 
+    The moments are computed by a compiled kernel on the plain pixel arrays,
+    the eigenvalues and orientation of the covariance matrix are
+    obtained analytically.
+
     The recommended form is to pass only the sliced geometry and image
     for the pixels to be considered.
 
@@ -87,109 +219,44 @@ def hillas_parameters(geom, image):
     unit = geom.pix_x.unit
     pix_x = geom.pix_x.to_value(unit)
     pix_y = geom.pix_y.to_value(unit)
-    image = np.asanyarray(image, dtype=np.float64)
 
     if isinstance(image, np.ma.masked_array):
         image = np.ma.filled(image, 0)
+    image = np.asarray(image, dtype=np.float64)
 
     if not (pix_x.shape == pix_y.shape == image.shape):
         raise ValueError("Image and pixel shape do not match")
 
-    size = np.sum(image)
+    (
+        size,
+        cog_x,
+        cog_y,
+        cog_r,
+        cog_phi,
+        length,
+        length_uncertainty,
+        width,
+        width_uncertainty,
+        psi,
+        skewness_long,
+        kurtosis_long,
+    ) = _hillas_moments(pix_x, pix_y, image)
 
     if size == 0.0:
         raise HillasParameterizationError("size=0, cannot calculate HillasParameters")
 
-    # calculate the cog as the mean of the coordinates weighted with the image
-    cog_x = np.average(pix_x, weights=image)
-    cog_y = np.average(pix_y, weights=image)
-
-    # polar coordinates of the cog
-    cog_r = np.linalg.norm([cog_x, cog_y])
-    cog_phi = np.arctan2(cog_y, cog_x)
-
-    # do the PCA for the hillas parameters
-    delta_x = pix_x - cog_x
-    delta_y = pix_y - cog_y
-
-    # The ddof=0 makes this comparable to the other methods,
-    # but ddof=1 should be more correct, mostly affects small showers
-    # on a percent level
-    cov = np.cov(delta_x, delta_y, aweights=image, ddof=0)
-    eig_vals, eig_vecs = np.linalg.eigh(cov)
-
-    # round eig_vals to get rid of nans when eig val is something like -8.47032947e-22
-    near_zero = np.isclose(eig_vals, 0, atol=HILLAS_ATOL)
-    eig_vals[near_zero] = 0
-
-    # width and length are eigen values of the PCA
-    width, length = np.sqrt(eig_vals)
-
-    # psi is the angle of the eigenvector to length to the x-axis
-    vx, vy = eig_vecs[0, 1], eig_vecs[1, 1]
-
-    # avoid divide by 0 warnings
-    # psi will be consistently defined in the range (-pi/2, pi/2)
-    if length == 0:
-        psi = skewness_long = kurtosis_long = np.nan
-    else:
-        if vx != 0:
-            psi = np.arctan(vy / vx)
-        else:
-            psi = np.pi / 2
-
-        # calculate higher order moments along shower axes
-        longitudinal = delta_x * np.cos(psi) + delta_y * np.sin(psi)
-
-        m3_long = np.average(longitudinal**3, weights=image)
-        skewness_long = m3_long / length**3
-
-        m4_long = np.average(longitudinal**4, weights=image)
-        kurtosis_long = m4_long / length**4
-
-    # Compute of the Hillas parameters uncertainties.
-    # Implementation described in [hillas_uncertainties]_ This is an internal MAGIC document
-    # not generally accessible.
-
-    # intermediate variables
-    cos_2psi = np.cos(2 * psi)
-    a = (1 + cos_2psi) / 2
-    b = (1 - cos_2psi) / 2
-    c = np.sin(2 * psi)
-
-    A = ((delta_x**2.0) - cov[0][0]) / size
-    B = ((delta_y**2.0) - cov[1][1]) / size
-    C = ((delta_x * delta_y) - cov[0][1]) / size
-
-    # Hillas's uncertainties
-
-    # avoid divide by 0 warnings
-    if length == 0:
-        length_uncertainty = np.nan
-    else:
-        length_uncertainty = np.sqrt(
-            np.sum(((((a * A) + (b * B) + (c * C))) ** 2.0) * image)
-        ) / (2 * length)
-
-    if width == 0:
-        width_uncertainty = np.nan
-    else:
-        width_uncertainty = np.sqrt(
-            np.sum(((((b * A) + (a * B) + (-c * C))) ** 2.0) * image)
-        ) / (2 * width)
-
     if unit.is_equivalent(u.m):
         return CameraHillasParametersContainer(
             x=u.Quantity(cog_x, unit),
             y=u.Quantity(cog_y, unit),
             r=u.Quantity(cog_r, unit),
-            phi=Angle(cog_phi, unit=u.rad),
+            phi=u.Quantity(cog_phi, u.rad),
             intensity=size,
             length=u.Quantity(length, unit),
             length_uncertainty=u.Quantity(length_uncertainty, unit),
             width=u.Quantity(width, unit),
             width_uncertainty=u.Quantity(width_uncertainty, unit),
-            psi=Angle(psi, unit=u.rad),
+            psi=u.Quantity(psi, u.rad),
             skewness=skewness_long,
             kurtosis=kurtosis_long,
         )
@@ -197,13 +264,13 @@ def hillas_parameters(geom, image):
         fov_lon=u.Quantity(cog_x, unit),
         fov_lat=u.Quantity(cog_y, unit),
         r=u.Quantity(cog_r, unit),
-        phi=Angle(cog_phi, unit=u.rad),
+        phi=u.Quantity(cog_phi, u.rad),
         intensity=size,
         length=u.Quantity(length, unit),
         length_uncertainty=u.Quantity(length_uncertainty, unit),
         width=u.Quantity(width, unit),
         width_uncertainty=u.Quantity(width_uncertainty, unit),
-        psi=Angle(psi, unit=u.rad),
+        psi=u.Quantity(psi, u.rad),
         skewness=skewness_long,
         kurtosis=kurtosis_long,
     )
@@ -19,10 +19,10 @@ from ..containers import (
 from ..core import QualityQuery, TelescopeComponent
 from ..core.traits import Bool, BoolTelescopeParameter, ComponentName, List
 from ..instrument import SubarrayDescription
+from .batch_parameters import image_parameters_batch
 from .cleaning import ImageCleaner
-from .concentration import concentration_parameters
+from .combined_parameters import CameraPixels, leakage_concentration_statistics
 from .hillas import hillas_parameters
-from .leakage import leakage_parameters
 from .modifications import ImageModifier
 from .morphology import morphology_parameters
 from .statistics import descriptive_statistics
@@ -116,9 +116,118 @@ class ImageProcessor(TelescopeComponent):
                 for tel_id in self.subarray.tel
             }
 
+        # pixel positions and border masks per telescope, filled on first use
+        self._camera_pixels = {}
+
     def __call__(self, event: ArrayEventContainer):
         self._process_telescope_event(event)
 
+    def process_chunk(self, tel_id, images, peak_times=None):
+        """
+        Clean and parameterize a chunk of images of the same telescope.
+
+        This is the columnar equivalent of calling this component on events,
+        using `~ctapipe.image.batch_parameters.image_parameters_batch`
+        to compute the parameters of all images at once.
+        Images not passing the image quality query get the same default
+        values as in the event-wise processing.
+
+        Parameters
+        ----------
+        tel_id : int
+            telescope id of all images
+        images : np.ndarray
+            calibrated images, shape (n_images, n_pixels)
+        peak_times : np.ndarray or None
+            peak times, shape (n_images, n_pixels)
+
+        Returns
+        -------
+        masks : np.ndarray[bool]
+            cleaning masks, shape (n_images, n_pixels)
+        parameters : astropy.table.Table
+            image parameters, one row per image
+        """
+        images = np.asanyarray(images)
+        if self.apply_image_modifier.tel[tel_id]:
+            images = np.array([self.modify(tel_id=tel_id, image=i) for i in images])
+
+        masks = self.clean.clean_batch(tel_id, images, arrival_times=peak_times)
+        parameters = self._parameterize_chunk(
+            tel_id, images, masks, peak_times, default=self.default_image_container
+        )
+        return masks, parameters
+
+    def process_true_chunk(self, tel_id, true_images):
+        """
+        Parameterize a chunk of true images of the same telescope.
+
+        This is the columnar equivalent of the true image parameters computed
+        for simulated events, using all pixels with signal and no timing.
+
+        Parameters
+        ----------
+        tel_id : int
+            telescope id of all images
+        true_images : np.ndarray
+            true images, shape (n_images, n_pixels)
+
+        Returns
+        -------
+        parameters : astropy.table.Table
+            true image parameters, one row per image,
+            column names have the prefix ``true_``
+        """
+        true_images = np.asanyarray(true_images)
+        parameters = self._parameterize_chunk(
+            tel_id,
+            true_images,
+            true_images > 0,
+            peak_times=None,
+            default=DEFAULT_TRUE_IMAGE_PARAMETERS,
+        )
+        for colname in parameters.colnames:
+            parameters.rename_column(colname, f"true_{colname}")
+        return parameters
+
+    def _parameterize_chunk(self, tel_id, images, masks, peak_times, default):
+        """
+        Parameterize a chunk of images with the given masks,
+        images not passing the image quality query get the values of ``default``
+        """
+        passes = np.array(
+            [all(self.check_image(image=i[m])) for i, m in zip(images, masks)],
+            dtype=bool,
+        )
+
+        if self.use_telescope_frame:
+            geometry = self.telescope_frame_geometries[tel_id]
+        else:
+            geometry = self.subarray.tel[tel_id].camera.geometry
+
+        parameters = image_parameters_batch(
+            geometry, images, masks, peak_times=peak_times
+        )
+
+        # the default true image parameters only exist in the telescope frame,
+        # use the default of the configured frame for the missing values
+        defaults = {}
+        for container in (self.default_image_container, default):
+            defaults.update(
+                container.as_dict(recursive=True, flatten=True, add_prefix=True)
+            )
+        for colname in parameters.colnames:
+            parameters[colname][~passes] = defaults[colname]
+
+        return parameters
+
+    def _get_camera_pixels(self, tel_id, geometry):
+        camera_pixels = self._camera_pixels.get(tel_id)
+        if camera_pixels is None:
+            camera_pixels = CameraPixels.from_geometry(geometry)
+            self._camera_pixels[tel_id] = camera_pixels
+        return camera_pixels
+
     def _parameterize_image(
         self,
         tel_id,
@@ -165,16 +274,17 @@ class ImageProcessor(TelescopeComponent):
             geom_selected = geometry[signal_pixels]
 
             hillas = hillas_parameters(geom=geom_selected, image=image_selected)
-            leakage = leakage_parameters(
-                geom=geometry, image=image, cleaning_mask=signal_pixels
-            )
-            concentration = concentration_parameters(
-                geom=geom_selected, image=image_selected, hillas_parameters=hillas
+            (
+                leakage,
+                concentration,
+                intensity_statistics,
+            ) = leakage_concentration_statistics(
+                self._get_camera_pixels(tel_id, geometry),
+                image=image,
+                mask=signal_pixels,
+                hillas_parameters=hillas,
             )
             morphology = morphology_parameters(geom=geometry, image_mask=signal_pixels)
-            intensity_statistics = descriptive_statistics(
-                image_selected, container_class=IntensityStatisticsContainer
-            )
 
             if peak_time is not None:
                 timing = timing_parameters(
@@ -5,6 +5,7 @@ from abc import ABCMeta, abstractmethod
 from typing import Tuple
 
 import numpy as np
+from numba import njit
 
 from ..core import TelescopeComponent
 
@@ -19,6 +20,10 @@ class InvalidPixelHandler(TelescopeComponent, metaclass=ABCMeta):
     An abtract base class for algorithms treating invalid pixel data in images
     """
 
+    #: If True, ``__call__`` also accepts images of shape (n_images, n_pixels)
+    #: of telescopes with the same camera and handles them at once.
+    supports_batches = False
+
     @abstractmethod
     def __call__(
         self, tel_id, image, peak_time, pixel_mask
@@ -49,6 +54,8 @@ class InvalidPixelHandler(TelescopeComponent, metaclass=ABCMeta):
 
 
 class NeighborAverage(InvalidPixelHandler):
+    supports_batches = True
+
     def __call__(self, tel_id, image, peak_time, pixel_mask):
         """Interpolate pixels in dl1 images and peak_times
 
@@ -61,11 +68,13 @@ class NeighborAverage(InvalidPixelHandler):
         tel_id : int
             telescope id
         image : np.ndarray
-            Array of pixel image values
+            Array of pixel image values, shape (n_pixels)
+            or (n_images, n_pixels) for several images of the same camera
         peak_time : np.ndarray
-            Array of pixel peak_time values
+            Array of pixel peak_time values, same shape as ``image``
         pixel_mask : np.ndarray
-            Boolean mask of the pixels to be interpolated
+            Boolean mask of the pixels to be interpolated,
+            broadcastable to the shape of ``image``
 
         Returns
         -------
@@ -74,33 +83,62 @@ class NeighborAverage(InvalidPixelHandler):
         peak_time : np.ndarray
             peak_time with interpolated values
         """
-        geometry = self.subarray.tel[tel_id].camera.geometry
-
-        n_interpolated = np.count_nonzero(pixel_mask)
-        if n_interpolated == 0:
+        # most events have no invalid pixels, avoid copying the images
+        if np.count_nonzero(pixel_mask) == 0:
             return image, peak_time
 
-        # exclude to-be-interpolated pixels from neighbors
-        neighbors = geometry.neighbor_matrix[pixel_mask] & ~pixel_mask
-
-        index, neighbor = np.nonzero(neighbors)
-        image_sum = np.zeros(n_interpolated, dtype=image.dtype)
-        count = np.zeros(n_interpolated, dtype=int)
-        peak_time_sum = np.zeros(n_interpolated, dtype=peak_time.dtype)
-
-        # calculate average of image and peak_time
-        np.add.at(count, index, 1)
-        np.add.at(image_sum, index, image[neighbor])
-        np.add.at(peak_time_sum, index, peak_time[neighbor])
-
-        valid = count > 0
-        np.divide(image_sum, count, out=image_sum, where=valid)
-        np.divide(peak_time_sum, count, out=peak_time_sum, where=valid)
+        geometry = self.subarray.tel[tel_id].camera.geometry
+        neighbors = geometry.neighbor_matrix_sparse
+
+        image = np.array(image)
+        peak_time = np.array(peak_time)
+        pixel_mask = np.broadcast_to(pixel_mask, image.shape)
+
+        n_pixels = image.shape[-1]
+        _neighbor_average(
+            image.reshape(-1, n_pixels),
+            peak_time.reshape(-1, n_pixels),
+            pixel_mask.reshape(-1, n_pixels),
+            neighbors.indptr,
+            neighbors.indices,
+        )
+        return image, peak_time
 
-        peak_time = peak_time.copy()
-        peak_time[pixel_mask] = peak_time_sum
 
-        image = image.copy()
-        image[pixel_mask] = image_sum
+@njit(cache=True)
+def _neighbor_average(image, peak_time, pixel_mask, indptr, indices):
+    """
+    Replace masked pixels by the average of their unmasked neighbors in place.
 
-        return image, peak_time
+    ``indptr`` and ``indices`` are the CSR representation of the neighbor matrix.
+    Only unmasked pixels are read, so writing in place is safe.
+    """
+    n_images, n_pixels = image.shape
+    for i in range(n_images):
+        for pixel in range(n_pixels):
+            if not pixel_mask[i, pixel]:
+                continue
+
+            # sums in the dtype of the inputs, starting with the first neighbor
+            image_sum = image[i, pixel]
+            peak_time_sum = peak_time[i, pixel]
+            count = 0
+            for k in range(indptr[pixel], indptr[pixel + 1]):
+                neighbor = indices[k]
+                if pixel_mask[i, neighbor]:
+                    continue
+
+                if count == 0:
+                    image_sum = image[i, neighbor]
+                    peak_time_sum = peak_time[i, neighbor]
+                else:
+                    image_sum += image[i, neighbor]
+                    peak_time_sum += peak_time[i, neighbor]
+                count += 1
+
+            if count > 0:
+                image[i, pixel] = image_sum / count
+                peak_time[i, pixel] = peak_time_sum / count
+            else:
+                image[i, pixel] = 0
+                peak_time[i, pixel] = 0
@@ -1,3 +1,5 @@
+from typing import NamedTuple
+
 import numpy as np
 from numba import njit
 
@@ -5,49 +7,193 @@ from ..containers import MorphologyContainer
 
 
 @njit(cache=True)
-def _n_islands_sparse_indices(indices, indptr, mask):
+def _label_islands(indices, indptr, mask, labels, stack):
+    """
+    Label the connected clusters of ``mask`` in ``labels``, which must be
+    all zero, using ``stack``, an array with one entry per pixel, to store the
+    pixels still to visit. Returns the number of islands.
+    """
+    n_islands = 0
+    for pixel in range(len(mask)):
+        # not a signal pixel or we already visited this pixel
+        if not mask[pixel] or labels[pixel] != 0:
+            continue
+
+        # start a new island
+        n_islands += 1
+        labels[pixel] = n_islands
+        stack[0] = pixel
+        n_to_check = 1
+
+        # check neighbors, each pixel is labeled and put on the stack once
+        while n_to_check > 0:
+            n_to_check -= 1
+            idx = stack[n_to_check]
+            for k in range(indptr[idx], indptr[idx + 1]):
+                neighbor = indices[k]
+                if mask[neighbor] and labels[neighbor] == 0:
+                    labels[neighbor] = n_islands
+                    stack[n_to_check] = neighbor
+                    n_to_check += 1
 
-    # non-signal pixel get label == 0, we marke the cleaning
-    # pixels with -1, so we only have to check labels and not labels and mask
-    # from now on.
+    return n_islands
+
+
+@njit(cache=True)
+def _n_islands_sparse_indices(indices, indptr, mask):
+    # non-signal pixel get label == 0
     labels = np.zeros(len(mask), dtype=np.int16)
-    labels[mask] = -1
+    stack = np.empty(len(mask), dtype=np.int64)
+    n_islands = _label_islands(indices, indptr, mask, labels, stack)
+    return n_islands, labels
 
-    cleaning_pixels = np.where(mask)[0]
-    n_cleaning_pixels = len(cleaning_pixels)
-    current_island = 0
 
-    to_check = []
-    for i in range(n_cleaning_pixels):
-        idx = cleaning_pixels[i]
+@njit(cache=True)
+def _islands_sparse_indices(indices, indptr, masks, images):
+    """
+    Label the islands of a stack of masks and compute the number of islands,
+    the size of each island, the number of small, medium and large islands
+    and the labels of the largest and, if ``images`` is not None,
+    brightest island of each mask.
 
-        # we already visited this pixel
-        if labels[idx] != -1:
+    The sizes are indexed by label and have shape (n_images, n_pixels + 1),
+    as a mask can have at most n_pixels islands.
+    """
+    n_images, n_pixels = masks.shape
+    labels = np.zeros((n_images, n_pixels), dtype=np.int32)
+    # label 0 is no island
+    sizes = np.zeros((n_images, n_pixels + 1), dtype=np.int64)
+    # n_islands, n_small, n_medium, n_large, largest, brightest
+    stats = np.zeros((6, n_images), dtype=np.int64)
+
+    stack = np.empty(n_pixels, dtype=np.int64)
+    # buffer for the brightness of each island
+    brightness = np.zeros(n_pixels + 1, dtype=np.float64)
+
+    for i in range(n_images):
+        n_islands = _label_islands(indices, indptr, masks[i], labels[i], stack)
+        stats[0, i] = n_islands
+        if n_islands == 0:
             continue
 
-        # start a new island
-        current_island += 1
-        labels[idx] = current_island
+        brightness[: n_islands + 1] = 0
+        for pixel in range(n_pixels):
+            label = labels[i, pixel]
+            if label > 0:
+                sizes[i, label] += 1
+                if images is not None:
+                    brightness[label] += images[i, pixel]
+
+        # first island with the maximum size or brightness, as np.argmax
+        largest = brightest = 1
+        for label in range(1, n_islands + 1):
+            size = sizes[i, label]
+            if size <= 2:
+                stats[1, i] += 1
+            elif size <= 50:
+                stats[2, i] += 1
+            else:
+                stats[3, i] += 1
+
+            if size > sizes[i, largest]:
+                largest = label
+            if brightness[label] > brightness[brightest]:
+                brightest = label
+
+        stats[4, i] = largest
+        stats[5, i] = brightest
+
+    return labels, sizes, stats
+
+
+class Islands(NamedTuple):
+    """Islands of a stack of masks, see `label_islands`"""
+
+    #: number of islands per image, shape (n_images,)
+    n_islands: np.ndarray
+    #: island label of each pixel, 0 for pixels not in the mask,
+    #: shape (n_images, n_pixels)
+    labels: np.ndarray
+    #: number of pixels of each island, indexed by label,
+    #: shape (n_images, max(n_islands) + 1)
+    sizes: np.ndarray
+    #: number of islands with less than 3 pixels per image
+    n_small: np.ndarray
+    #: number of islands with 3 <= n_pixels <= 50 per image
+    n_medium: np.ndarray
+    #: number of islands with more than 50 pixels per image
+    n_large: np.ndarray
+    #: label of the island with the most pixels per image, 0 if there is no island
+    largest: np.ndarray
+    #: label of the island with the largest sum of the image per image,
+    #: 0 if there is no island, None if no images were given
+    brightest: np.ndarray = None
+
+    def select(self, island_labels):
+        """
+        Masks selecting one island per image, e.g. ``islands.select(islands.largest)``.
+        Masks of images without islands are all False.
+        """
+        island_labels = np.asanyarray(island_labels)[:, np.newaxis]
+        return (self.labels == island_labels) & (island_labels > 0)
+
+
+def label_islands(geom, masks, images=None) -> Islands:
+    """
+    Search a stack of pixel masks for connected clusters (islands).
 
-        # check neighbors recursively
-        neighbors = indices[indptr[idx] : indptr[idx + 1]]
-        for n in range(len(neighbors)):
-            neighbor = neighbors[n]
-            if labels[neighbor] == -1:
-                to_check.append(neighbor)
+    This computes the island labels, the island sizes and the number of
+    small, medium and large islands in a single compiled pass over all masks.
+    If ``images`` are given, the brightest island of each image
+    is determined in the same pass.
+    The labels and counts are the same as computed by `number_of_islands`,
+    `number_of_island_sizes`, `largest_island` and `brightest_island`.
 
-        while len(to_check) > 0:
-            idx = to_check.pop()
-            labels[idx] = current_island
+    Parameters
+    ----------
+    geom: `~ctapipe.instrument.CameraGeometry`
+        Camera geometry information
+    masks: ndarray
+        input masks (array of booleans), shape (n_images, n_pixels)
+    images: ndarray or None
+        images to determine the brightest island, shape (n_images, n_pixels)
 
-            neighbors = indices[indptr[idx] : indptr[idx + 1]]
-            for n in range(len(neighbors)):
-                neighbor = neighbors[n]
+    Returns
+    -------
+    islands: Islands
+        Labels, sizes and counts of the islands of each mask
+    """
+    masks = np.asanyarray(masks, dtype=bool)
+    if masks.ndim != 2 or masks.shape[1] != geom.n_pixels:
+        raise ValueError(
+            f"masks must have shape (n_images, {geom.n_pixels}), got {masks.shape}"
+        )
+    if images is not None:
+        images = np.asanyarray(images)
+        if images.shape != masks.shape:
+            raise ValueError(
+                "images and masks must have the same shape,"
+                f" got {images.shape} and {masks.shape}"
+            )
 
-                if labels[neighbor] == -1:
-                    to_check.append(neighbor)
+    neighbors = geom.neighbor_matrix_sparse
+    labels, sizes, stats = _islands_sparse_indices(
+        neighbors.indices, neighbors.indptr, masks, images
+    )
+    n_islands, n_small, n_medium, n_large, largest, brightest = stats
+    max_islands = n_islands.max() if len(n_islands) > 0 else 0
 
-    return current_island, labels
+    return Islands(
+        n_islands=n_islands,
+        labels=labels,
+        # copy to not keep the buffer for the maximum possible number of islands
+        sizes=sizes[:, : max_islands + 1].copy(),
+        n_small=n_small,
+        n_medium=n_medium,
+        n_large=n_large,
+        largest=largest,
+        brightest=brightest if images is not None else None,
+    )
 
 
 def number_of_islands(geom, mask):
@@ -191,14 +337,12 @@ def morphology_parameters(geom, image_mask) -> MorphologyContainer:
     MorphologyContainer: parameters related to the morphology
     """
 
-    n_islands, island_labels = number_of_islands(geom=geom, mask=image_mask)
-
-    n_small, n_medium, n_large = number_of_island_sizes(island_labels)
+    islands = label_islands(geom, image_mask[np.newaxis])
 
     return MorphologyContainer(
         n_pixels=np.count_nonzero(image_mask),
-        n_islands=n_islands,
-        n_small_islands=n_small,
-        n_medium_islands=n_medium,
-        n_large_islands=n_large,
+        n_islands=islands.n_islands[0],
+        n_small_islands=islands.n_small[0],
+        n_medium_islands=islands.n_medium[0],
+        n_large_islands=islands.n_large[0],
     )
@@ -4,8 +4,8 @@ Algorithms for the data volume reduction.
 from abc import abstractmethod
 
 import numpy as np
+from numba import njit
 
-from ctapipe.containers import DL1CameraContainer
 from ctapipe.core import TelescopeComponent
 from ctapipe.core.traits import (
     BoolTelescopeParameter,
@@ -14,7 +14,12 @@ from ctapipe.core.traits import (
     TelescopeParameter,
 )
 from ctapipe.image import TailcutsImageCleaner
-from ctapipe.image.cleaning import dilate
+from ctapipe.image.cleaning import (
+    _dilate,
+    _neighbor_indices,
+    _tailcuts_clean_image,
+    dilate,
+)
 from ctapipe.image.extractor import ImageExtractor
 
 __all__ = ["DataVolumeReducer", "NullDataVolumeReducer", "TailCutsDataVolumeReducer"]
@@ -92,6 +97,44 @@ class DataVolumeReducer(TelescopeComponent):
             Mask of selected pixels.
         """
 
+    def select_pixels_batch(self, waveforms, tel_id=None, selected_gain_channel=None):
+        """
+        Select the pixels of several events of the same telescope at once.
+
+        Subclasses can override this with a faster implementation,
+        by default `select_pixels` is called for each event.
+
+        Parameters
+        ----------
+        waveforms: ndarray
+            Waveforms stored in a numpy array of shape
+            (n_events, n_pix, n_samples).
+        tel_id: int
+            The telescope id, its configuration is used for all events.
+        selected_gain_channel: ndarray or None
+            The channel selected in the gain selection, per event and pixel,
+            shape (n_events, n_pix).
+
+        Returns
+        -------
+        mask: array
+            Mask of selected pixels for each event.
+        """
+        return np.stack(
+            [
+                self.select_pixels(
+                    event_waveforms,
+                    tel_id=tel_id,
+                    selected_gain_channel=(
+                        None
+                        if selected_gain_channel is None
+                        else selected_gain_channel[i]
+                    ),
+                )
+                for i, event_waveforms in enumerate(waveforms)
+            ]
+        )
+
 
 class NullDataVolumeReducer(DataVolumeReducer):
     """
@@ -178,36 +221,152 @@ class TailCutsDataVolumeReducer(DataVolumeReducer):
             self.image_extractors[name] = image_extractor
 
     def select_pixels(self, waveforms, tel_id=None, selected_gain_channel=None):
-        camera_geom = self.subarray.tel[tel_id].camera.geometry
-        # Pulse-integrate waveforms
+        images = self._extract_images(waveforms, tel_id, selected_gain_channel)
+        return self._select_pixels_from_images(images[np.newaxis], tel_id)[0]
+
+    def select_pixels_batch(self, waveforms, tel_id=None, selected_gain_channel=None):
+        images = self._extract_images(waveforms, tel_id, selected_gain_channel)
+        return self._select_pixels_from_images(images, tel_id)
+
+    def _extract_images(self, waveforms, tel_id, selected_gain_channel):
+        """Pulse-integrate the waveforms of one or several events"""
         extractor = self.image_extractors[self.image_extractor_type.tel[tel_id]]
         # do not treat broken pixels in data volume reduction
-        broken_pixels = np.zeros(camera_geom.n_pixels, dtype=bool)
-        dl1: DL1CameraContainer = extractor(
-            waveforms,
-            tel_id=tel_id,
-            selected_gain_channel=selected_gain_channel,
-            broken_pixels=broken_pixels,
+        broken_pixels = np.zeros(waveforms.shape[:-1], dtype=bool)
+
+        if waveforms.ndim == 2 or extractor.supports_batches:
+            return extractor(
+                waveforms,
+                tel_id=tel_id,
+                selected_gain_channel=selected_gain_channel,
+                broken_pixels=broken_pixels,
+            ).image
+
+        return np.stack(
+            [
+                extractor(
+                    event_waveforms,
+                    tel_id=tel_id,
+                    selected_gain_channel=(
+                        None
+                        if selected_gain_channel is None
+                        else selected_gain_channel[i]
+                    ),
+                    broken_pixels=broken_pixels[i],
+                ).image
+                for i, event_waveforms in enumerate(waveforms)
+            ]
         )
 
-        # 1) Step: TailcutCleaning at first
-        mask = self.cleaner(tel_id, dl1.image)
-        pixels_above_boundary_thresh = (
-            dl1.image >= self.cleaner.boundary_threshold_pe.tel[tel_id]
+    def _select_pixels_from_images(self, images, tel_id):
+        """Apply the three steps of the reduction to images of shape (n_events, n_pix)"""
+        camera_geom = self.subarray.tel[tel_id].camera.geometry
+        boundary_threshold = self.cleaner.boundary_threshold_pe.tel[tel_id]
+
+        # the standard tailcuts cleaning is fused with the dilation steps
+        if type(self.cleaner) is TailcutsImageCleaner:
+            indices, indptr = _neighbor_indices(camera_geom, images.shape[-1])
+            return _tailcuts_pixel_selection(
+                indices,
+                indptr,
+                images >= self.cleaner.picture_threshold_pe.tel[tel_id],
+                images >= boundary_threshold,
+                self.cleaner.min_picture_neighbors.tel[tel_id],
+                self.cleaner.keep_isolated_pixels.tel[tel_id],
+                self.do_boundary_dilation.tel[tel_id],
+                self.n_end_dilates.tel[tel_id],
+            )
+
+        masks = np.empty(images.shape, dtype=bool)
+        for i, image in enumerate(images):
+            # 1) Step: TailcutCleaning at first
+            mask = self.cleaner(tel_id, image)
+            pixels_above_boundary_thresh = image >= boundary_threshold
+            mask_in_loop = np.array([])
+            # 2) Step: Add iteratively all pixels with Signal
+            #          S > boundary_thresh with ctapipe module
+            #          'dilate' until no new pixels were added.
+            while (
+                not np.array_equal(mask, mask_in_loop)
+                and self.do_boundary_dilation.tel[tel_id]
+            ):
+                mask_in_loop = mask
+                mask = dilate(camera_geom, mask) & pixels_above_boundary_thresh
+
+            # 3) Step: Adding Pixels with 'dilate' to get more conservative.
+            for _ in range(self.n_end_dilates.tel[tel_id]):
+                mask = dilate(camera_geom, mask)
+
+            masks[i] = mask
+
+        return masks
+
+
+@njit(cache=True)
+def _tailcuts_pixel_selection(
+    indices,
+    indptr,
+    above_picture,
+    above_boundary,
+    min_number_picture_neighbors,
+    keep_isolated_pixels,
+    do_boundary_dilation,
+    n_end_dilates,
+):
+    """
+    `TailCutsDataVolumeReducer` pixel selection for images of shape
+    (n_events, n_pixels) with the standard `~ctapipe.image.tailcuts_clean`.
+
+    ``indices`` and ``indptr`` are the CSR representation of the neighbor matrix,
+    which is assumed to be symmetric.
+    """
+    n_images, n_pixels = above_picture.shape
+    masks = np.empty((n_images, n_pixels), dtype=np.bool_)
+
+    in_picture = np.empty(n_pixels, dtype=np.bool_)
+    buffer = np.empty(n_pixels, dtype=np.bool_)
+    stack = np.empty(n_pixels, dtype=np.int64)
+
+    for i in range(n_images):
+        mask = masks[i]
+        above = above_boundary[i]
+
+        # 1) Step: tailcuts cleaning
+        _tailcuts_clean_image(
+            indices,
+            indptr,
+            above_picture[i],
+            above,
+            min_number_picture_neighbors,
+            keep_isolated_pixels,
+            in_picture,
+            mask,
         )
-        mask_in_loop = np.array([])
-        # 2) Step: Add iteratively all pixels with Signal
-        #          S > boundary_thresh with ctapipe module
-        #          'dilate' until no new pixels were added.
-        while (
-            not np.array_equal(mask, mask_in_loop)
-            and self.do_boundary_dilation.tel[tel_id]
-        ):
-            mask_in_loop = mask
-            mask = dilate(camera_geom, mask) & pixels_above_boundary_thresh
-
-        # 3) Step: Adding Pixels with 'dilate' to get more conservative.
-        for _ in range(self.n_end_dilates.tel[tel_id]):
-            mask = dilate(camera_geom, mask)
 
-        return mask
+        # 2) Step: the iterated dilation restricted to pixels above the
+        # boundary threshold is one dilation followed by a flood fill
+        if do_boundary_dilation:
+            _dilate(indices, indptr, mask, buffer)
+            n_stack = 0
+            for pixel in range(n_pixels):
+                mask[pixel] = buffer[pixel] and above[pixel]
+                if mask[pixel]:
+                    stack[n_stack] = pixel
+                    n_stack += 1
+
+            while n_stack > 0:
+                n_stack -= 1
+                pixel = stack[n_stack]
+                for k in range(indptr[pixel], indptr[pixel + 1]):
+                    neighbor = indices[k]
+                    if above[neighbor] and not mask[neighbor]:
+                        mask[neighbor] = True
+                        stack[n_stack] = neighbor
+                        n_stack += 1
+
+        # 3) Step: additional dilations
+        for _ in range(n_end_dilates):
+            _dilate(indices, indptr, mask, buffer)
+            mask[:] = buffer
+
+    return masks
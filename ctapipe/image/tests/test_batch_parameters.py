@@ -0,0 +1,133 @@
+import astropy.units as u
+import numpy as np
+import pytest
+
+from ctapipe.image import (
+    concentration_parameters,
+    descriptive_statistics,
+    hillas_parameters,
+    image_parameters_batch,
+    leakage_parameters,
+    morphology_parameters,
+    tailcuts_clean,
+    timing_parameters,
+    toymodel,
+)
+from ctapipe.instrument import CameraGeometry
+
+
+def _flat_dict(container, prefix):
+    return {f"{prefix}_{key}": value for key, value in container.as_dict().items()}
+
+
+def assert_close(table, index, expected):
+    for key, value in expected.items():
+        if isinstance(value, u.Quantity):
+            value = value.to_value(table[key].unit)
+        assert np.isclose(table[key][index], value, equal_nan=True), key
+
+
+@pytest.fixture(scope="module")
+def images():
+    geom = CameraGeometry.make_rectangular(npix_x=40, npix_y=40)
+    rng = np.random.default_rng(0)
+
+    images = []
+    peak_times = []
+    for _ in range(20):
+        x, y = rng.uniform(-0.3, 0.3, 2)
+        model = toymodel.Gaussian(
+            x=x * u.m,
+            y=y * u.m,
+            width=rng.uniform(0.02, 0.05) * u.m,
+            length=rng.uniform(0.05, 0.15) * u.m,
+            psi=rng.uniform(0, 360) * u.deg,
+        )
+        image, _, _ = model.generate_image(
+            geom, intensity=rng.uniform(100, 2000), nsb_level_pe=3, rng=rng
+        )
+        images.append(image)
+        peak_times.append(rng.uniform(0, 20, geom.n_pixels))
+
+    images = np.array(images)
+    masks = np.array([tailcuts_clean(geom, image, 10, 5) for image in images])
+    # one empty image
+    images[0] = 0
+    masks[0] = False
+
+    return geom, images, masks, np.array(peak_times)
+
+
+def test_image_parameters_batch(images):
+    """Batched parameters must match the per-image functions"""
+    geom, images, masks, peak_times = images
+
+    table = image_parameters_batch(geom, images, masks, peak_times=peak_times)
+    assert len(table) == len(images)
+
+    # no pixels, all parameters are nan
+    assert np.isnan(table["camera_frame_hillas_x"][0])
+    assert np.isnan(table["camera_frame_timing_slope"][0])
+    assert table["morphology_n_pixels"][0] == 0
+
+    parameterized = np.flatnonzero(np.count_nonzero(masks, axis=1) > 2)
+    assert len(parameterized) > 10
+
+    for i in parameterized:
+        mask = masks[i]
+        geom_selected = geom[mask]
+        image_selected = images[i][mask]
+
+        hillas = hillas_parameters(geom_selected, image_selected)
+        expected = _flat_dict(hillas, "camera_frame_hillas")
+        expected.update(
+            _flat_dict(
+                timing_parameters(
+                    geom_selected, image_selected, peak_times[i][mask], hillas
+                ),
+                "camera_frame_timing",
+            )
+        )
+        expected.update(
+            _flat_dict(leakage_parameters(geom, images[i], mask), "leakage")
+        )
+        expected.update(
+            _flat_dict(
+                concentration_parameters(geom_selected, image_selected, hillas),
+                "concentration",
+            )
+        )
+        expected.update(_flat_dict(morphology_parameters(geom, mask), "morphology"))
+        expected.update(_flat_dict(descriptive_statistics(image_selected), "intensity"))
+        expected.update(
+            _flat_dict(descriptive_statistics(peak_times[i][mask]), "peak_time")
+        )
+        assert_close(table, i, expected)
+
+
+def test_image_parameters_batch_no_peak_time(images):
+    geom, images, masks, _ = images
+    table = image_parameters_batch(geom, images, masks)
+    assert "camera_frame_timing_slope" not in table.colnames
+    assert "peak_time_mean" not in table.colnames
+
+
+def test_image_parameters_batch_shape(images):
+    geom, images, masks, _ = images
+
+    with pytest.raises(ValueError):
+        image_parameters_batch(geom, images, masks[:-1])
+
+    with pytest.raises(ValueError):
+        image_parameters_batch(geom, images[:, :-1], masks[:, :-1])
+
+
+def test_image_parameters_batch_all_empty(images):
+    """a batch without any selected pixel gives nan, not integers"""
+    geom, images, masks, peak_times = images
+    table = image_parameters_batch(
+        geom, images[:3], np.zeros_like(masks[:3]), peak_times=peak_times[:3]
+    )
+    assert table["camera_frame_hillas_intensity"].dtype == np.float64
+    assert np.all(table["camera_frame_hillas_intensity"] == 0)
+    assert np.all(np.isnan(table["camera_frame_hillas_length"]))
@@ -1,5 +1,6 @@
 import astropy.units as u
 import numpy as np
+import pytest
 from numpy.testing import assert_allclose
 
 from ctapipe.image import cleaning
@@ -457,3 +458,70 @@ def test_time_constrained_clean():
     )
     test_mask[noise_boundary] = 0
     assert (test_mask == mask_reco).all()
+
+
+@pytest.mark.parametrize(
+    "function, kwargs",
+    [
+        (cleaning.tailcuts_clean, dict(picture_thresh=8, boundary_thresh=4)),
+        (
+            cleaning.tailcuts_clean,
+            dict(picture_thresh=8, boundary_thresh=4, min_number_picture_neighbors=2),
+        ),
+        (
+            cleaning.tailcuts_clean,
+            dict(picture_thresh=8, boundary_thresh=4, keep_isolated_pixels=True),
+        ),
+        (cleaning.mars_cleaning_1st_pass, dict(picture_thresh=8, boundary_thresh=4)),
+        (cleaning.fact_image_cleaning, dict(picture_threshold=4, boundary_threshold=2)),
+        (cleaning.time_constrained_clean, dict(picture_thresh=8, boundary_thresh=4)),
+    ],
+)
+def test_cleaning_batch(function, kwargs):
+    """Test cleaning several images at once gives the same as one by one"""
+    geom = CameraGeometry.make_rectangular(20, 20)
+    rng = np.random.default_rng(0)
+    images = rng.normal(2, 3, (10, geom.n_pixels))
+    images[:, 150:160] += 20
+    arrival_times = rng.normal(10, 2, (10, geom.n_pixels))
+
+    if function in (cleaning.tailcuts_clean, cleaning.mars_cleaning_1st_pass):
+        args = (images,)
+    else:
+        args = (images, arrival_times)
+
+    masks = function(geom, *args, **kwargs)
+    assert masks.shape == images.shape
+    assert masks.dtype == bool
+    assert masks.any()
+
+    for i in range(len(images)):
+        mask = function(geom, *(arg[i] for arg in args), **kwargs)
+        np.testing.assert_array_equal(masks[i], mask)
+
+
+def test_dilate_batch():
+    geom = CameraGeometry.make_rectangular(20, 20)
+    rng = np.random.default_rng(0)
+    masks = rng.uniform(size=(10, geom.n_pixels)) < 0.05
+    arrival_times = rng.normal(10, 2, (10, geom.n_pixels))
+
+    dilated = cleaning.dilate(geom, masks)
+    cleaned = cleaning.apply_time_delta_cleaning(geom, dilated, arrival_times, 1, 2)
+    for i in range(len(masks)):
+        np.testing.assert_array_equal(dilated[i], cleaning.dilate(geom, masks[i]))
+        np.testing.assert_array_equal(
+            cleaned[i],
+            cleaning.apply_time_delta_cleaning(
+                geom, dilated[i], arrival_times[i], 1, 2
+            ),
+        )
+
+
+def test_cleaning_wrong_n_pixels():
+    """Images not matching the geometry are rejected"""
+    geom = CameraGeometry.make_rectangular(20, 20)
+    with pytest.raises(ValueError, match="pixels"):
+        cleaning.tailcuts_clean(geom, np.zeros(geom.n_pixels - 1))
+    with pytest.raises(ValueError, match="pixels"):
+        cleaning.dilate(geom, np.zeros((2, geom.n_pixels + 1), dtype=bool))
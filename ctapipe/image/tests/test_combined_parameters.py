@@ -0,0 +1,101 @@
+import astropy.units as u
+import numpy as np
+import pytest
+
+from ctapipe.containers import (
+    HillasParametersContainer,
+    IntensityStatisticsContainer,
+)
+from ctapipe.coordinates import CameraFrame, TelescopeFrame
+from ctapipe.instrument import CameraGeometry
+
+
+@pytest.mark.parametrize("frame", ["camera", "telescope"])
+@pytest.mark.parametrize("dtype", [np.float32, np.int32])
+def test_leakage_concentration_statistics(frame, dtype):
+    """Test against the single parameter functions"""
+    from ctapipe.image import (
+        CameraPixels,
+        concentration_parameters,
+        descriptive_statistics,
+        hillas_parameters,
+        leakage_concentration_statistics,
+        leakage_parameters,
+    )
+
+    geom = CameraGeometry.make_rectangular(20, 20)
+    if frame == "telescope":
+        geom.frame = CameraFrame(focal_length=28 * u.m)
+        geom = geom.transform_to(TelescopeFrame())
+
+    camera_pixels = CameraPixels.from_geometry(geom)
+    rng = np.random.default_rng(0)
+
+    for _ in range(10):
+        image = rng.exponential(10, geom.n_pixels).astype(dtype)
+        mask = image > 10
+
+        hillas = hillas_parameters(geom[mask], image[mask])
+        expected = (
+            leakage_parameters(geom, image, mask),
+            concentration_parameters(geom[mask], image[mask], hillas),
+            descriptive_statistics(
+                image[mask], container_class=IntensityStatisticsContainer
+            ),
+        )
+        result = leakage_concentration_statistics(camera_pixels, image, mask, hillas)
+
+        for container, expected_container in zip(result, expected):
+            assert type(container) is type(expected_container)
+            for key, value in container.items():
+                expected_value = expected_container[key]
+                assert type(value) is type(expected_value), key
+                assert np.isclose(value, expected_value, rtol=1e-4), key
+
+
+def test_camera_pixels_border():
+    from ctapipe.image import CameraPixels
+
+    geom = CameraGeometry.make_rectangular(10, 10)
+    camera_pixels = CameraPixels.from_geometry(geom)
+
+    border_1 = geom.get_border_pixel_mask(1)
+    border_2 = geom.get_border_pixel_mask(2)
+    np.testing.assert_array_equal(camera_pixels.border_width == 1, border_1)
+    np.testing.assert_array_equal(camera_pixels.border_width > 0, border_2)
+    assert camera_pixels.unit == u.m
+
+
+def test_leakage_concentration_statistics_single_pixel():
+    from ctapipe.image import CameraPixels, leakage_concentration_statistics
+
+    geom = CameraGeometry.make_rectangular(10, 10)
+    image = np.zeros(geom.n_pixels)
+    mask = np.zeros(geom.n_pixels, dtype=bool)
+    image[0] = 5.0
+    mask[0] = True
+
+    hillas = HillasParametersContainer(
+        fov_lon=geom.pix_x[0].value * u.deg,
+        fov_lat=geom.pix_y[0].value * u.deg,
+        intensity=5.0,
+        length=0 * u.deg,
+        width=0 * u.deg,
+        psi=0 * u.deg,
+    )
+    camera_pixels = CameraPixels.from_geometry(geom)._replace(unit=u.deg)
+    leakage, concentration, statistics = leakage_concentration_statistics(
+        camera_pixels, image, mask, hillas
+    )
+
+    assert leakage.pixels_width_1 == 0.01
+    assert leakage.pixels_width_2 == 0.01
+    assert leakage.intensity_width_1 == 1.0
+    assert leakage.intensity_width_2 == 1.0
+    assert concentration.cog == 1.0
+    assert concentration.core == 0.0
+    assert concentration.pixel == 1.0
+    assert statistics.mean == 5.0
+    assert statistics.std == 0.0
+    assert np.isnan(statistics.skewness)
+    assert np.isnan(statistics.kurtosis)
@@ -16,6 +16,8 @@ from ctapipe.image.extractor import (
     NeighborPeakWindowSum,
     SlidingWindowMaxSum,
     TwoPassWindowSum,
+    _cached_integration_correction,
+    _reference_pulse_key,
     extract_around_peak,
     extract_sliding_window,
     integration_correction,
@@ -23,7 +25,7 @@ from ctapipe.image.extractor import (
     subtract_baseline,
 )
 from ctapipe.image.toymodel import SkewedGaussian, WaveformModel, obtain_time_image
-from ctapipe.instrument import SubarrayDescription
+from ctapipe.instrument import CameraReadout, SubarrayDescription
 
 extractors = non_abstract_children(ImageExtractor)
 # FixedWindowSum has no peak finding and need to be set manually
@@ -291,6 +293,56 @@ def test_integration_correction_outofbounds(subarray):
                 np.testing.assert_allclose(full_integral, window_integral * correction)
 
 
+def test_cached_integration_correction():
+    """Test the process-wide cache agrees with integration_correction"""
+    reference_pulse_sample_width = 0.1
+    ref_time = np.arange(0, 40, reference_pulse_sample_width)
+    reference_pulse_shape = np.array(
+        [norm.pdf(ref_time, 10, 2), norm.pdf(ref_time, 12, 3)]
+    )
+    readout = CameraReadout(
+        name="test",
+        sampling_rate=u.Quantity(1.0, u.GHz),
+        reference_pulse_shape=reference_pulse_shape,
+        reference_pulse_sample_width=u.Quantity(reference_pulse_sample_width, u.ns),
+        n_channels=2,
+        n_pixels=10,
+        n_samples=40,
+    )
+    pulse_key = _reference_pulse_key(readout)
+
+    for window_width in range(0, 45):
+        for window_shift in range(-45, 45):
+            expected = integration_correction(
+                reference_pulse_shape,
+                reference_pulse_sample_width,
+                1.0,
+                window_width,
+                window_shift,
+            )
+            correction = _cached_integration_correction(
+                pulse_key, window_width, window_shift
+            )
+            assert_equal(correction, expected)
+
+    # the same array is shared by all callers and must not be modified
+    correction = _cached_integration_correction(pulse_key, 5, 2)
+    assert (
+        _cached_integration_correction(_reference_pulse_key(readout), 5, 2)
+        is correction
+    )
+    assert not correction.flags.writeable
+
+    # modifying the readout must not return outdated values
+    readout.sampling_rate = u.Quantity(2.0, u.GHz)
+    expected = integration_correction(
+        reference_pulse_shape, reference_pulse_sample_width, 0.5, 5, 2
+    )
+    assert_equal(
+        _cached_integration_correction(_reference_pulse_key(readout), 5, 2), expected
+    )
+
+
 @pytest.mark.parametrize("Extractor", extractors)
 def test_extractors(Extractor, toymodel):
     (
@@ -503,6 +555,82 @@ def test_Two_pass_window_sum_no_noise(subarray_1_LST):
     )
 
 
+def test_two_pass_first_pass():
+    from scipy.ndimage import convolve1d
+
+    from ctapipe.image.extractor import _two_pass_first_pass
+
+    rng = np.random.default_rng(0)
+    waveforms = rng.normal(0, 5, (100, 30)).astype(np.float32)
+    waveforms[:, 12:15] += rng.uniform(0, 100, (100, 1)).astype(np.float32)
+
+    charge, peak_time = _two_pass_first_pass(waveforms, 2.0)
+
+    # reference implementation with a 3 sample box filter
+    sums = convolve1d(waveforms, np.ones(3), axis=1, mode="nearest")
+    peak_index = np.argmax(sums[:, 2:-2], axis=1) + 2
+    expected_charge, expected_peak_time = extract_around_peak(
+        waveforms, peak_index, 5, 2, 2.0
+    )
+
+    assert_equal(charge, expected_charge)
+    assert_equal(peak_time, expected_peak_time)
+
+
+def test_two_pass_main_island():
+    from ctapipe.image import brightest_island, number_of_islands, tailcuts_clean
+    from ctapipe.image.extractor import _two_pass_main_island
+    from ctapipe.image.hillas import hillas_parameters
+    from ctapipe.instrument import CameraGeometry
+
+    geometry = CameraGeometry.make_rectangular(30, 30)
+    neighbors = geometry.neighbor_matrix_sparse
+    rng = np.random.default_rng(0)
+
+    for _ in range(20):
+        image = rng.normal(0, 2, geometry.n_pixels)
+        for _ in range(3):
+            model = SkewedGaussian(
+                *rng.uniform(-0.3, 0.3, 2) * u.m,
+                length=0.1 * u.m,
+                width=0.03 * u.m,
+                psi=rng.uniform(0, 180) * u.deg,
+                skewness=0,
+            )
+            image += model.expected_signal(geometry, rng.uniform(50, 500))
+
+        mask, cog_x, cog_y, psi = _two_pass_main_island(
+            image,
+            neighbors.indices,
+            neighbors.indptr,
+            geometry.pix_x.value,
+            geometry.pix_y.value,
+            6.0,
+        )
+
+        expected = tailcuts_clean(
+            geometry,
+            image,
+            picture_thresh=6.0,
+            boundary_thresh=3.0,
+            keep_isolated_pixels=False,
+            min_number_picture_neighbors=1,
+        )
+        n_islands, labels = number_of_islands(geometry, expected)
+        if n_islands > 0:
+            expected = brightest_island(n_islands, labels, image)
+        assert_equal(mask, expected)
+
+        if np.count_nonzero(mask) < 3:
+            assert np.isnan(psi)
+            continue
+
+        hillas = hillas_parameters(geometry[mask], image[mask])
+        assert cog_x == hillas.x.value
+        assert cog_y == hillas.y.value
+        assert psi == hillas.psi.to_value(u.rad)
+
+
 def test_waveform_extractor_factory(toymodel):
     (
         waveforms,
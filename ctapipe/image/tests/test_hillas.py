@@ -257,6 +257,48 @@ def test_single_pixel():
     assert np.isnan(hillas.psi)
 
 
+def test_hillas_pca_reference():
+    """Compare the compiled implementation to a PCA using numpy"""
+    geom = CameraGeometry.make_rectangular(npix_x=40, npix_y=40)
+    rng = np.random.default_rng(0)
+
+    for psi in np.linspace(-90, 90, 13) * u.deg:
+        model = toymodel.Gaussian(
+            x=0.1 * u.m, y=-0.2 * u.m, width=0.03 * u.m, length=0.1 * u.m, psi=psi
+        )
+        image, _, _ = model.generate_image(
+            geom, intensity=1000, nsb_level_pe=3, rng=rng
+        )
+        mask = tailcuts_clean(geom, image, 10, 5)
+        pix_x = geom.pix_x.to_value(u.m)[mask]
+        pix_y = geom.pix_y.to_value(u.m)[mask]
+        weights = image[mask]
+
+        hillas = hillas_parameters(geom[mask], weights)
+
+        cog_x = np.average(pix_x, weights=weights)
+        cog_y = np.average(pix_y, weights=weights)
+        cov = np.cov(pix_x - cog_x, pix_y - cog_y, aweights=weights, ddof=0)
+        eig_vals, eig_vecs = np.linalg.eigh(cov)
+        width, length = np.sqrt(eig_vals)
+        ref_psi = np.arctan(eig_vecs[1, 1] / eig_vecs[0, 1])
+        longitudinal = (pix_x - cog_x) * np.cos(ref_psi) + (pix_y - cog_y) * np.sin(
+            ref_psi
+        )
+
+        assert hillas.x.to_value(u.m) == approx(cog_x)
+        assert hillas.y.to_value(u.m) == approx(cog_y)
+        assert hillas.length.to_value(u.m) == approx(length)
+        assert hillas.width.to_value(u.m) == approx(width)
+        assert hillas.psi.to_value(u.rad) == approx(ref_psi)
+        assert hillas.skewness == approx(
+            np.average(longitudinal**3, weights=weights) / length**3
+        )
+        assert hillas.kurtosis == approx(
+            np.average(longitudinal**4, weights=weights) / length**4
+        )
+
+
 def test_reconstruction_in_telescope_frame(prod5_lst):
     """
     Compare the reconstruction in the telescope
@@ -55,3 +55,34 @@ def test_image_cleaner(method, prod5_mst_nectarcam):
 def test_image_cleaner_no_subarray(method):
     with pytest.raises(TypeError):
         ImageCleaner.from_name(method)
+
+
+@pytest.mark.parametrize("method", ImageCleaner.non_abstract_subclasses().keys())
+def test_clean_batch(method, prod5_mst_nectarcam):
+    """Cleaning a batch of images gives the same masks as image by image"""
+    tel_id = 1
+    subarray = SubarrayDescription(
+        name="test",
+        tel_positions={tel_id: None},
+        tel_descriptions={tel_id: prod5_mst_nectarcam},
+    )
+    geometry = prod5_mst_nectarcam.camera.geometry
+
+    rng = np.random.default_rng(0)
+    images = rng.exponential(3, (5, geometry.n_pixels))
+    arrival_times = rng.normal(20, 3, (5, geometry.n_pixels))
+
+    clean = ImageCleaner.from_name(method, subarray=subarray)
+    masks = clean.clean_batch(tel_id, images, arrival_times)
+    assert masks.shape == images.shape
+    assert masks.dtype == bool
+    assert masks.flags.writeable
+    assert np.count_nonzero(masks) > 0
+
+    for image, times, mask in zip(images, arrival_times, masks):
+        np.testing.assert_array_equal(mask, clean(tel_id, image, times))
+
+    empty = np.empty((0, geometry.n_pixels))
+    empty_masks = clean.clean_batch(tel_id, empty, empty)
+    assert empty_masks.shape == empty.shape
+    assert empty_masks.flags.writeable
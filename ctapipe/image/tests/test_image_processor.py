@@ -85,3 +85,59 @@ def test_image_processor_camera_frame(example_event, example_subarray):
         assert isinstance(dl1.parameters.timing, CameraTimingParametersContainer)
         assert np.isnan(dl1.parameters.hillas.length.value)
         assert dl1.parameters.hillas.length.unit == u.m
+
+
+def test_image_processor_chunk(example_event, example_subarray):
+    """process_chunk must give the same result as the event-wise processing"""
+    event = deepcopy(example_event)
+
+    calibrate = CameraCalibrator(subarray=example_subarray)
+    process_images = ImageProcessor(subarray=example_subarray)
+
+    calibrate(event)
+    process_images(event)
+
+    for tel_id, dl1 in event.dl1.tel.items():
+        # second image is empty and must get the default values
+        images = np.stack([dl1.image, np.zeros_like(dl1.image)])
+        peak_times = np.stack([dl1.peak_time, dl1.peak_time])
+        masks, parameters = process_images.process_chunk(tel_id, images, peak_times)
+
+        np.testing.assert_array_equal(masks[0], dl1.image_mask)
+        assert not np.any(masks[1])
+
+        expected = dl1.parameters.as_dict(recursive=True, flatten=True, add_prefix=True)
+        for colname in parameters.colnames:
+            value = u.Quantity(expected[colname]).to_value(parameters[colname].unit)
+            assert np.isclose(parameters[colname][0], value, equal_nan=True), colname
+
+        assert np.isnan(parameters["hillas_length"][1])
+
+
+def test_image_processor_true_chunk(example_event, example_subarray):
+    """process_true_chunk must give the same result as the event-wise processing"""
+    event = deepcopy(example_event)
+
+    calibrate = CameraCalibrator(subarray=example_subarray)
+    process_images = ImageProcessor(subarray=example_subarray)
+
+    calibrate(event)
+    process_images(event)
+
+    for tel_id, sim in event.simulation.tel.items():
+        if sim.true_image is None:
+            continue
+
+        true_images = np.stack([sim.true_image, np.zeros_like(sim.true_image)])
+        parameters = process_images.process_true_chunk(tel_id, true_images)
+
+        expected = sim.true_parameters.as_dict(
+            recursive=True, flatten=True, add_prefix=True
+        )
+        for colname in parameters.colnames:
+            value = u.Quantity(expected[colname]).to_value(parameters[colname].unit)
+            assert np.isclose(parameters[colname][0], value, equal_nan=True), colname
+
+        # empty image gets the default values of the true parameters
+        assert np.isnan(parameters["true_hillas_length"][1])
+        assert parameters["true_intensity_max"][1] == -1
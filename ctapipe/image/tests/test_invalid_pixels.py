@@ -59,3 +59,62 @@ def test_negative_image(prod5_gamma_simtel_path):
     )
     assert np.allclose(interpolated_image[broken_pixels], -10)
     assert np.allclose(interpolated_peaktime[broken_pixels], 20.0)
+
+
+def test_neighbor_average_batch(prod5_gamma_simtel_path):
+    """Test handling several images at once gives the same as one by one"""
+    from ctapipe.image.invalid_pixels import NeighborAverage
+
+    with EventSource(prod5_gamma_simtel_path) as source:
+        subarray = source.subarray
+        geometry = subarray.tel[1].camera.geometry
+
+    neighbor_average = NeighborAverage(subarray)
+    assert neighbor_average.supports_batches
+
+    rng = np.random.default_rng(0)
+    shape = (5, geometry.n_pixels)
+    image = rng.normal(10, 5, shape).astype(np.float32)
+    peak_time = rng.uniform(0, 40, shape).astype(np.float32)
+    broken_pixels = rng.uniform(size=shape) < 0.05
+    # one image without broken pixels
+    broken_pixels[2] = False
+
+    interpolated_image, interpolated_peaktime = neighbor_average(
+        tel_id=1, image=image, peak_time=peak_time, pixel_mask=broken_pixels
+    )
+    assert interpolated_image.dtype == np.float32
+    assert interpolated_image.shape == shape
+
+    for i in range(shape[0]):
+        expected_image, expected_peaktime = neighbor_average(
+            tel_id=1,
+            image=image[i],
+            peak_time=peak_time[i],
+            pixel_mask=broken_pixels[i],
+        )
+        np.testing.assert_array_equal(interpolated_image[i], expected_image)
+        np.testing.assert_array_equal(interpolated_peaktime[i], expected_peaktime)
+
+    # inputs are not modified
+    assert not np.array_equal(interpolated_image, image)
+
+
+def test_no_invalid_pixels(prod5_gamma_simtel_path):
+    """Without pixels to interpolate, the inputs are returned unchanged"""
+    from ctapipe.image.invalid_pixels import NeighborAverage
+
+    with EventSource(prod5_gamma_simtel_path) as source:
+        subarray = source.subarray
+        geometry = subarray.tel[1].camera.geometry
+
+    neighbor_average = NeighborAverage(subarray)
+    image = np.ones(geometry.n_pixels)
+    peak_time = np.full(geometry.n_pixels, 20.0)
+    broken_pixels = np.zeros(geometry.n_pixels, dtype=bool)
+
+    result_image, result_peaktime = neighbor_average(
+        tel_id=1, image=image, peak_time=peak_time, pixel_mask=broken_pixels
+    )
+    assert result_image is image
+    assert result_peaktime is peak_time
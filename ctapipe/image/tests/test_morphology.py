@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 from numpy.testing import assert_allclose
 
 from ctapipe.instrument import CameraGeometry
@@ -124,3 +125,57 @@ def test_brightest_island():
     no_island_mask = brightest_island(0, island_labels, image)
     assert len(no_island_mask) == 3
     assert np.all(no_island_mask == False)
+
+
+def test_label_islands():
+    """Test the batch labeling against the single image functions"""
+    from ctapipe.image import (
+        brightest_island,
+        label_islands,
+        largest_island,
+        number_of_island_sizes,
+        number_of_islands,
+    )
+
+    geom = CameraGeometry.make_rectangular(20, 20)
+    rng = np.random.default_rng(0)
+    masks = rng.uniform(size=(10, geom.n_pixels)) < np.linspace(0, 0.8, 10)[:, None]
+    images = rng.uniform(0, 10, size=masks.shape)
+
+    islands = label_islands(geom, masks, images)
+    assert islands.labels.shape == masks.shape
+    assert islands.sizes.shape == (10, islands.n_islands.max() + 1)
+
+    largest = islands.select(islands.largest)
+    brightest = islands.select(islands.brightest)
+    for i, (mask, image) in enumerate(zip(masks, images)):
+        n_islands, labels = number_of_islands(geom, mask)
+        assert islands.n_islands[i] == n_islands
+        np.testing.assert_array_equal(islands.labels[i], labels)
+        np.testing.assert_array_equal(
+            islands.sizes[i, 1 : n_islands + 1], np.bincount(labels)[1:]
+        )
+        assert np.all(islands.sizes[i, n_islands + 1 :] == 0)
+
+        sizes = (islands.n_small[i], islands.n_medium[i], islands.n_large[i])
+        assert sizes == number_of_island_sizes(labels)
+        np.testing.assert_array_equal(largest[i], largest_island(labels))
+        np.testing.assert_array_equal(
+            brightest[i], brightest_island(n_islands, labels, image)
+        )
+
+    # first mask is empty
+    assert islands.n_islands[0] == 0
+    assert islands.largest[0] == 0
+    assert not largest[0].any()
+
+    # brightest island only with images
+    assert label_islands(geom, masks).brightest is None
+
+    # empty stack
+    islands = label_islands(geom, np.zeros((0, geom.n_pixels), dtype=bool))
+    assert islands.labels.shape == (0, geom.n_pixels)
+    assert islands.sizes.shape == (0, 1)
+
+    with pytest.raises(ValueError, match="masks must have shape"):
+        label_islands(geom, masks[:, :-1])
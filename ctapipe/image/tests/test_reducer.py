@@ -88,3 +88,42 @@ def test_tailcuts_data_volume_reducer(subarray_lst):
 
     assert (reduced_waveforms != 0).sum() == (1 + 4 + 14) * n_samples
     assert_array_equal(expected_waveforms, reduced_waveforms)
+
+
+@pytest.mark.parametrize("cleaner", ["TailcutsImageCleaner", "MARSImageCleaner"])
+def test_tailcuts_data_volume_reducer_batch(subarray_lst, cleaner):
+    """Selecting the pixels of several events at once gives the same masks"""
+    from ctapipe.image import ImageCleaner
+
+    subarray, tel_id, selected_gain_channel, n_pixels, n_samples = subarray_lst
+
+    rng = np.random.default_rng(0)
+    n_events = 10
+    waveforms = rng.normal(0, 1, (n_events, n_pixels, n_samples))
+    # a bright pixel and its neighbors in each event
+    neighbors = subarray.tel[tel_id].camera.geometry.neighbor_matrix
+    for event_waveforms in waveforms:
+        pixel = rng.integers(n_pixels)
+        event_waveforms[neighbors[pixel], 10:15] += rng.uniform(5, 20)
+        event_waveforms[pixel, 10:15] += 30
+
+    reducer = TailCutsDataVolumeReducer(
+        subarray=subarray,
+        cleaner=ImageCleaner.from_name(cleaner, subarray=subarray),
+        n_end_dilates=2,
+    )
+    masks = reducer.select_pixels_batch(
+        waveforms,
+        tel_id=tel_id,
+        selected_gain_channel=np.tile(selected_gain_channel, (n_events, 1)),
+    )
+    assert masks.shape == (n_events, n_pixels)
+    assert masks.any()
+
+    for event_waveforms, mask in zip(waveforms, masks):
+        expected = reducer(
+            event_waveforms,
+            tel_id=tel_id,
+            selected_gain_channel=selected_gain_channel,
+        )
+        assert_array_equal(mask, expected)
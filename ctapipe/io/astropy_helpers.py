@@ -84,8 +84,6 @@ def read_table(
             raise IOError(
                 f"Node {path} is a {table.__class__.__name__}, must be a Table"
             )
-        transforms, descriptions, meta = _parse_hdf5_attrs(table)
-
         if condition is None:
             array = table.read(start=start, stop=stop, step=step)
         else:
@@ -93,24 +91,51 @@ def read_table(
                 condition=condition, start=start, stop=stop, step=step
             )
 
-        astropy_table = table_cls(array, meta=meta, copy=False)
-        for column, tr in transforms.items():
-            if column not in astropy_table.colnames:
-                continue
+        return _to_astropy_table(table, array, table_cls=table_cls)
+
+
+def _read_table_rows(h5file, path, rows, table_cls=Table) -> Table:
+    """Read the rows with the given indices of a ctapipe format table.
+
+    Same as `read_table`, but selecting rows by their index, which
+    is much faster than using a ``condition`` if the rows are already known.
+
+    Parameters
+    ----------
+    h5file: tables.file.File
+        input PyTables file handle
+    path: str
+        path to table in the file
+    rows: np.ndarray[int]
+        increasing indices of the rows to read
+    """
+    table = h5file.get_node(path)
+    array = table.read_coordinates(rows)
+    return _to_astropy_table(table, array, table_cls=table_cls)
+
+
+def _to_astropy_table(table, array, table_cls=Table):
+    """Convert rows read from ``table`` to astropy, inversing the column transforms"""
+    transforms, descriptions, meta = _parse_hdf5_attrs(table)
+
+    astropy_table = table_cls(array, meta=meta, copy=False)
+    for column, tr in transforms.items():
+        if column not in astropy_table.colnames:
+            continue
 
-            # keep enums as integers, much easier to deal with in tables
-            if isinstance(tr, EnumColumnTransform):
-                continue
+        # keep enums as integers, much easier to deal with in tables
+        if isinstance(tr, EnumColumnTransform):
+            continue
 
-            astropy_table[column] = tr.inverse(astropy_table[column])
+        astropy_table[column] = tr.inverse(astropy_table[column])
 
-        for column, desc in descriptions.items():
-            if column not in astropy_table.colnames:
-                continue
+    for column, desc in descriptions.items():
+        if column not in astropy_table.colnames:
+            continue
 
-            astropy_table[column].description = desc
+        astropy_table[column].description = desc
 
-        return astropy_table
+    return astropy_table
 
 
 def write_table(
@@ -28,6 +28,7 @@ from .eventsource import EventSource
 from .hdf5tableio import HDF5TableWriter
 from .simteleventsource import SimTelEventSource
 from .tableio import FixedPointColumnTransform, TableWriter, TelListToMaskTransform
+from .tableloader import R0_WAVEFORM_GROUP, R1_WAVEFORM_GROUP
 
 __all__ = ["DataWriter", "DATA_MODEL_VERSION", "write_reference_metadata_headers"]
 
@@ -42,14 +43,22 @@ def _get_tel_index(event, tel_id):
     )
 
 
+#: target size of one chunk of the waveform arrays
+WAVEFORM_CHUNK_BYTES = 1024**2
+
+
 # define the version of the data model written here. This should be updated
 # when necessary:
 # - increase the major number if there is a breaking change to the model
 #   (meaning readers need to update scripts)
 # - increase the minor number if new columns or datasets are added
 # - increase the patch number if there is a small bugfix to the model.
-DATA_MODEL_VERSION = "v5.0.0"
+DATA_MODEL_VERSION = "v5.1.0"
 DATA_MODEL_CHANGE_HISTORY = """
+- v5.1.0: - Added the option to store R0 and R1 waveforms in one array per telescope
+            under /r0/event/waveform and /r1/event/waveform instead of as a column
+            of the telescope event tables. The telescope event tables then have
+            no waveform column, the rows of the arrays match the rows of the tables.
 - v5.0.0: - Change DL2 telescope-wise container prefixes from {algorithm}_tel to {algorithm}_tel_{kind}.
             As of now, this only changes 'tel_distance' to 'tel_impact_distance'
 - v4.0.0: - Changed how ctapipe-specific metadata is stored in hdf5 attributes.
@@ -221,6 +230,18 @@ class DataWriter(Component):
 
     overwrite = Bool(help="overwrite output file if it exists").tag(config=True)
 
+    waveform_storage = CaselessStrEnum(
+        values=["table", "array"],
+        default_value="table",
+        help=(
+            "How to store R0 and R1 waveforms. 'table' stores them as a column"
+            " of the compressed telescope event tables. 'array' stores them"
+            " uncompressed in one chunked array of shape (n_events, ...) per"
+            " telescope, which is much faster to read back, at the cost of"
+            " larger files."
+        ),
+    ).tag(config=True)
+
     transform_waveform = Bool(default_value=False).tag(config=True)
     waveform_dtype = Unicode(default_value="int32").tag(config=True)
     waveform_offset = Int(default_value=0).tag(config=True)
@@ -264,6 +285,7 @@ class DataWriter(Component):
         self._subarray: SubarrayDescription = event_source.subarray
 
         self._hdf5_filters = None
+        self._waveform_arrays = {}
 
         self._setup_output_path()
         self._setup_compression()
@@ -340,6 +362,9 @@ class DataWriter(Component):
         if not self._at_least_one_event:
             self.log.warning("No events have been written to the output file")
 
+        # write all rows still buffered in the table writer
+        self._writer.flush()
+
         if self.write_index_tables:
             self._generate_indices()
 
@@ -415,6 +440,11 @@ class DataWriter(Component):
                 "DataWriter configured to write no information"
             )
 
+        if self.waveform_storage == "array" and self.transform_waveform:
+            raise ToolConfigurationError(
+                "transform_waveform is not supported with waveform_storage='array'"
+            )
+
     def _setup_writer(self):
         """
         Create a TableWriter and setup any column exclusions
@@ -455,6 +485,11 @@ class DataWriter(Component):
         if not self.write_parameters:
             writer.exclude("/dl1/event/telescope/images/.*", "image_mask")
 
+        # waveforms are written to separate arrays, see _write_waveform
+        if self.waveform_storage == "array":
+            writer.exclude("r0/event/telescope/.*", "waveform")
+            writer.exclude("r1/event/telescope/.*", "waveform")
+
         # Set up transforms
         if self.transform_image:
             transform = FixedPointColumnTransform(
@@ -623,6 +658,9 @@ class DataWriter(Component):
             r1_tel.prefix = ""
             writer.write(f"r1/event/telescope/{table_name}", [tel_index, r1_tel])
 
+            if self.waveform_storage == "array":
+                self._write_waveform(R1_WAVEFORM_GROUP, table_name, r1_tel.waveform)
+
     def _write_r0_telescope_events(
         self, writer: TableWriter, event: ArrayEventContainer
     ):
@@ -634,6 +672,36 @@ class DataWriter(Component):
             r0_tel.prefix = ""
             writer.write(f"r0/event/telescope/{table_name}", [tel_index, r0_tel])
 
+            if self.waveform_storage == "array":
+                self._write_waveform(R0_WAVEFORM_GROUP, table_name, r0_tel.waveform)
+
+    def _write_waveform(self, group, table_name, waveform):
+        """
+        Append the waveform of one telescope event to the array of that telescope.
+
+        The rows of the array correspond to the rows of the telescope event table.
+        The array is not compressed and chunked along the events, so that
+        blocks of events can be read back by slicing at disk speed.
+        """
+        path = f"{group}/{table_name}"
+        array = self._waveform_arrays.get(path)
+        waveform = np.asanyarray(waveform)
+
+        if array is None:
+            n_events_per_chunk = max(1, WAVEFORM_CHUNK_BYTES // waveform.nbytes)
+            array = self._writer.h5file.create_earray(
+                group,
+                table_name,
+                atom=tables.Atom.from_dtype(waveform.dtype),
+                shape=(0, *waveform.shape),
+                chunkshape=(n_events_per_chunk, *waveform.shape),
+                filters=tables.Filters(complevel=0),
+                createparents=True,
+            )
+            self._waveform_arrays[path] = array
+
+        array.append(waveform[np.newaxis])
+
     def _write_dl1_telescope_events(
         self, writer: TableWriter, event: ArrayEventContainer
     ):
@@ -44,14 +44,14 @@ from ..containers import (
     TriggerContainer,
 )
 from ..core import Container, Field
-from ..core.traits import UseEnum
+from ..core.traits import Integer, UseEnum
 from ..instrument import SubarrayDescription
 from ..utils import IndexFinder
 from .astropy_helpers import read_table
 from .datalevels import DataLevel
 from .eventsource import EventSource
-from .hdf5tableio import HDF5TableReader, get_column_attrs
-from .tableloader import DL2_SUBARRAY_GROUP, DL2_TELESCOPE_GROUP
+from .hdf5tableio import MAX_BUFFER_BYTES, HDF5TableReader
+from .tableloader import DL2_SUBARRAY_GROUP, DL2_TELESCOPE_GROUP, R1_WAVEFORM_GROUP
 
 __all__ = ["HDF5EventSource"]
 
@@ -70,6 +70,7 @@ DL2_CONTAINERS = {
 COMPATIBLE_DATA_MODEL_VERSIONS = [
     "v4.0.0",
     "v5.0.0",
+    "v5.1.0",
 ]
 
 
@@ -175,6 +176,15 @@ class HDF5EventSource(EventSource):
         ),
     ).tag(config=True)
 
+    chunk_size = Integer(
+        default_value=1000,
+        min=1,
+        help=(
+            "Number of rows read at once from each table of the input file."
+            " Events are then filled from these chunks in memory."
+        ),
+    ).tag(config=True)
+
     def __init__(self, input_url=None, config=None, parent=None, **kwargs):
         """
         EventSource for dl1 files in the standard DL1 data format
@@ -394,9 +404,7 @@ class HDF5EventSource(EventSource):
 
         if DataLevel.R1 in self.datalevels:
             waveform_readers = {
-                table.name: self.reader.read(
-                    f"/r1/event/telescope/{table.name}", R1CameraContainer
-                )
+                table.name: self._read_r1(table.name)
                 for table in self.file_.root.r1.event.telescope
             }
 
@@ -412,6 +420,7 @@ class HDF5EventSource(EventSource):
                     f"/dl1/event/telescope/images/{table.name}",
                     DL1CameraContainer,
                     ignore_columns=ignore_columns,
+                    chunk_size=self.chunk_size,
                 )
                 for table in self.file_.root.dl1.event.telescope.images
             }
@@ -456,6 +465,7 @@ class HDF5EventSource(EventSource):
                         "intensity",
                         "peak_time",
                     ],
+                    chunk_size=self.chunk_size,
                 )
                 for table in self.file_.root.dl1.event.telescope.parameters
             }
@@ -477,6 +487,7 @@ class HDF5EventSource(EventSource):
                             "true_morphology",
                             "true_intensity",
                         ],
+                        chunk_size=self.chunk_size,
                     )
                     for table in self.file_.root.dl1.event.telescope.parameters
                 }
@@ -490,6 +501,7 @@ class HDF5EventSource(EventSource):
                         MuonParametersContainer,
                         MuonEfficiencyContainer,
                     ],
+                    chunk_size=self.chunk_size,
                 )
                 for table in self.file_.root.dl1.event.telescope.muon
             }
@@ -511,6 +523,7 @@ class HDF5EventSource(EventSource):
                         table._v_pathname,
                         containers=container,
                         prefixes=(algorithm,),
+                        chunk_size=self.chunk_size,
                     )
                     for algorithm, table in group._v_children.items()
                 }
@@ -532,6 +545,7 @@ class HDF5EventSource(EventSource):
                         key: HDF5TableReader(self.file_).read(
                             table._v_pathname,
                             containers=container,
+                            chunk_size=self.chunk_size,
                         )
                         for key, table in algorithm_group._v_children.items()
                     }
@@ -543,6 +557,7 @@ class HDF5EventSource(EventSource):
                 "/simulation/event/subarray/shower",
                 SimulatedShowerContainer,
                 prefixes="true",
+                chunk_size=self.chunk_size,
             )
             if "impact" in self.file_.root.simulation.event.telescope:
                 true_impact_readers = {
@@ -550,6 +565,7 @@ class HDF5EventSource(EventSource):
                         f"/simulation/event/telescope/impact/{table.name}",
                         containers=TelescopeImpactParameterContainer,
                         prefixes=["true_impact"],
+                        chunk_size=self.chunk_size,
                     )
                     for table in self.file_.root.simulation.event.telescope.impact
                 }
@@ -559,11 +575,13 @@ class HDF5EventSource(EventSource):
             "/dl1/event/subarray/trigger",
             [TriggerContainer, EventIndexContainer],
             ignore_columns={"tel"},
+            chunk_size=self.chunk_size,
         )
         telescope_trigger_reader = HDF5TableReader(self.file_).read(
             "/dl1/event/telescope/trigger",
             [TelEventIndexContainer, TelescopeTriggerContainer],
             ignore_columns={"trigger_pixels"},
+            chunk_size=self.chunk_size,
         )
 
         array_pointing_finder = IndexFinder(
@@ -575,6 +593,7 @@ class HDF5EventSource(EventSource):
             for table in self.file_.root.dl1.monitoring.telescope.pointing
         }
 
+        origin = self.file_.root._v_attrs["CTA PROCESS TYPE"]
         counter = 0
         for trigger, index in events:
             data = ArrayEventContainer(
@@ -585,7 +604,7 @@ class HDF5EventSource(EventSource):
             )
             # Maybe take some other metadata, but there are still some 'unknown'
             # written out by the stage1 tool
-            data.meta["origin"] = self.file_.root._v_attrs["CTA PROCESS TYPE"]
+            data.meta["origin"] = origin
             data.meta["input_url"] = self.input_url
             data.meta["max_events"] = self.max_events
 
@@ -693,15 +712,51 @@ class HDF5EventSource(EventSource):
             yield data
             counter += 1
 
+    def _read_r1(self, table_name):
+        """Iterate over the R1CameraContainers of one telescope"""
+        table_path = f"/r1/event/telescope/{table_name}"
+        array_path = f"{R1_WAVEFORM_GROUP}/{table_name}"
+
+        # waveform arrays were introduced in data model version v5.1.0
+        if self.datamodel_version < (5, 1, 0) or array_path not in self.file_.root:
+            yield from self.reader.read(
+                table_path, R1CameraContainer, chunk_size=self.chunk_size
+            )
+            return
+
+        # waveforms are stored in a separate array, read them in blocks
+        # and fill each container with a view into the block
+        containers = self.reader.read(
+            table_path,
+            R1CameraContainer,
+            prefixes=False,
+            ignore_columns={"waveform"},
+            chunk_size=self.chunk_size,
+        )
+        waveforms = self.file_.root[array_path]
+        row_bytes = max(1, waveforms.atom.size * int(np.prod(waveforms.shape[1:])))
+        block_size = max(1, min(self.chunk_size, MAX_BUFFER_BYTES // row_bytes))
+
+        for start in range(0, waveforms.nrows, block_size):
+            for waveform in waveforms.read(start, start + block_size):
+                r1 = next(containers)
+                r1.waveform = waveform
+                yield r1
+
     @lazyproperty
-    def _subarray_pointing_attrs(self):
-        table = self.file_.root.dl1.monitoring.subarray.pointing
-        return get_column_attrs(table)
+    def _subarray_pointing(self):
+        """Columns of the array pointing table, read once"""
+        table = read_table(self.file_, "/dl1/monitoring/subarray/pointing")
+        columns = ("array_azimuth", "array_altitude", "array_ra", "array_dec")
+        return {col: u.Quantity(table[col]) for col in columns}
 
     @lru_cache(maxsize=1000)
-    def _telescope_pointing_attrs(self, tel_id):
-        pointing_group = self.file_.root.dl1.monitoring.telescope.pointing
-        return get_column_attrs(pointing_group[f"tel_{tel_id:03d}"])
+    def _telescope_pointing(self, tel_id):
+        """Columns of the pointing table of a telescope, read once"""
+        table = read_table(
+            self.file_, f"/dl1/monitoring/telescope/pointing/tel_{tel_id:03d}"
+        )
+        return {col: u.Quantity(table[col]) for col in ("azimuth", "altitude")}
 
     def _fill_array_pointing(self, data, array_pointing_finder):
         """
@@ -710,50 +765,24 @@ class HDF5EventSource(EventSource):
         # Only unique pointings are stored, so reader.read() wont work as easily
         # Thats why we match the pointings based on trigger time
         closest_time_index = array_pointing_finder.closest(data.trigger.time.mjd)
-        table = self.file_.root.dl1.monitoring.subarray.pointing
-        array_pointing = table[closest_time_index]
-
-        data.pointing.array_azimuth = u.Quantity(
-            array_pointing["array_azimuth"],
-            self._subarray_pointing_attrs["array_azimuth"]["UNIT"],
-        )
-        data.pointing.array_altitude = u.Quantity(
-            array_pointing["array_altitude"],
-            self._subarray_pointing_attrs["array_altitude"]["UNIT"],
-        )
-        data.pointing.array_ra = u.Quantity(
-            array_pointing["array_ra"],
-            self._subarray_pointing_attrs["array_ra"]["UNIT"],
-        )
-        data.pointing.array_dec = u.Quantity(
-            array_pointing["array_dec"],
-            self._subarray_pointing_attrs["array_dec"]["UNIT"],
-        )
+        for col, values in self._subarray_pointing.items():
+            setattr(data.pointing, col, values[closest_time_index])
 
     def _fill_telescope_pointing(self, data, tel_pointing_finder):
         """
         Fill the telescope pointing information of a given event
         """
         # Same comments as to _fill_array_pointing apply
-        pointing_group = self.file_.root.dl1.monitoring.telescope.pointing
         for tel_id in data.trigger.tel.keys():
             key = f"tel_{tel_id:03d}"
 
             if self.allowed_tels and tel_id not in self.allowed_tels:
                 continue
 
-            tel_pointing_table = pointing_group[key]
             closest_time_index = tel_pointing_finder[key].closest(
                 data.trigger.tel[tel_id].time.mjd
             )
 
-            pointing_telescope = tel_pointing_table[closest_time_index]
-            attrs = self._telescope_pointing_attrs(tel_id)
-            data.pointing.tel[tel_id].azimuth = u.Quantity(
-                pointing_telescope["azimuth"],
-                attrs["azimuth"]["UNIT"],
-            )
-            data.pointing.tel[tel_id].altitude = u.Quantity(
-                pointing_telescope["altitude"],
-                attrs["altitude"]["UNIT"],
-            )
+            tel_pointing = data.pointing.tel[tel_id]
+            for col, values in self._telescope_pointing(tel_id).items():
+                setattr(tel_pointing, col, values[closest_time_index])
@@ -1,6 +1,8 @@
 import enum
+import multiprocessing
 import uuid
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import ExitStack
 from pathlib import Path
 from typing import Union
@@ -49,10 +51,13 @@ _NODES_TO_CHECK = {
 }
 
 
-def _get_required_nodes(h5file):
+def _get_required_nodes(h5file, nodes_to_check=None):
     """Return nodes to be required in a new file for appending to ``h5file``"""
+    if nodes_to_check is None:
+        nodes_to_check = _NODES_TO_CHECK
+
     required_nodes = set()
-    for node, node_type in _NODES_TO_CHECK.items():
+    for node, node_type in nodes_to_check.items():
         if node not in h5file.root:
             continue
 
@@ -78,6 +83,56 @@ class CannotMerge(IOError):
     """Raised when trying to merge incompatible files"""
 
 
+def _read_meta(h5file):
+    try:
+        return metadata.Reference.from_dict(metadata.read_metadata(h5file))
+    except Exception:
+        raise CannotMerge(
+            f"CTA Reference meta not found in input file: {h5file.filename}"
+        )
+
+
+def _read_subarray(h5file):
+    # focal length choice doesn't matter here, set to equivalent so we don't get
+    # an error if only the effective focal length is available in the file
+    return SubarrayDescription.from_hdf(
+        h5file, focal_length_choice=FocalLengthKind.EQUIVALENT
+    )
+
+
+def _check_can_merge(other, data_model_version, required_nodes, subarray=None):
+    """
+    Raise `CannotMerge` if ``other`` cannot be appended to a file with the
+    given data model version, required nodes and subarray.
+    """
+    other_meta = _read_meta(other)
+    other_version = other_meta.product.data_model_version
+    if data_model_version != other_version:
+        raise CannotMerge(
+            f"Input file {other.filename!r} has different data model version:"
+            f" {other_version}, expected {data_model_version}"
+        )
+
+    for node_path in required_nodes:
+        if node_path not in other.root:
+            raise CannotMerge(
+                f"Required node {node_path} not found in {other.filename}"
+            )
+
+    if subarray is not None and _read_subarray(other) != subarray:
+        raise CannotMerge(f"Subarrays do not match for file: {other.filename}")
+
+
+def _check_file(path, data_model_version, required_nodes, subarray):
+    """Check a file can be merged, returns the `CannotMerge` error or None"""
+    try:
+        with tables.open_file(path, mode="r") as h5file:
+            _check_can_merge(h5file, data_model_version, required_nodes, subarray)
+    except CannotMerge as error:
+        return error
+    return None
+
+
 def split_h5path(path):
     """
     Split a path inside an hdf5 file into parent / child
@@ -197,18 +252,22 @@ class HDF5Merger(Component):
             self.meta = self._read_meta(self.h5file)
             self.data_model_version = self.meta.product.data_model_version
 
-            # focal length choice doesn't matter here, set to equivalent so we don't get
-            # an error if only the effective focal length is available in the file
-            self.subarray = SubarrayDescription.from_hdf(
-                self.h5file,
-                focal_length_choice=FocalLengthKind.EQUIVALENT,
-            )
+            self.subarray = _read_subarray(self.h5file)
             self.required_nodes = _get_required_nodes(self.h5file)
 
     def __call__(self, other: Union[str, Path, tables.File]):
         """
         Append file ``other`` to the output file
         """
+        self._append_file(other)
+
+    def _append_file(self, other, input_files=None):
+        """
+        Append file ``other`` to the output file.
+
+        ``input_files`` are added to the provenance instead of ``other``,
+        used when ``other`` is itself the result of merging these files.
+        """
         exit_stack = ExitStack()
         if not isinstance(other, tables.File):
             other = exit_stack.enter_context(tables.open_file(other, mode="r"))
@@ -222,7 +281,10 @@ class HDF5Merger(Component):
             else:
                 self._check_can_merge(other)
 
-            Provenance().add_input_file(other.filename, "data product to merge")
+            if input_files is None:
+                input_files = [other.filename]
+            for input_file in input_files:
+                Provenance().add_input_file(str(input_file), "data product to merge")
             try:
                 self._append(other)
                 # if first file, update required nodes
@@ -248,27 +310,104 @@ class HDF5Merger(Component):
         self.h5file.flush()
 
     def _read_meta(self, h5file):
-        try:
-            return metadata.Reference.from_dict(metadata.read_metadata(h5file))
-        except Exception:
-            raise CannotMerge(
-                f"CTA Reference meta not found in input file: {h5file.filename}"
-            )
+        return _read_meta(h5file)
 
     def _check_can_merge(self, other):
-        other_meta = self._read_meta(other)
-        other_version = other_meta.product.data_model_version
-        if self.data_model_version != other_version:
-            raise CannotMerge(
-                f"Input file {other.filename:!r} has different data model version:"
-                f" {other_version}, expected {self.data_model_version}"
-            )
+        _check_can_merge(other, self.data_model_version, self.required_nodes)
+
+    def _merged_nodes(self):
+        """The nodes checked for merge-ability that are merged with this configuration"""
+        telescope = self.telescope_events
+        simulation = self.simulation
+        included = {
+            "/configuration/observation/scheduling_block": True,
+            "/configuration/observation/observation_block": True,
+            "/configuration/simulation/run": simulation,
+            "/simulation/service/shower_distribution": simulation,
+            "/simulation/event/subarray/shower": simulation,
+            "/simulation/event/telescope/impact": telescope and simulation,
+            "/simulation/event/telescope/images": telescope and simulation,
+            "/simulation/event/telescope/parameters": (
+                telescope and simulation and self.true_parameters
+            ),
+            "/dl1/event/subarray/trigger": True,
+            "/dl1/event/telescope/trigger": telescope,
+            "/dl1/event/telescope/images": telescope and self.dl1_images,
+            "/dl1/event/telescope/parameters": telescope and self.dl1_parameters,
+            "/dl1/event/telescope/muon": telescope and self.dl1_muon,
+            "/dl2/event/telescope": telescope and self.dl2_telescope,
+            "/dl2/event/subarray": self.dl2_subarray,
+            "/dl1/monitoring/subarray/pointing": self.monitoring,
+            "/dl1/monitoring/telescope/pointing": self.monitoring and telescope,
+        }
+        return {
+            node: node_type
+            for node, node_type in _NODES_TO_CHECK.items()
+            if included[node]
+        }
+
+    def check_files(self, paths, n_workers=1):
+        """
+        Check that all files in ``paths`` can be merged into the output file.
+
+        This runs the same checks as merging each file, without copying any data,
+        so that incompatible files can be found before starting to merge.
+        If no file was merged yet, the first file with metadata is
+        used as reference for the others.
+
+        Parameters
+        ----------
+        paths : list[str | Path]
+            Files to check
+        n_workers : int
+            Number of processes used to check the files in parallel
+
+        Returns
+        -------
+        errors : dict[Path, CannotMerge]
+            The error for each file that cannot be merged
+        """
+        paths = [Path(path) for path in paths]
+        errors = {}
 
-        for node_path in self.required_nodes:
-            if node_path not in other.root:
-                raise CannotMerge(
-                    f"Required node {node_path} not found in {other.filename}"
-                )
+        if self.meta is not None:
+            version = self.data_model_version
+            required_nodes = self.required_nodes
+            subarray = self.subarray
+        else:
+            version = required_nodes = subarray = None
+            for path in paths:
+                with tables.open_file(path, mode="r") as h5file:
+                    try:
+                        version = _read_meta(h5file).product.data_model_version
+                    except CannotMerge as error:
+                        errors[path] = error
+                        continue
+                    required_nodes = _get_required_nodes(h5file, self._merged_nodes())
+                    subarray = _read_subarray(h5file)
+                    break
+
+            if version is None:
+                return errors
+
+        to_check = [path for path in paths if path not in errors]
+        args = (version, required_nodes, subarray)
+        if n_workers > 1:
+            with ProcessPoolExecutor(
+                max_workers=n_workers,
+                # spawn avoids inheriting the open output file
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as pool:
+                futures = [pool.submit(_check_file, path, *args) for path in to_check]
+                results = [future.result() for future in futures]
+        else:
+            results = [_check_file(path, *args) for path in to_check]
+
+        for path, error in zip(to_check, results):
+            if error is not None:
+                errors[path] = error
+
+        return errors
 
     def _append(self, other):
         # Configuration
@@ -374,11 +513,7 @@ class HDF5Merger(Component):
             self.h5file.close()
 
     def _append_subarray(self, other):
-        # focal length choice doesn't matter here, set to equivalent so we don't get
-        # an error if only the effective focal length is available in the file
-        subarray = SubarrayDescription.from_hdf(
-            other, focal_length_choice=FocalLengthKind.EQUIVALENT
-        )
+        subarray = _read_subarray(other)
 
         if self.subarray is None:
             self.subarray = subarray
@@ -10,6 +10,7 @@ from astropy.units import Quantity
 import ctapipe
 
 from ..core import Container, Map
+from ..core.traits import Integer
 from .tableio import (
     EnumColumnTransform,
     FixedPointColumnTransform,
@@ -47,6 +48,10 @@ DEFAULT_FILTERS = tables.Filters(
     fletcher32=True,  # add checksums to data chunks
 )
 
+#: maximum size of the row buffer of a single table, so that wide tables,
+#: e.g. images of large cameras, do not use excessive amounts of memory
+MAX_BUFFER_BYTES = 4 * 1024**2
+
 
 def get_hdf5_attr(attrs, name, default=None):
     if name in attrs:
@@ -185,6 +190,13 @@ class HDF5TableWriter(TableWriter):
     To append to existing files, pass the ``mode='a'``  option to the
     constructor.
 
+    Rows are not written one by one, but collected per table in a
+    preallocated buffer of ``buffer_size`` rows (limited to
+    ``MAX_BUFFER_BYTES`` per table), which is appended to the file as a block
+    when it is full, when calling `flush()` and on `close()`.
+    Transforms that support it (e.g. `~ctapipe.io.tableio.FixedPointColumnTransform`)
+    are applied to the whole block at once.
+
     Parameters
     ----------
     filename: str
@@ -202,10 +214,18 @@ class HDF5TableWriter(TableWriter):
     filters: pytables.Filters
         A set of filters (compression settings) to be used for
         all datasets created by this writer.
+    buffer_size: int or None
+        If given, overrides the configured ``buffer_size``
     kwargs:
         any other arguments that will be passed through to ``pytables.open_file``.
     """
 
+    buffer_size = Integer(
+        default_value=1000,
+        min=1,
+        help="Number of rows buffered per table before writing them to the file",
+    ).tag(config=True)
+
     def __init__(
         self,
         filename,
@@ -214,14 +234,19 @@ class HDF5TableWriter(TableWriter):
         mode="w",
         root_uep="/",
         filters=DEFAULT_FILTERS,
+        buffer_size=None,
         parent=None,
         config=None,
         **kwargs,
     ):
 
         super().__init__(add_prefix=add_prefix, parent=parent, config=config)
+        if buffer_size is not None:
+            self.buffer_size = buffer_size
+
         self._schemas = {}
         self._tables = {}
+        self._buffers = {}
 
         if mode not in ["a", "w", "r+"]:
             raise IOError(f"The mode '{mode}' is not supported for writing")
@@ -238,7 +263,17 @@ class HDF5TableWriter(TableWriter):
         self.log.debug("kwargs for tables.open_file: %s", kwargs)
         self.h5file = tables.open_file(filename, **kwargs)
 
+    def flush(self):
+        """Write all buffered rows to the file"""
+        for buffer in self._buffers.values():
+            buffer.flush()
+        self.h5file.flush()
+
     def close(self):
+        if self.h5file.isopen:
+            for buffer in self._buffers.values():
+                buffer.flush()
+        self._buffers.clear()
         self.h5file.close()
 
     def _add_column_to_schema(self, table_name, schema, meta, field, name, value):
@@ -416,31 +451,28 @@ class HDF5TableWriter(TableWriter):
             table = self.h5file.get_node(table_path)
 
         self._tables[table_name] = table
+        self._buffers[table_name] = _TableBuffer(
+            table, self._transforms[table_name], self.buffer_size
+        )
 
     def _append_row(self, table_name, containers):
         """
-        append a row to an already initialized table. This is called
-        automatically by `write()`
+        append a row to the buffer of an already initialized table.
+        This is called automatically by `write()`
         """
-        table = self._tables[table_name]
-        row = table.row
+        buffer = self._buffers[table_name]
 
         for container in containers:
-            selected_fields = filter(
-                lambda kv: kv[0] in table.colnames,
-                container.items(add_prefix=self.add_prefix),
-            )
-            for colname, value in selected_fields:
-                try:
-                    value = self._apply_col_transform(table_name, colname, value)
-                    row[colname] = value
-                except Exception:
-                    self.log.error(
-                        f"Error writing col {colname} of "
-                        f"container {container.__class__.__name__}"
-                    )
-                    raise
-        row.append()
+            try:
+                buffer.add(container, self.add_prefix)
+            except Exception:
+                self.log.error(
+                    f"Error writing container {container.__class__.__name__}"
+                    f" to table {table_name}"
+                )
+                raise
+
+        buffer.next_row()
 
     def write(self, table_name, containers):
         """
@@ -466,6 +498,93 @@ class HDF5TableWriter(TableWriter):
         self._append_row(table_name, containers)
 
 
+class _TableBuffer:
+    """
+    Buffer for the rows of a pytables table.
+
+    Rows are stored in a preallocated structured array with the dtype of the table
+    and appended to the table in blocks. Values of columns with a vectorized
+    transform are stored untransformed and the transform is applied on the whole
+    block when flushing.
+    """
+
+    def __init__(self, table, transforms, size):
+        self.table = table
+        self.size = max(1, min(size, MAX_BUFFER_BYTES // table.dtype.itemsize))
+        self.n_rows = 0
+        self.data = np.zeros(self.size, dtype=table.dtype)
+        # views of each column into the structured buffer
+        self.columns = {name: self.data[name] for name in table.colnames}
+        self.transforms = {}
+        self.vectorized_transforms = {}
+        # untransformed values of the columns with vectorized transforms
+        self.raw = {}
+
+        for name, transform in transforms.items():
+            if name not in self.columns:
+                continue
+
+            vectorized = getattr(transform, "vectorized", False)
+            if vectorized and hasattr(transform, "source_dtype"):
+                column = self.columns[name]
+                self.raw[name] = np.zeros(column.shape, dtype=transform.source_dtype)
+                self.vectorized_transforms[name] = transform
+            else:
+                self.transforms[name] = transform
+
+        # (column buffer, transform) for each field, per container type and prefix
+        self._fields = {}
+
+    def _get_fields(self, container, add_prefix):
+        """Columns of the buffer filled by the fields of the given container"""
+        key = (container.__class__, container.prefix)
+        fields = self._fields.get(key)
+        if fields is None:
+            fields = []
+            names = container.items(add_prefix=add_prefix)
+            for field, (name, _) in zip(container.fields, names):
+                if name in self.raw:
+                    fields.append((field, self.raw[name], None))
+                elif name in self.columns:
+                    column = self.columns[name]
+                    fields.append((field, column, self.transforms.get(name)))
+            self._fields[key] = fields
+        return fields
+
+    def add(self, container, add_prefix):
+        """Fill the values of a container into the current row"""
+        row = self.n_rows
+        for field, column, transform in self._get_fields(container, add_prefix):
+            value = getattr(container, field)
+            if transform is not None:
+                value = transform(value)
+            column[row] = value
+
+    def next_row(self):
+        """Finish the current row, flushing the buffer if it is full"""
+        self.n_rows += 1
+        if self.n_rows == self.size:
+            self.flush()
+
+    def flush(self):
+        """Append the buffered rows to the table"""
+        n_rows = self.n_rows
+        if n_rows == 0:
+            return
+
+        for name, transform in self.vectorized_transforms.items():
+            self.columns[name][:n_rows] = transform(self.raw[name][:n_rows])
+
+        self.table.append(self.data[:n_rows])
+        self.table.flush()
+
+        # reset, so columns not filled in a row are 0 as for pytables rows
+        self.data[:n_rows] = 0
+        for raw in self.raw.values():
+            raw[:n_rows] = 0
+        self.n_rows = 0
+
+
 class HDF5TableReader(TableReader):
     """
     Reader that reads a single row of an HDF5 table at once into a Container.
@@ -614,12 +733,23 @@ class HDF5TableReader(TableReader):
                     "that does not map to any of the specified containers"
                 )
 
-    def read(self, table_name, containers, prefixes=None, ignore_columns=None):
+    def read(
+        self,
+        table_name,
+        containers,
+        prefixes=None,
+        ignore_columns=None,
+        chunk_size=1000,
+    ):
         """
         Returns a generator that reads the next row from the table into the
         given container. The generator returns the same container. Note that
         no containers are copied, the data are overwritten inside.
 
+        The table is read in chunks of ``chunk_size`` rows (limited to
+        ``MAX_BUFFER_BYTES`` per chunk), column transforms are applied to
+        whole chunks where possible.
+
         Parameters
         ----------
         table_name: str
@@ -636,6 +766,10 @@ class HDF5TableReader(TableReader):
             If a string is provided, it is used as prefix for all containers.
             If a list is provided, the length needs to match th number
             of containers.
+        ignore_columns: Iterable[str]
+            Names of columns not to read
+        chunk_size: int
+            Number of rows to read at once
         """
 
         ignore_columns = set(ignore_columns) if ignore_columns is not None else set()
@@ -680,31 +814,49 @@ class HDF5TableReader(TableReader):
         missing = self._missing_fields[table_name]
         mappings = self._col_mapping[table_name]
 
-        for row_index in range(len(tab)):
-            # looping over table yields Row instances.
-            # __getitem__ just gives plain numpy data
-            row = tab[row_index]
-
-            ret = []
-            for cls, prefix, mapping, missing_fields in zip(
-                containers, prefixes, mappings, missing
-            ):
-                data = {
-                    field_name: self._apply_col_transform(
-                        table_name, col_name, row[col_name]
-                    )
-                    for field_name, col_name in mapping.items()
-                }
-
-                # set missing fields to None
-                for field_name in missing_fields:
-                    data[field_name] = None
-
-                container = cls(**data, prefix=prefix)
-                container.meta = self._meta[table_name]
-                ret.append(container)
-
-            if return_iterable:
-                yield ret
-            else:
-                yield ret[0]
+        transforms = self._transforms[table_name]
+        # read at least one row, but limit the memory used by wide tables
+        chunk_size = max(1, min(chunk_size, MAX_BUFFER_BYTES // tab.dtype.itemsize))
+
+        for start in range(0, len(tab), chunk_size):
+            chunk = tab.read(start, start + chunk_size)
+
+            # apply vectorized transforms to the whole chunk,
+            # others are applied value by value below
+            columns = {}
+            for mapping in mappings:
+                for col_name in mapping.values():
+                    values = chunk[col_name]
+                    transform = transforms.get(col_name)
+                    if transform is None:
+                        columns[col_name] = (values, None)
+                    elif getattr(transform, "vectorized", False):
+                        columns[col_name] = (transform.inverse(values), None)
+                    else:
+                        columns[col_name] = (values, transform.inverse)
+
+            for row_index in range(len(chunk)):
+                ret = []
+                for cls, prefix, mapping, missing_fields in zip(
+                    containers, prefixes, mappings, missing
+                ):
+                    data = {}
+                    for field_name, col_name in mapping.items():
+                        values, inverse = columns[col_name]
+                        value = values[row_index]
+                        if inverse is not None:
+                            value = inverse(value)
+                        data[field_name] = value
+
+                    # set missing fields to None
+                    for field_name in missing_fields:
+                        data[field_name] = None
+
+                    container = cls(**data, prefix=prefix)
+                    container.meta = self._meta[table_name]
+                    ret.append(container)
+
+                if return_iterable:
+                    yield ret
+                else:
+                    yield ret[0]
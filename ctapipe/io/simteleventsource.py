@@ -20,7 +20,7 @@ from ..atmosphere import (
     FiveLayerAtmosphereDensityProfile,
     TableAtmosphereDensityProfile,
 )
-from ..calib.camera.gainselection import GainSelector
+from ..calib.camera.gainselection import GainSelector, apply_gain_selection
 from ..containers import (
     ArrayEventContainer,
     CoordinateFrameType,
@@ -274,16 +274,24 @@ def apply_simtel_r1_calibration(
         Shape: (n_pixels)
     """
     n_channels, n_pixels, n_samples = r0_waveforms.shape
-    ped = pedestal[..., np.newaxis]
-    DC_to_PHE = dc_to_pe[..., np.newaxis]
-    gain = DC_to_PHE * calib_scale
-    r1_waveforms = (r0_waveforms - ped) * gain + calib_shift
     if n_channels == 1:
         selected_gain_channel = np.zeros(n_pixels, dtype=np.int8)
-        r1_waveforms = r1_waveforms[0]
+        r0_waveforms = r0_waveforms[0]
+        pedestal = pedestal[0]
+        dc_to_pe = dc_to_pe[0]
     else:
+        # select the gain before calibrating, so that the
+        # unused channel is never calibrated or copied
         selected_gain_channel = gain_selector(r0_waveforms)
-        r1_waveforms = r1_waveforms[selected_gain_channel, np.arange(n_pixels)]
+        pixel_index = np.arange(n_pixels)
+        r0_waveforms = apply_gain_selection(r0_waveforms, selected_gain_channel)
+        pedestal = pedestal[selected_gain_channel, pixel_index]
+        dc_to_pe = dc_to_pe[selected_gain_channel, pixel_index]
+
+    ped = pedestal[..., np.newaxis]
+    DC_to_PHE = dc_to_pe[..., np.newaxis]
+    gain = DC_to_PHE * calib_scale
+    r1_waveforms = (r0_waveforms - ped) * gain + calib_shift
     return r1_waveforms, selected_gain_channel
 
 
@@ -7,7 +7,7 @@ from collections import defaultdict
 
 import numpy as np
 from astropy.time import Time
-from astropy.units import Quantity
+from astropy.units import Quantity, Unit
 
 from ..core import Component
 from ..instrument import SubarrayDescription
@@ -283,8 +283,17 @@ class ColumnTransform(metaclass=ABCMeta):
 
     Transformations implement ``get_meta`` to provide the necessary metadata
     for inverting the transformation on reading.
+
+    Transformations that set ``vectorized = True`` can be applied to an array
+    of values of the column at once, in both directions.
+    If they also define a numeric ``source_dtype``, writers may store the
+    untransformed values in a buffer of that dtype and apply the transformation
+    to whole blocks of rows.
     """
 
+    #: if the transformation can be applied on an array of values
+    vectorized = False
+
     @abstractmethod
     def __call__(self, value):
         pass
@@ -307,6 +316,8 @@ class ColumnTransform(metaclass=ABCMeta):
 class TimeColumnTransform(ColumnTransform):
     """A Column transformation that converts astropy time objects to MJD TAI"""
 
+    vectorized = True
+
     def __init__(self, scale, format):
         self.scale = scale
         self.format = format
@@ -331,8 +342,11 @@ class TimeColumnTransform(ColumnTransform):
 class QuantityColumnTransform(ColumnTransform):
     """A Column Transform that transforms quantities to their values in the given unit"""
 
+    vectorized = True
+
     def __init__(self, unit):
-        self.unit = unit
+        # parse string units only once
+        self.unit = Unit(unit)
 
     def __call__(self, value):
         return value.to_value(self.unit)
@@ -373,6 +387,8 @@ class FixedPointColumnTransform(ColumnTransform):
     This is a lossy transformation.
     """
 
+    vectorized = True
+
     def __init__(self, scale, offset, source_dtype, target_dtype):
         self.scale = scale
         self.offset = offset
@@ -514,6 +530,8 @@ class StringTransform(ColumnTransform):
     variable length strings in tables.
     """
 
+    vectorized = True
+
     def __init__(self, max_length):
         self.max_length = max_length
         self.dtype = f"S{max_length:d}"
@@ -16,7 +16,7 @@ from ctapipe.instrument.optics import FocalLengthKind
 
 from ..core import Component, Provenance, traits
 from ..instrument import SubarrayDescription
-from .astropy_helpers import join_allow_empty, read_table
+from .astropy_helpers import _read_table_rows, join_allow_empty, read_table
 
 __all__ = ["TableLoader"]
 
@@ -24,6 +24,7 @@ PARAMETERS_GROUP = "/dl1/event/telescope/parameters"
 IMAGES_GROUP = "/dl1/event/telescope/images"
 MUON_GROUP = "/dl1/event/telescope/muon"
 TRIGGER_TABLE = "/dl1/event/subarray/trigger"
+TELESCOPE_TRIGGER_TABLE = "/dl1/event/telescope/trigger"
 SHOWER_TABLE = "/simulation/event/subarray/shower"
 TRUE_IMAGES_GROUP = "/simulation/event/telescope/images"
 TRUE_PARAMETERS_GROUP = "/simulation/event/telescope/parameters"
@@ -32,6 +33,9 @@ SIMULATION_CONFIG_TABLE = "/configuration/simulation/run"
 SHOWER_DISTRIBUTION_TABLE = "/simulation/service/shower_distribution"
 OBSERVATION_TABLE = "/configuration/observation/observation_block"
 
+R0_WAVEFORM_GROUP = "/r0/event/waveform"
+R1_WAVEFORM_GROUP = "/r1/event/waveform"
+
 DL2_SUBARRAY_GROUP = "/dl2/event/subarray"
 DL2_TELESCOPE_GROUP = "/dl2/event/telescope"
 
@@ -121,6 +125,11 @@ def _join_telescope_events(table1, table2):
     return join_allow_empty(table1, table2, TELESCOPE_EVENT_KEYS, how)
 
 
+def _index_matches(table1, table2, index_keys):
+    """Check if the index columns of two tables of the same length are identical"""
+    return all(np.array_equal(table1[key], table2[key]) for key in index_keys)
+
+
 def _merge_table_same_index(table1, table2, index_keys, fallback_join_type="left"):
     """Merge two tables assuming their primary keys are identical"""
     if len(table1) != len(table2):
@@ -129,7 +138,7 @@ def _merge_table_same_index(table1, table2, index_keys, fallback_join_type="left
     if len(table1) == 0:
         return table1
 
-    if not np.all(table1[index_keys] == table2[index_keys]):
+    if not _index_matches(table1, table2, index_keys):
         warnings.warn(
             "Table order does not match, falling back to join", IndexNotMatching
         )
@@ -277,23 +286,6 @@ class TableLoader(Component):
 
         return table
 
-    def _get_sort_index(self, start=None, stop=None):
-        """
-        Get plain index of increasing integers in the order in the file.
-
-        Astropy.table.join orders by the join keys, we want to keep
-        the original order. Adding an index before the first join and then
-        using that in the end to sort back to the original order solves this.
-        """
-        table = read_table(
-            self.h5file,
-            TRIGGER_TABLE,
-            start=start,
-            stop=stop,
-        )[["obs_id", "event_id"]]
-        self._add_index_if_needed(table)
-        return table
-
     @staticmethod
     def _sort_to_original_order(table, include_tel_id=False):
         if len(table) == 0:
@@ -425,13 +417,14 @@ class TableLoader(Component):
         if stop is not None:
             trigger_stop = self._n_total_telescope_events[stop]
 
-        table = read_table(
-            self.h5file,
-            "/dl1/event/telescope/trigger",
-            condition=f"tel_id == {tel_id}",
-            start=trigger_start,
-            stop=trigger_stop,
-        )
+        # select the rows of this telescope using the row index instead of
+        # a condition, which would scan the full table for each telescope
+        rows = self._telescope_trigger_rows.get(tel_id, np.array([], dtype=np.int64))
+        if trigger_start is not None:
+            rows = rows[np.searchsorted(rows, trigger_start) :]
+        if trigger_stop is not None:
+            rows = rows[: np.searchsorted(rows, trigger_stop)]
+        table = _read_table_rows(self.h5file, TELESCOPE_TRIGGER_TABLE, rows)
 
         if self.load_dl1_parameters:
             parameters = self._read_telescope_table(
@@ -476,7 +469,10 @@ class TableLoader(Component):
 
         if self.load_true_parameters:
             true_parameters = self._read_telescope_table(
-                TRUE_PARAMETERS_GROUP, tel_id, start=tel_start, stop=tel_stop
+                TRUE_PARAMETERS_GROUP,
+                tel_id,
+                start=tel_start,
+                stop=tel_stop,
             )
             table = _join_telescope_events(table, true_parameters)
 
@@ -497,19 +493,54 @@ class TableLoader(Component):
         return table
 
     def _read_telescope_events_for_ids(self, tel_ids, start=None, stop=None):
-        tables = [
+        """
+        Read telescope-based event information, returns a list of one table per telescope.
+        """
+        return [
             self._read_telescope_events_for_id(tel_id, start=start, stop=stop)
             for tel_id in tel_ids
         ]
-        return vstack(tables)
-
-    def _join_subarray_info(self, table, start=None, stop=None, subarray_events=None):
-        if subarray_events is None:
-            subarray_events = self.read_subarray_events(
-                start=start,
-                stop=stop,
-                keep_order=False,
-            )
+
+    def _get_subarray_index(self, tel_id, start=None, stop=None):
+        """
+        Get the index of the subarray events in which ``tel_id`` triggered,
+        relative to ``start``.
+
+        This is the row in a subarray events table read with the same
+        ``start`` and ``stop`` for each row of the telescope events table.
+        """
+        index = self.subarray.tel_ids_to_indices(tel_id)[0]
+        stop = None if stop is None else stop + 1
+        n_telescope_events = self._n_telescope_events[start:stop, index]
+        return np.flatnonzero(np.diff(n_telescope_events))
+
+    def _join_subarray_info(self, table, subarray_events, subarray_index):
+        """
+        Add subarray event information to a table of telescope events.
+
+        ``subarray_index`` is the row in ``subarray_events`` for each
+        telescope event. If the event ids match, the tables are
+        concatenated along the known rows, otherwise they are joined.
+        """
+        if len(table) == 0:
+            return table
+
+        if len(table) == len(subarray_index):
+            subarray_rows = subarray_events[subarray_index]
+
+            if _index_matches(table, subarray_rows, SUBARRAY_EVENT_KEYS):
+                columns = [
+                    col
+                    for col in subarray_rows.colnames
+                    if col not in SUBARRAY_EVENT_KEYS
+                ]
+                # same naming of duplicated columns as in the join below
+                for col in columns:
+                    if col in table.colnames:
+                        table.rename_column(col, f"{col}_mono")
+
+                return hstack((table, subarray_rows[columns]), join_type="exact")
+
         table = join_allow_empty(
             table,
             subarray_events,
@@ -521,6 +552,12 @@ class TableLoader(Component):
         )
         return table
 
+    def _read_subarray_events_with_index(self, start=None, stop=None):
+        """Read subarray events in file order, with an ``__index__`` column"""
+        subarray_events = self.read_subarray_events(start=start, stop=stop)
+        self._add_index_if_needed(subarray_events)
+        return subarray_events
+
     def _get_tel_start_stop(self, tel_id, start, stop):
         tel_start = None
         tel_stop = None
@@ -571,13 +608,17 @@ class TableLoader(Component):
         else:
             tel_ids = self.subarray.get_tel_ids(telescopes)
 
-        table = self._read_telescope_events_for_ids(tel_ids, start, stop)
-        table = self._join_subarray_info(table, start=start, stop=stop)
+        subarray_events = self._read_subarray_events_with_index(start, stop)
 
-        # sort back to order in the file
-        table = _join_subarray_events(
-            table, self._get_sort_index(start=start, stop=stop)
+        tables = self._read_telescope_events_for_ids(tel_ids, start, stop)
+        subarray_index = np.concatenate(
+            [self._get_subarray_index(tel_id, start, stop) for tel_id in tel_ids]
         )
+        table = self._join_subarray_info(
+            vstack(tables), subarray_events, subarray_index
+        )
+
+        # sort back to order in the file
         self._sort_to_original_order(table, include_tel_id=True)
 
         return table
@@ -630,6 +671,18 @@ class TableLoader(Component):
         """
         return self._n_telescope_events.sum(axis=1)
 
+    @lazyproperty
+    def _telescope_trigger_rows(self):
+        """
+        Rows in the telescope trigger table for each telescope,
+        built once from the ``tel_id`` column.
+        """
+        tel_id = self.h5file.root[TELESCOPE_TRIGGER_TABLE].col("tel_id")
+        # stable sort, so the rows of each telescope stay increasing
+        rows = np.argsort(tel_id, kind="stable")
+        tel_ids, offsets = np.unique(tel_id[rows], return_index=True)
+        return dict(zip(tel_ids.tolist(), np.split(rows, offsets[1:])))
+
     def read_telescope_events_by_type(
         self, telescopes=None, start=None, stop=None
     ) -> Dict[str, Table]:
@@ -652,22 +705,23 @@ class TableLoader(Component):
         else:
             tel_ids = self.subarray.get_tel_ids(telescopes)
 
-        subarray_events = self.read_subarray_events(
-            start=start, stop=stop, keep_order=False
-        )
-        self._add_index_if_needed(subarray_events)
+        subarray_events = self._read_subarray_events_with_index(start, stop)
 
+        tables = self._read_telescope_events_for_ids(tel_ids, start, stop)
         by_type = defaultdict(list)
-        for tel_id in tel_ids:
+        subarray_index = defaultdict(list)
+        for tel_id, table in zip(tel_ids, tables):
             key = str(self.subarray.tel[tel_id])
-            table = self._read_telescope_events_for_id(tel_id, start=start, stop=stop)
             if len(table) > 0:
                 by_type[key].append(table)
+                subarray_index[key].append(
+                    self._get_subarray_index(tel_id, start, stop)
+                )
 
         by_type = {k: vstack(ts) for k, ts in by_type.items()}
         for key in by_type.keys():
             by_type[key] = self._join_subarray_info(
-                by_type[key], subarray_events=subarray_events
+                by_type[key], subarray_events, np.concatenate(subarray_index[key])
             )
             self._sort_to_original_order(by_type[key], include_tel_id=True)
 
@@ -716,21 +770,20 @@ class TableLoader(Component):
         else:
             tel_ids = self.subarray.get_tel_ids(telescopes)
 
-        subarray_events = self.read_subarray_events(
-            start=start, stop=stop, keep_order=False
-        )
-        self._add_index_if_needed(subarray_events)
+        subarray_events = self._read_subarray_events_with_index(start, stop)
 
+        tables = self._read_telescope_events_for_ids(tel_ids, start, stop)
         by_id = {}
-        for tel_id in tel_ids:
+        for tel_id, table in zip(tel_ids, tables):
             # no events for this telescope in range start/stop
-            table = self._read_telescope_events_for_id(tel_id, start=start, stop=stop)
             if len(table) > 0:
                 by_id[tel_id] = table
 
         for tel_id in by_id.keys():
             by_id[tel_id] = self._join_subarray_info(
-                by_id[tel_id], subarray_events=subarray_events
+                by_id[tel_id],
+                subarray_events,
+                self._get_subarray_index(tel_id, start, stop),
             )
             self._sort_to_original_order(by_id[tel_id], include_tel_id=True)
 
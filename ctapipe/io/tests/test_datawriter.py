@@ -211,6 +211,44 @@ def test_roundtrip(tmpdir: Path):
             assert np.allclose(original_peaktime, read_peaktime, atol=0.01)
 
 
+def test_waveform_array_storage(tmp_path):
+    """Check writing waveforms as arrays and reading them back"""
+    output_path = tmp_path / "events.r1.h5"
+    source = EventSource(
+        get_dataset_path("gamma_prod5.simtel.zst"),
+        focal_length_choice="EQUIVALENT",
+    )
+
+    waveforms = []
+    with DataWriter(
+        event_source=source,
+        output_path=output_path,
+        write_parameters=False,
+        write_waveforms=True,
+        write_raw_waveforms=True,
+        waveform_storage="array",
+    ) as write:
+        for event in source:
+            write(event)
+            waveforms.append(
+                {tel_id: r1.waveform.copy() for tel_id, r1 in event.r1.tel.items()}
+            )
+
+    with tables.open_file(output_path) as h5file:
+        r1_table = h5file.get_node("/r1/event/telescope/tel_004")
+        r1_array = h5file.get_node("/r1/event/waveform/tel_004")
+        r0_array = h5file.get_node("/r0/event/waveform/tel_004")
+        assert "waveform" not in r1_table.colnames
+        assert r1_array.filters.complevel == 0
+        assert len(r1_array) == len(r1_table)
+        assert len(r0_array) == len(r1_table)
+
+    for event in EventSource(output_path):
+        assert event.r1.tel.keys() == waveforms[event.count].keys()
+        for tel_id, r1 in event.r1.tel.items():
+            np.testing.assert_array_equal(r1.waveform, waveforms[event.count][tel_id])
+
+
 def test_dl1writer_no_events(tmpdir: Path):
     """
     Check that we can write DL1 files even when no events are given
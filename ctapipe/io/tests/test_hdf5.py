@@ -717,6 +717,88 @@ def test_fixed_point_column_transform(tmp_path):
             assert np.isneginf(data.image[2])
 
 
+@pytest.mark.parametrize("buffer_size", [1, 7, 1000])
+def test_buffered_writing(tmp_path, buffer_size):
+    """ensure rows are written correctly for different buffer sizes"""
+    from ctapipe.io.tableio import FixedPointColumnTransform
+
+    tmp_file = tmp_path / "test_buffer.hdf5"
+
+    class SomeContainer(Container):
+        default_prefix = ""
+        event_id = Field(-1)
+        energy = Field(np.nan * u.TeV, unit=u.TeV)
+        image = Field(np.zeros(3))
+
+    n_rows = 20
+    energy = np.linspace(1, 10, n_rows) * u.TeV
+    images = np.random.default_rng(0).uniform(0, 100, (n_rows, 3))
+
+    with HDF5TableWriter(
+        tmp_file, group_name="data", buffer_size=buffer_size
+    ) as writer:
+        assert writer.buffer_size == buffer_size
+        writer.add_column_transform(
+            "table", "image", FixedPointColumnTransform(100, 0, np.float64, np.int32)
+        )
+
+        for i in range(n_rows):
+            cont = SomeContainer(event_id=i, energy=energy[i], image=images[i])
+            writer.write("table", cont)
+
+        # rows are only written once the buffer is full or on flush
+        assert writer.h5file.root.data.table.nrows == n_rows - n_rows % buffer_size
+        writer.flush()
+        assert writer.h5file.root.data.table.nrows == n_rows
+
+        writer.write("table", SomeContainer(event_id=n_rows))
+
+    table = read_table(tmp_file, "/data/table")
+    assert len(table) == n_rows + 1
+    np.testing.assert_array_equal(table["event_id"], np.arange(n_rows + 1))
+    assert u.allclose(table["energy"][:n_rows], energy)
+    np.testing.assert_allclose(table["image"][:n_rows], images, atol=0.005)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+def test_chunked_reading(tmp_path, chunk_size):
+    """ensure rows are read back correctly for different chunk sizes"""
+    from ctapipe.io.tableio import FixedPointColumnTransform
+
+    tmp_file = tmp_path / "test_chunks.hdf5"
+
+    class SomeContainer(Container):
+        default_prefix = ""
+        event_id = Field(-1)
+        energy = Field(np.nan * u.TeV, unit=u.TeV)
+        image = Field(np.zeros(3))
+        name = Field("", max_length=10)
+
+    n_rows = 20
+    energy = np.linspace(1, 10, n_rows) * u.TeV
+    images = np.random.default_rng(0).uniform(0, 100, (n_rows, 3))
+
+    with HDF5TableWriter(tmp_file, group_name="data") as writer:
+        writer.add_column_transform(
+            "table", "image", FixedPointColumnTransform(100, 0, np.float64, np.int32)
+        )
+        for i in range(n_rows):
+            cont = SomeContainer(
+                event_id=i, energy=energy[i], image=images[i], name=f"row_{i}"
+            )
+            writer.write("table", cont)
+
+    with HDF5TableReader(tmp_file) as reader:
+        rows = reader.read("/data/table", SomeContainer, chunk_size=chunk_size)
+        for i, cont in enumerate(rows):
+            assert cont.event_id == i
+            assert u.isclose(cont.energy, energy[i])
+            assert cont.name == f"row_{i}"
+            np.testing.assert_allclose(cont.image, images[i], atol=0.005)
+
+    assert i == n_rows - 1
+
+
 def test_column_transforms_regexps(tmp_path):
     """ensure a user-added column transform is applied when given as a regexp"""
 
@@ -132,6 +132,23 @@ def test_append(tmp_path, gamma_train_clf, proton_train_clf):
             merger(gamma_train_en)
 
 
+def test_check_files(tmp_path, gamma_train_clf, proton_train_clf):
+    from ctapipe.io.hdf5merger import CannotMerge, HDF5Merger
+
+    gamma_train_en = get_dataset_path("gamma_diffuse_dl2_train_small.dl2.h5")
+    paths = [gamma_train_clf, proton_train_clf, gamma_train_en]
+
+    with HDF5Merger(tmp_path / "merged.dl2.h5") as merger:
+        for n_workers in (1, 2):
+            errors = merger.check_files(paths, n_workers=n_workers)
+            assert list(errors) == [gamma_train_en]
+            assert isinstance(errors[gamma_train_en], CannotMerge)
+            assert "ExtraTreesRegressor" in str(errors[gamma_train_en])
+
+        # nothing must have been merged
+        assert merger.meta is None
+
+
 def test_filter_column(tmp_path, dl2_shower_geometry_file):
     from ctapipe.io.hdf5merger import HDF5Merger
 
@@ -397,3 +397,20 @@ def test_read_empty_table(dl2_shower_geometry_file):
     ) as loader:
         table = loader.read_telescope_events([6])
         assert len(table) == 0
+
+
+def test_telescope_trigger_rows(dl2_shower_geometry_file):
+    """Test the in-memory row index of the telescope trigger table"""
+    from ctapipe.io import TableLoader
+    from ctapipe.io.tableloader import TELESCOPE_TRIGGER_TABLE
+
+    trigger = read_table(dl2_shower_geometry_file, TELESCOPE_TRIGGER_TABLE)
+
+    with TableLoader(dl2_shower_geometry_file) as loader:
+        rows = loader._telescope_trigger_rows
+
+    assert sorted(rows) == sorted(np.unique(trigger["tel_id"]).tolist())
+    for tel_id, tel_rows in rows.items():
+        np.testing.assert_array_equal(
+            tel_rows, np.nonzero(trigger["tel_id"] == tel_id)[0]
+        )
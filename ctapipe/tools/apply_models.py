@@ -2,6 +2,9 @@
 Tool to apply machine learning models in bulk (as opposed to event by event).
 """
 import shutil
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 
 import numpy as np
 import tables
@@ -26,6 +29,90 @@ __all__ = [
 ]
 
 
+class _ChunkPipeline:
+    """
+    Overlap reading chunks and writing results with processing chunks.
+
+    Chunks are read ahead by a background thread and results are
+    written, in order of submission, by another background thread.
+    At most ``n_chunks`` chunks are read ahead and at most ``n_chunks``
+    results are waiting to be written, which bounds the memory usage.
+    If ``n_chunks`` is 0, everything runs in the calling thread.
+
+    PyTables is not thread-safe, all file access must hold ``lock``.
+    """
+
+    def __init__(self, chunk_iterator, n_chunks, lock):
+        self.chunk_iterator = chunk_iterator
+        self.n_chunks = n_chunks
+        self.lock = lock
+        self._reads = deque()
+        self._writes = deque()
+        self._reader = self._writer = None
+
+        if n_chunks > 0:
+            self._reader = ThreadPoolExecutor(1, thread_name_prefix="chunk-reader")
+            self._writer = ThreadPoolExecutor(1, thread_name_prefix="chunk-writer")
+
+    def __len__(self):
+        return len(self.chunk_iterator)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if exc_type is None:
+                # wait for all writes to be done, raising potential errors
+                while self._writes:
+                    self._writes.popleft().result()
+        finally:
+            # cancel_futures of Executor.shutdown needs python >= 3.9
+            for future in (*self._reads, *self._writes):
+                future.cancel()
+            self._reads.clear()
+            self._writes.clear()
+
+            for executor in (self._reader, self._writer):
+                if executor is not None:
+                    executor.shutdown(wait=True)
+
+    def _read(self):
+        with self.lock:
+            try:
+                chunk = next(self.chunk_iterator)
+            except StopIteration:
+                return None
+            return self.chunk_iterator.start, self.chunk_iterator.stop, chunk
+
+    def __iter__(self):
+        """Iterate over ``(start, stop, chunk)``"""
+        if self._reader is None:
+            while (item := self._read()) is not None:
+                yield item
+            return
+
+        for _ in range(self.n_chunks):
+            self._reads.append(self._reader.submit(self._read))
+
+        while (item := self._reads.popleft().result()) is not None:
+            self._reads.append(self._reader.submit(self._read))
+            yield item
+
+    def _locked(self, func, *args):
+        with self.lock:
+            return func(*args)
+
+    def write(self, func, *args):
+        """Call ``func(*args)`` to write results, in the writer thread if enabled"""
+        if self._writer is None:
+            return self._locked(func, *args)
+
+        self._writes.append(self._writer.submit(self._locked, func, *args))
+        while len(self._writes) > self.n_chunks:
+            self._writes.popleft().result()
+
+
 class ApplyModels(Tool):
     """Apply machine learning models to data.
 
@@ -93,6 +180,18 @@ class ApplyModels(Tool):
         help="How many subarray events to load at once for making predictions.",
     ).tag(config=True)
 
+    n_chunks_in_flight = Integer(
+        default_value=0,
+        min=0,
+        help=(
+            "If larger than 0, read the next chunks in a background thread"
+            " and write the predictions in another one, while the current"
+            " chunk is being predicted. At most this many chunks are read ahead"
+            " and queued for writing, which bounds the memory usage."
+            " If 0, chunks are read, predicted and written one after the other."
+        ),
+    ).tag(config=True)
+
     aliases = {
         ("i", "input"): "ApplyModels.input_url",
         "energy-regressor": "ApplyModels.energy_regressor_path",
@@ -119,6 +218,7 @@ class ApplyModels(Tool):
         shutil.copy(self.input_url, self.output_path)
 
         self.h5file = self.enter_context(tables.open_file(self.output_path, mode="r+"))
+        self._hdf5_lock = Lock()
         self.loader = TableLoader(
             parent=self,
             h5file=self.h5file,
@@ -169,91 +269,108 @@ class ApplyModels(Tool):
             self.loader.h5file = self.h5file
 
     def _apply(self, reconstructor):
-        prefix = reconstructor.prefix
-        property = reconstructor.property
-
         desc = f"Applying {reconstructor.__class__.__name__}"
         unit = "chunk"
 
         chunk_iterator = self.loader.read_telescope_events_by_id_chunked(
             self.chunk_size
         )
-        for chunk in tqdm(chunk_iterator, desc=desc, unit=unit):
-            tel_tables = []
-
-            for tel_id, table in chunk.items():
-                tel = self.loader.subarray.tel[tel_id]
-                if tel not in reconstructor._models:
-                    self.log.warning(
-                        "No model in %s for telescope type %s, skipping tel %d",
-                        reconstructor,
-                        tel,
-                        tel_id,
-                    )
-                    continue
+        pipeline = _ChunkPipeline(
+            chunk_iterator, self.n_chunks_in_flight, self._hdf5_lock
+        )
+
+        with pipeline:
+            for start, stop, chunk in tqdm(pipeline, desc=desc, unit=unit):
+                outputs = self._predict_chunk(reconstructor, chunk, start, stop)
+                pipeline.write(self._write_tables, outputs)
 
-                if len(table) == 0:
-                    self.log.warning("No events for telescope %d", tel_id)
-                    continue
+    def _predict_chunk(self, reconstructor, chunk, start, stop):
+        """Predict a chunk, returns a list of (table, path) to write"""
+        prefix = reconstructor.prefix
+        property = reconstructor.property
 
-                table.remove_columns(
-                    [c for c in table.colnames if c.startswith(prefix)]
+        tel_tables = []
+        outputs = []
+
+        for tel_id, table in chunk.items():
+            tel = self.loader.subarray.tel[tel_id]
+            if tel not in reconstructor._models:
+                self.log.warning(
+                    "No model in %s for telescope type %s, skipping tel %d",
+                    reconstructor,
+                    tel,
+                    tel_id,
                 )
+                continue
 
-                if isinstance(reconstructor, DispReconstructor):
-                    disp_predictions, altaz_predictions = reconstructor.predict_table(
-                        tel, table
-                    )
-                    table = hstack(
-                        [table, altaz_predictions, disp_predictions],
-                        join_type="exact",
-                        metadata_conflicts="ignore",
-                    )
-                    # tables should follow the container structure
-                    write_table(
+            if len(table) == 0:
+                self.log.warning("No events for telescope %d", tel_id)
+                continue
+
+            table.remove_columns([c for c in table.colnames if c.startswith(prefix)])
+
+            if isinstance(reconstructor, DispReconstructor):
+                disp_predictions, altaz_predictions = reconstructor.predict_table(
+                    tel, table
+                )
+                table = hstack(
+                    [table, altaz_predictions, disp_predictions],
+                    join_type="exact",
+                    metadata_conflicts="ignore",
+                )
+                # tables should follow the container structure
+                outputs.append(
+                    (
                         table[
                             ["obs_id", "event_id", "tel_id"]
                             + altaz_predictions.colnames
                         ],
-                        self.output_path,
                         f"/dl2/event/telescope/geometry/{prefix}/tel_{tel_id:03d}",
-                        append=True,
                     )
-                    write_table(
+                )
+                outputs.append(
+                    (
                         table[
                             ["obs_id", "event_id", "tel_id"] + disp_predictions.colnames
                         ],
-                        self.output_path,
                         f"/dl2/event/telescope/disp/{prefix}/tel_{tel_id:03d}",
-                        append=True,
-                    )
-                else:
-                    predictions = reconstructor.predict_table(tel, table)
-                    table = hstack(
-                        [table, predictions],
-                        join_type="exact",
-                        metadata_conflicts="ignore",
                     )
-                    write_table(
+                )
+            else:
+                predictions = reconstructor.predict_table(tel, table)
+                table = hstack(
+                    [table, predictions],
+                    join_type="exact",
+                    metadata_conflicts="ignore",
+                )
+                outputs.append(
+                    (
                         table[["obs_id", "event_id", "tel_id"] + predictions.colnames],
-                        self.output_path,
                         f"/dl2/event/telescope/{property}/{prefix}/tel_{tel_id:03d}",
-                        append=True,
                     )
+                )
 
-                tel_tables.append(table)
+            tel_tables.append(table)
 
-            if len(tel_tables) == 0:
-                raise ValueError("No predictions made for any telescope")
+        if len(tel_tables) == 0:
+            raise ValueError("No predictions made for any telescope")
 
+        outputs.append(
             self._combine(
                 reconstructor.stereo_combiner,
                 vstack(tel_tables),
-                start=chunk_iterator.start,
-                stop=chunk_iterator.stop,
+                start=start,
+                stop=stop,
             )
+        )
+        return outputs
+
+    def _write_tables(self, outputs):
+        for table, path in outputs:
+            write_table(table, self.output_path, path, append=True)
 
     def _combine(self, combiner, mono_predictions, start=None, stop=None):
+        """Predict stereo, returns the table and the path to write it to"""
         stereo_predictions = combiner.predict_table(mono_predictions)
 
         trafo = TelListToMaskTransform(self.loader.subarray)
@@ -266,19 +383,18 @@ class ApplyModels(Tool):
 
         # to ensure events are stored in the correct order,
         # we resort to trigger table order
-        trigger = read_table(
-            self.h5file, "/dl1/event/subarray/trigger", start=start, stop=stop
-        )[["obs_id", "event_id"]]
+        with self._hdf5_lock:
+            trigger = read_table(
+                self.h5file, "/dl1/event/subarray/trigger", start=start, stop=stop
+            )[["obs_id", "event_id"]]
         trigger["__sort_index__"] = np.arange(len(trigger))
         stereo_predictions = _join_subarray_events(trigger, stereo_predictions)
         stereo_predictions.sort("__sort_index__")
         del stereo_predictions["__sort_index__"]
 
-        write_table(
+        return (
             stereo_predictions,
-            self.output_path,
             f"/dl2/event/subarray/{combiner.property}/{combiner.prefix}",
-            append=True,
         )
 
     def finish(self):
@@ -1,8 +1,11 @@
 """
 Merge multiple ctapipe HDF5 files into one
 """
+import multiprocessing
 import sys
+import tempfile
 from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from tqdm.auto import tqdm
@@ -12,11 +15,18 @@ from ctapipe.core.tool import ToolConfigurationError
 from ctapipe.io.hdf5merger import CannotMerge
 
 from ..core import Provenance, Tool, traits
-from ..core.traits import Bool, Unicode, flag
+from ..core.traits import Bool, Integer, Unicode, flag
 from ..io import HDF5Merger
 from ..io import metadata as meta
 
 
+def _merge_files(output_path, input_files, merger_options):
+    """Merge ``input_files`` into a new file ``output_path`` in a worker process"""
+    with HDF5Merger(output_path, overwrite=True, **merger_options) as merger:
+        for input_file in input_files:
+            merger(input_file)
+
+
 class MergeTool(Tool):
     """
     Merge multiple ctapipe HDF5 files into one
@@ -67,6 +77,18 @@ class MergeTool(Tool):
         help="Skip files that cannot be merged instead of raising an error",
     ).tag(config=True)
 
+    n_workers = Integer(
+        default_value=1,
+        min=1,
+        help=(
+            "Number of worker processes. If larger than 1, the input files are"
+            " checked in parallel before merging, then split into this many"
+            " groups, which are merged into temporary files in parallel."
+            " These are then merged into the output file in order,"
+            " so the result is the same as merging serially."
+        ),
+    ).tag(config=True)
+
     parser = ArgumentParser()
     parser.add_argument("input_files", nargs="*", type=Path)
 
@@ -74,6 +96,7 @@ class MergeTool(Tool):
         ("i", "input-dir"): "MergeTool.input_dir",
         ("o", "output"): "HDF5Merger.output_path",
         ("p", "pattern"): "MergeTool.file_pattern",
+        ("j", "n-workers"): "MergeTool.n_workers",
     }
 
     flags = {
@@ -156,10 +179,31 @@ class MergeTool(Tool):
             )
 
     def start(self):
+        # check all files before merging, so that incompatible files fail early
+        errors = self.merger.check_files(self.input_files, n_workers=self.n_workers)
+        for error in errors.values():
+            if not self.skip_broken_files:
+                raise error
+            self.log.warning("Skipping broken file: %s", error)
+
+        input_files = [f for f in self.input_files if Path(f) not in errors]
+
+        if self.n_workers > 1 and len(input_files) > 1:
+            n_merged = self._merge_parallel(input_files)
+        else:
+            n_merged = self._merge_serial(input_files)
+
+        self.log.info(
+            "%d out of %d files have been merged!",
+            n_merged,
+            len(self.input_files),
+        )
+
+    def _merge_serial(self, input_files):
         n_merged = 0
 
         for input_path in tqdm(
-            self.input_files,
+            input_files,
             desc="Merging",
             unit="Files",
             disable=not self.progress_bar,
@@ -172,12 +216,57 @@ class MergeTool(Tool):
                     raise
                 self.log.warning("Skipping broken file: %s", error)
 
+        return n_merged
+
+    def _merge_parallel(self, input_files):
+        """
+        Merge groups of consecutive files into temporary files in worker processes,
+        then merge these into the output in order.
+        """
+        n_groups = min(self.n_workers, len(input_files))
+        # contiguous groups of nearly equal size, to keep the order of the files
+        bounds = [len(input_files) * i // n_groups for i in range(n_groups + 1)]
+        groups = [input_files[start:stop] for start, stop in zip(bounds, bounds[1:])]
         self.log.info(
-            "%d out of %d files have been merged!",
-            n_merged,
-            len(self.input_files),
+            "Merging %d files in %d groups using %d worker processes",
+            len(input_files),
+            n_groups,
+            self.n_workers,
         )
 
+        options = {
+            name: getattr(self.merger, name)
+            for name in self.merger.class_trait_names(config=True)
+            if name not in {"output_path", "overwrite", "append"}
+        }
+
+        output_dir = self.merger.output_path.parent
+        with tempfile.TemporaryDirectory(
+            prefix=".ctapipe-merge-", dir=output_dir
+        ) as tmpdir, ProcessPoolExecutor(
+            max_workers=self.n_workers,
+            # spawn avoids inheriting the open output file
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            paths = [Path(tmpdir) / f"group_{i:04d}.h5" for i in range(n_groups)]
+            futures = [
+                pool.submit(_merge_files, path, group, options)
+                for path, group in zip(paths, groups)
+            ]
+
+            for path, group, future in tqdm(
+                zip(paths, groups, futures),
+                desc="Merging",
+                unit="Groups",
+                total=n_groups,
+                disable=not self.progress_bar,
+            ):
+                future.result()
+                self.merger._append_file(path, input_files=group)
+                path.unlink()
+
+        return len(input_files)
+
     def finish(self):
         # overide activity meta with merge current activity
         current_activity = Provenance().current_activity.provenance
@@ -2,13 +2,16 @@
 Generate DL1 (a or b) output files in HDF5 format from {R0,R1,DL0} inputs.
 """
 # pylint: disable=W0201
+import multiprocessing
 import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
 from tqdm.auto import tqdm
 
 from ..calib import CameraCalibrator, GainSelector
 from ..core import QualityQuery, Tool
-from ..core.traits import Bool, classes_with_traits, flag
+from ..core.traits import Bool, Integer, classes_with_traits, flag
 from ..image import ImageCleaner, ImageModifier, ImageProcessor
 from ..image.extractor import ImageExtractor
 from ..image.muon import MuonProcessor
@@ -34,6 +37,43 @@ COMPATIBLE_DATALEVELS = [
 
 __all__ = ["ProcessorTool"]
 
+# number of events submitted to the worker pool per worker process
+# before the main process waits for the oldest result
+EVENTS_IN_FLIGHT_PER_WORKER = 4
+
+# tool instance holding the processing components of a worker process
+_worker_tool = None
+
+
+def _init_worker(config, subarray, reconstructor_types, stages):
+    """Setup the event processing components in a worker process"""
+    global _worker_tool
+
+    # the tool instance is only used as parent to resolve the configuration
+    # exactly as in the main process, the worker never opens the input or output
+    _worker_tool = ProcessorTool(config=config)
+    _worker_tool._setup_processors(subarray, reconstructor_types=reconstructor_types)
+    _worker_tool._stages = stages
+
+
+def _process_event_in_worker(event):
+    """
+    Process a single event in a worker process.
+
+    Returns the processed event together with the counts accumulated by
+    the quality queries for this event, so that the statistics can be
+    summed up in the main process.
+    """
+    _worker_tool._process_event(event)
+
+    counts = []
+    for query in _worker_tool._quality_queries():
+        counts.append((query._counts.copy(), query._cumulative_counts.copy()))
+        query._counts[:] = 0
+        query._cumulative_counts[:] = 0
+
+    return event, counts
+
 
 class ProcessorTool(Tool):
     """
@@ -76,6 +116,17 @@ class ProcessorTool(Tool):
         default_value=False,
     ).tag(config=True)
 
+    n_workers = Integer(
+        default_value=1,
+        min=1,
+        help=(
+            "Number of worker processes used to calibrate and process events."
+            " If larger than 1, events are read and written in the main process"
+            " and processed in a pool of worker processes."
+            " The output is identical to processing events serially."
+        ),
+    ).tag(config=True)
+
     aliases = {
         ("i", "input"): "EventSource.input_url",
         ("o", "output"): "DataWriter.output_path",
@@ -85,6 +136,7 @@ class ProcessorTool(Tool):
         "particle-classifier": "ShowerProcessor.ParticleClassifier.load_path",
         "disp-reconstructor": "ShowerProcessor.DispReconstructor.load_path",
         "image-cleaner-type": "ImageProcessor.image_cleaner_type",
+        ("j", "n-workers"): "ProcessorTool.n_workers",
     }
 
     flags = {
@@ -184,13 +236,10 @@ class ProcessorTool(Tool):
 
         subarray = self.event_source.subarray
         self.software_trigger = SoftwareTrigger(parent=self, subarray=subarray)
-        self.calibrate = CameraCalibrator(parent=self, subarray=subarray)
-        self.process_images = ImageProcessor(subarray=subarray, parent=self)
-        self.process_shower = ShowerProcessor(subarray=subarray, parent=self)
+        self._setup_processors(subarray)
         self.write = self.enter_context(
             DataWriter(event_source=self.event_source, parent=self)
         )
-        self.process_muons = MuonProcessor(subarray=subarray, parent=self)
 
         # add ml reco classes if model paths were supplied via cli and not already configured
         reco_aliases = {
@@ -227,6 +276,26 @@ class ProcessorTool(Tool):
                 "shower distributions read from the input Simulation file are invalid)."
             )
 
+    def _setup_processors(self, subarray, reconstructor_types=None):
+        """Setup the components applied to each event, also used by the workers"""
+        shower_kwargs = {}
+        if reconstructor_types is not None:
+            shower_kwargs["reconstructor_types"] = reconstructor_types
+
+        self.calibrate = CameraCalibrator(parent=self, subarray=subarray)
+        self.process_images = ImageProcessor(subarray=subarray, parent=self)
+        self.process_shower = ShowerProcessor(
+            subarray=subarray, parent=self, **shower_kwargs
+        )
+        self.process_muons = MuonProcessor(subarray=subarray, parent=self)
+
+    def _quality_queries(self):
+        """All quality queries of the processing components, in a fixed order"""
+        queries = [self.process_images.check_image]
+        queries.extend(r.quality_query for r in self.process_shower.reconstructors)
+        queries.extend([self.process_muons.dl1_query, self.process_muons.ring_query])
+        return queries
+
     @property
     def should_compute_dl2(self):
         """returns true if we should compute DL2 info"""
@@ -312,14 +381,31 @@ class ProcessorTool(Tool):
         )
         self.event_source.subarray.info(printer=self.log.info)
 
-        for event in tqdm(
-            self.event_source,
+        self._stages = {
+            "calibrate": self.should_calibrate,
+            "compute_dl1": self.should_compute_dl1,
+            "compute_muon_parameters": self.should_compute_muon_parameters,
+            "compute_dl2": self.should_compute_dl2,
+        }
+
+        events = tqdm(
+            self._selected_events(),
             desc=self.event_source.__class__.__name__,
             total=self.event_source.max_events,
             unit="ev",
             disable=not self.progress_bar,
-        ):
+        )
 
+        if self.n_workers > 1:
+            self._process_events_parallel(events)
+        else:
+            for event in events:
+                self._process_event(event)
+                self.write(event)
+
+    def _selected_events(self):
+        """Iterate over the events of the input passing the event selection"""
+        for event in self.event_source:
             self.log.debug("Processessing event_id=%s", event.index.event_id)
 
             if not self.event_type_filter(event):
@@ -331,19 +417,65 @@ class ProcessorTool(Tool):
                 )
                 continue
 
-            if self.should_calibrate:
-                self.calibrate(event)
+            yield event
+
+    def _process_event(self, event):
+        """Apply all needed processing steps to a single event"""
+        if self._stages["calibrate"]:
+            self.calibrate(event)
+
+        if self._stages["compute_dl1"]:
+            self.process_images(event)
 
-            if self.should_compute_dl1:
-                self.process_images(event)
+        if self._stages["compute_muon_parameters"]:
+            self.process_muons(event)
 
-            if self.should_compute_muon_parameters:
-                self.process_muons(event)
+        if self._stages["compute_dl2"]:
+            self.process_shower(event)
+
+    def _process_events_parallel(self, events):
+        """
+        Process events in a pool of worker processes.
 
-            if self.should_compute_dl2:
-                self.process_shower(event)
+        Events are submitted to the pool as they are read and the results
+        are written strictly in input order, keeping at most
+        ``EVENTS_IN_FLIGHT_PER_WORKER * n_workers`` events in memory.
+        """
+        self.log.info("Processing events using %d worker processes", self.n_workers)
+
+        initargs = (
+            self.config,
+            self.event_source.subarray,
+            list(self.process_shower.reconstructor_types),
+            self._stages,
+        )
+        max_in_flight = EVENTS_IN_FLIGHT_PER_WORKER * self.n_workers
+
+        with ProcessPoolExecutor(
+            max_workers=self.n_workers,
+            # spawn avoids inheriting open hdf5 files from the main process
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=initargs,
+        ) as pool:
+            pending = deque()
+            for event in events:
+                pending.append(pool.submit(_process_event_in_worker, event))
+                if len(pending) >= max_in_flight:
+                    self._write_worker_result(*pending.popleft().result())
+
+            while pending:
+                self._write_worker_result(*pending.popleft().result())
+
+    def _write_worker_result(self, event, counts):
+        """Write an event processed by a worker and add up its statistics"""
+        for query, (query_counts, cumulative_counts) in zip(
+            self._quality_queries(), counts
+        ):
+            query._counts += query_counts
+            query._cumulative_counts += cumulative_counts
 
-            self.write(event)
+        self.write(event)
 
     def finish(self):
         """
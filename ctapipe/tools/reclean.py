@@ -0,0 +1,276 @@
+"""
+Tool to clean and parameterize stored DL1 images in bulk (as opposed to event by event).
+"""
+import shutil
+from collections import defaultdict
+from threading import Lock
+
+import numpy as np
+import tables
+from astropy.table import Column, Table
+from tqdm.auto import tqdm
+
+from ctapipe.core.tool import Tool, ToolConfigurationError
+from ctapipe.core.traits import Integer, Path, classes_with_traits
+from ctapipe.image import ImageCleaner, ImageProcessor
+from ctapipe.io import TableLoader, write_table
+from ctapipe.io.astropy_helpers import read_table
+from ctapipe.io.tableloader import (
+    IMAGES_GROUP,
+    PARAMETERS_GROUP,
+    TELESCOPE_EVENT_KEYS,
+    TRUE_PARAMETERS_GROUP,
+)
+
+from .apply_models import _ChunkPipeline
+
+__all__ = [
+    "RecleanTool",
+]
+
+
+def _flat_defaults(container):
+    """Default values of the parameter columns of ``container``"""
+    return container.as_dict(recursive=True, flatten=True, add_prefix=True)
+
+
+def _parameters_table(events, parameters, defaults, template=None):
+    """
+    Build the table to write from the index columns of ``events``
+    and the computed ``parameters``.
+
+    Columns in ``defaults`` that are not computed, e.g. ``core_psi``, which is
+    filled by the `~ctapipe.reco.ShowerProcessor`, get their default value.
+    If ``template``, the previous table, has the same columns, its column order,
+    dtypes, units and descriptions are used.
+    """
+    table = Table()
+    for colname in TELESCOPE_EVENT_KEYS:
+        table[colname] = events[colname]
+    for colname in parameters.colnames:
+        table[colname] = parameters[colname]
+    for colname, value in defaults.items():
+        if colname not in table.colnames:
+            table[colname] = Column(
+                np.full(len(table), getattr(value, "value", value)),
+                unit=getattr(value, "unit", None),
+            )
+
+    if template is None or set(template.colnames) != set(table.colnames):
+        return table
+
+    formatted = Table()
+    for colname in template.colnames:
+        column, target = table[colname], template[colname]
+        values = column.quantity if column.unit is not None else column
+        if target.unit is not None:
+            values = values.to_value(target.unit)
+        formatted[colname] = np.asanyarray(values, dtype=target.dtype)
+        formatted[colname].unit = target.unit
+        formatted[colname].description = target.description
+    return formatted
+
+
+class RecleanTool(Tool):
+    """
+    Clean and parameterize the DL1 images of a file again,
+    e.g. to test different cleaning settings.
+
+    This processes all images of a telescope in chunks, without the event loop
+    of ``ctapipe-process``. The input file is copied to the output file,
+    in which the image masks and the DL1 image parameters are replaced.
+    If the file contains true images, the true image parameters are recomputed.
+
+    DL2 results in the file are not updated, they still correspond to the
+    previous image parameters.
+    """
+
+    name = "ctapipe-reclean"
+    description = __doc__
+    examples = """
+    ctapipe-reclean \\
+        --input events.dl1.h5 \\
+        --output events_recleaned.dl1.h5 \\
+        --TailcutsImageCleaner.picture_threshold_pe=12 \\
+        --TailcutsImageCleaner.boundary_threshold_pe=6
+    """
+
+    input_url = Path(
+        default_value=None,
+        allow_none=False,
+        directory_ok=False,
+        exists=True,
+        help="Input DL1 file, including the images",
+    ).tag(config=True)
+
+    output_path = Path(
+        default_value=None,
+        allow_none=False,
+        directory_ok=False,
+        help="Output file",
+    ).tag(config=True)
+
+    chunk_size = Integer(
+        default_value=10000,
+        min=1,
+        help="How many subarray events to load and process at once.",
+    ).tag(config=True)
+
+    n_chunks_in_flight = Integer(
+        default_value=0,
+        min=0,
+        help=(
+            "If larger than 0, read the next chunks in a background thread"
+            " and write the results in another one, while the current"
+            " chunk is being processed. At most this many chunks are read ahead"
+            " and queued for writing, which bounds the memory usage."
+            " If 0, chunks are read, processed and written one after the other."
+        ),
+    ).tag(config=True)
+
+    aliases = {
+        ("i", "input"): "RecleanTool.input_url",
+        ("o", "output"): "RecleanTool.output_path",
+        "chunk-size": "RecleanTool.chunk_size",
+    }
+
+    classes = [TableLoader, ImageProcessor] + classes_with_traits(ImageCleaner)
+
+    def setup(self):
+        """
+        Copy the input file and initialize components from config
+        """
+        self.check_output(self.output_path)
+        self.log.info("Copying to output destination.")
+        shutil.copy(self.input_url, self.output_path)
+
+        self.h5file = self.enter_context(tables.open_file(self.output_path, mode="r+"))
+        if IMAGES_GROUP not in self.h5file:
+            raise ToolConfigurationError(f"{self.input_url} does not contain images")
+
+        if "/dl2" in self.h5file:
+            self.log.warning(
+                "DL2 results in %s are not updated for the new image parameters",
+                self.output_path,
+            )
+
+        self._hdf5_lock = Lock()
+        self.loader = TableLoader(
+            parent=self,
+            h5file=self.h5file,
+            load_dl1_images=True,
+            load_dl1_parameters=False,
+            load_dl2=False,
+            load_true_images=True,
+            load_true_parameters=False,
+            load_simulated=False,
+            load_instrument=False,
+            load_observation_info=False,
+        )
+        self.process_images = ImageProcessor(subarray=self.loader.subarray, parent=self)
+
+        self._defaults = {
+            PARAMETERS_GROUP: _flat_defaults(
+                self.process_images.default_image_container
+            ),
+            # only the parameters computed for true images are written
+            TRUE_PARAMETERS_GROUP: {},
+        }
+        # previous tables, to keep their column layout
+        self._templates = {}
+        for group in (PARAMETERS_GROUP, TRUE_PARAMETERS_GROUP):
+            for tel_id in self.loader.subarray.tel:
+                path = f"{group}/tel_{tel_id:03d}"
+                if path in self.h5file:
+                    self._templates[path] = read_table(self.h5file, path, stop=0)
+
+        # number of images processed per telescope, i.e. the first row
+        # of the current chunk in the image tables
+        self._n_images = defaultdict(int)
+        self._written = set()
+
+    def start(self):
+        """Clean and parameterize the images chunk by chunk"""
+        chunk_iterator = self.loader.read_telescope_events_by_id_chunked(
+            self.chunk_size
+        )
+        pipeline = _ChunkPipeline(
+            chunk_iterator, self.n_chunks_in_flight, self._hdf5_lock
+        )
+
+        with pipeline:
+            for _, _, chunk in tqdm(pipeline, desc="Cleaning images", unit="chunk"):
+                pipeline.write(self._write, *self._process_chunk(chunk))
+
+    def _process_chunk(self, chunk):
+        """
+        Process a chunk, returns the list of (table, path) to write
+        and the list of (path, start, masks) to update
+        """
+        outputs = []
+        masks = []
+
+        for tel_id, events in chunk.items():
+            name = f"tel_{tel_id:03d}"
+            start = self._n_images[tel_id]
+            self._n_images[tel_id] += len(events)
+
+            if "image" not in events.colnames:
+                self.log.warning("No images for telescope %d", tel_id)
+                continue
+
+            peak_times = None
+            if "peak_time" in events.colnames:
+                peak_times = np.asanyarray(events["peak_time"])
+
+            image_masks, parameters = self.process_images.process_chunk(
+                tel_id, np.asanyarray(events["image"]), peak_times
+            )
+            masks.append((f"{IMAGES_GROUP}/{name}", start, image_masks))
+            outputs.append(self._table(events, parameters, PARAMETERS_GROUP, name))
+
+            if "true_image" in events.colnames:
+                true_parameters = self.process_images.process_true_chunk(
+                    tel_id, np.asanyarray(events["true_image"])
+                )
+                outputs.append(
+                    self._table(events, true_parameters, TRUE_PARAMETERS_GROUP, name)
+                )
+
+        return outputs, masks
+
+    def _table(self, events, parameters, group, name):
+        path = f"{group}/{name}"
+        table = _parameters_table(
+            events, parameters, self._defaults[group], self._templates.get(path)
+        )
+        return table, path
+
+    def _write(self, outputs, masks):
+        for table, path in outputs:
+            # the first chunk replaces the table of the input file
+            append = path in self._written
+            write_table(table, self.h5file, path, append=append, overwrite=not append)
+            self._written.add(path)
+
+        for path, start, image_masks in masks:
+            node = self.h5file.get_node(path)
+            if "image_mask" in node.colnames:
+                node.modify_column(
+                    start=start,
+                    stop=start + len(image_masks),
+                    column=image_masks,
+                    colname="image_mask",
+                )
+
+    def finish(self):
+        """Close output file"""
+        self.h5file.close()
+
+
+def main():
+    RecleanTool().run()
+
+
+if __name__ == "__main__":
+    main()
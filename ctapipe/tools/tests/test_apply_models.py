@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 from ctapipe.containers import (
     EventIndexContainer,
@@ -158,3 +159,66 @@ def test_apply_all(
     check_equal_array_event_order(trigger, particle_clf)
     disp_reco = read_table(output_path, f"/dl2/event/subarray/geometry/{prefix_disp}")
     check_equal_array_event_order(trigger, disp_reco)
+
+
+def test_apply_pipelined(
+    energy_regressor_path, dl2_shower_geometry_file_lapalma, tmp_path
+):
+    """Test that reading and writing in background threads gives the same result"""
+    from ctapipe.tools.apply_models import ApplyModels
+
+    prefix = "ExtraTreesRegressor"
+    paths = {}
+    for n_chunks_in_flight in (0, 2):
+        output_path = tmp_path / f"energy_{n_chunks_in_flight}.dl2.h5"
+        run_tool(
+            ApplyModels(),
+            argv=[
+                f"--input={dl2_shower_geometry_file_lapalma}",
+                f"--output={output_path}",
+                f"--energy-regressor={energy_regressor_path}",
+                f"--ApplyModels.n_chunks_in_flight={n_chunks_in_flight}",
+                "--chunk-size=5",
+            ],
+            raises=True,
+        )
+        paths[n_chunks_in_flight] = output_path
+
+    for path in (
+        f"/dl2/event/subarray/energy/{prefix}",
+        f"/dl2/event/telescope/energy/{prefix}/tel_004",
+    ):
+        expected = read_table(paths[0], path)
+        table = read_table(paths[2], path)
+        assert table.colnames == expected.colnames
+        for col in table.colnames:
+            np.testing.assert_array_equal(table[col], expected[col])
+
+
+@pytest.mark.parametrize("n_chunks", [0, 1, 3])
+def test_chunk_pipeline(n_chunks):
+    """Test order and bounded read-ahead of the chunk pipeline"""
+    from threading import Lock
+
+    from ctapipe.io.tableloader import ChunkIterator
+    from ctapipe.tools.apply_models import _ChunkPipeline
+
+    n_read = 0
+
+    def read(start, stop):
+        nonlocal n_read
+        n_read += 1
+        return list(range(start, stop))
+
+    chunk_iterator = ChunkIterator(read, 25, 4, args=(), kwargs={})
+    written = []
+
+    with _ChunkPipeline(chunk_iterator, n_chunks, Lock()) as pipeline:
+        assert len(pipeline) == 7
+        for i, (start, stop, chunk) in enumerate(pipeline):
+            assert chunk == list(range(start, stop))
+            # at most n_chunks are read ahead of the current one
+            assert n_read <= i + 1 + n_chunks
+            pipeline.write(written.extend, chunk)
+
+    assert written == list(range(25))
@@ -168,6 +168,36 @@ def test_dl2(tmp_path, dl2_shower_geometry_file, dl2_proton_geometry_file):
     assert "HillasReconstructor_tel_impact_distance" in tel_events.colnames
 
 
+def test_parallel(tmp_path, dl2_shower_geometry_file, dl2_proton_geometry_file):
+    from ctapipe.tools.merge import MergeTool
+
+    inputs = [
+        str(dl2_shower_geometry_file),
+        str(dl2_proton_geometry_file),
+        str(dl2_shower_geometry_file),
+    ]
+
+    serial = tmp_path / "serial.dl2.h5"
+    run_tool(MergeTool(), argv=[f"--output={serial}", *inputs], raises=True)
+
+    parallel = tmp_path / "parallel.dl2.h5"
+    run_tool(
+        MergeTool(), argv=[f"--output={parallel}", "-j", "2", *inputs], raises=True
+    )
+
+    # temporary files must have been removed
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "parallel.dl2.h5",
+        "serial.dl2.h5",
+    ]
+
+    with tables.open_file(serial) as f:
+        table_paths = [t._v_pathname for t in f.walk_nodes("/", "Table")]
+
+    for path in table_paths:
+        assert_table_equal(read_table(parallel, path), read_table(serial, path))
+
+
 def test_muon(tmp_path, dl1_muon_output_file):
     from ctapipe.tools.merge import MergeTool
 
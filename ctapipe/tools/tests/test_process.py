@@ -469,6 +469,43 @@ def test_muon_reconstruction_simtel(tmp_path):
             )
 
 
+def test_parallel_processing(tmp_path, dl1_image_file):
+    """check that processing in worker processes gives the same output as serial"""
+    config = resource_file("stage2_config.json")
+
+    outputs = {}
+    for n_workers in (1, 2):
+        output = tmp_path / f"parallel_{n_workers}.dl2.h5"
+        run_tool(
+            ProcessorTool(),
+            argv=[
+                f"--config={config}",
+                f"--input={dl1_image_file}",
+                f"--output={output}",
+                f"--n-workers={n_workers}",
+                "--recompute-dl1",
+                "--write-parameters",
+                "--overwrite",
+            ],
+            cwd=tmp_path,
+            raises=True,
+        )
+        outputs[n_workers] = output
+
+    paths = [
+        "/dl1/event/telescope/parameters/tel_025",
+        "/dl2/event/subarray/geometry/HillasReconstructor",
+        "/dl1/service/image_statistics",
+        "/dl2/service/tel_event_statistics/HillasReconstructor",
+    ]
+    for path in paths:
+        serial = read_table(outputs[1], path)
+        parallel = read_table(outputs[2], path)
+        assert serial.colnames == parallel.colnames
+        for col in serial.colnames:
+            assert_array_equal(serial[col], parallel[col])
+
+
 def test_plugin_help(capsys):
     ProcessorTool().print_help(classes=True)
     captured = capsys.readouterr()
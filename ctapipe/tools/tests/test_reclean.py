@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+import tables
+
+from ctapipe.core import run_tool
+from ctapipe.core.tool import ToolConfigurationError
+from ctapipe.image import TailcutsImageCleaner
+from ctapipe.io import TableLoader, read_table
+
+
+def test_reclean_same_config(dl1_file, tmp_path):
+    """Processing again with the same config must reproduce the parameters"""
+    from ctapipe.tools.reclean import RecleanTool
+
+    output_path = tmp_path / "recleaned.dl1.h5"
+    ret = run_tool(
+        RecleanTool(),
+        argv=[
+            f"--input={dl1_file}",
+            f"--output={output_path}",
+            "--chunk-size=5",  # small chunksize so we test multiple chunks
+        ],
+        raises=True,
+    )
+    assert ret == 0
+
+    with tables.open_file(dl1_file) as f:
+        paths = [
+            node._v_pathname
+            for group in (
+                "/dl1/event/telescope/parameters",
+                "/simulation/event/telescope/parameters",
+            )
+            for node in f.get_node(group)
+        ]
+
+    for path in paths:
+        expected = read_table(dl1_file, path)
+        table = read_table(output_path, path)
+
+        assert table.colnames == expected.colnames
+        for colname in table.colnames:
+            assert table[colname].dtype == expected[colname].dtype, colname
+            assert table[colname].unit == expected[colname].unit, colname
+            # the robust timing fit starts from random samples, which are
+            # drawn in a different order than in the event loop
+            if not colname.startswith("timing_"):
+                np.testing.assert_allclose(
+                    table[colname],
+                    expected[colname],
+                    rtol=1e-4,
+                    atol=1e-6,
+                    err_msg=f"{path}: {colname}",
+                )
+
+
+@pytest.mark.parametrize("n_chunks_in_flight", [0, 2])
+def test_reclean_thresholds(dl1_file, tmp_path, n_chunks_in_flight):
+    """Image masks and parameters must follow the new cleaning settings"""
+    from ctapipe.tools.reclean import RecleanTool
+
+    output_path = tmp_path / "recleaned.dl1.h5"
+    ret = run_tool(
+        RecleanTool(),
+        argv=[
+            f"--input={dl1_file}",
+            f"--output={output_path}",
+            "--chunk-size=5",
+            f"--RecleanTool.n_chunks_in_flight={n_chunks_in_flight}",
+            "--TailcutsImageCleaner.picture_threshold_pe=20",
+            "--TailcutsImageCleaner.boundary_threshold_pe=10",
+        ],
+        raises=True,
+    )
+    assert ret == 0
+
+    with TableLoader(output_path, load_dl1_images=True) as loader:
+        events = loader.read_telescope_events_by_id()
+        clean = TailcutsImageCleaner(
+            subarray=loader.subarray,
+            picture_threshold_pe=20,
+            boundary_threshold_pe=10,
+        )
+
+    with TableLoader(dl1_file) as loader:
+        previous = loader.read_telescope_events()
+
+    n_pixels = 0
+    for tel_id, table in events.items():
+        masks = clean.clean_batch(tel_id, table["image"])
+        np.testing.assert_array_equal(table["image_mask"], masks)
+        np.testing.assert_array_equal(
+            table["morphology_n_pixels"], np.count_nonzero(masks, axis=1)
+        )
+        n_pixels += np.count_nonzero(masks)
+
+    assert n_pixels < np.sum(previous["morphology_n_pixels"])
+
+
+def test_reclean_no_images(dl1_parameters_file, tmp_path):
+    from ctapipe.tools.reclean import RecleanTool
+
+    with pytest.raises(ToolConfigurationError, match="does not contain images"):
+        run_tool(
+            RecleanTool(),
+            argv=[
+                f"--input={dl1_parameters_file}",
+                f"--output={tmp_path / 'recleaned.dl1.h5'}",
+            ],
+            raises=True,
+        )